@@ -0,0 +1,7 @@
+"""Entry point of the benchmark suite: python -m benchmarks."""
+
+import sys
+
+from benchmarks.suite import main
+
+sys.exit(main())
@@ -0,0 +1,82 @@
+"""Benchmark of the cold start of the API: import time and time to the first /generate response.
+
+Every run starts a fresh interpreter, so module imports and Faker construction are measured as a new
+worker would experience them.
+
+Usage::
+
+    python -m benchmarks.cold_start --runs 10
+"""
+
+import json
+import subprocess
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+
+# Measures a single cold start in a fresh interpreter and prints the timings as JSON
+_COLD_START_SCRIPT = """
+import asyncio, json, sys
+from time import perf_counter
+
+started = perf_counter()
+from src.singleton import FakerSingleton
+
+if sys.argv[1] == "all":
+    FakerSingleton.configure(None)
+import main
+imported = perf_counter()
+
+import httpx
+
+async def first_response():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        request_started = perf_counter()
+        response = await client.get("/generate")
+        response.raise_for_status()
+        return perf_counter() - request_started
+
+first_request = asyncio.run(first_response())
+print(json.dumps({"import": imported - started, "first_request": first_request, "total": perf_counter() - started}))
+"""
+
+
+def measure_cold_start(providers: str) -> dict[str, float]:
+    """Measure one cold start in a fresh interpreter.
+
+    :param providers: 'minimal' for the providers the generators use, 'all' for all default providers.
+    :return: A dictionary with the import, first request and total durations in seconds.
+    """
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _COLD_START_SCRIPT, providers],
+        cwd=Path(__file__).resolve().parent.parent,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> dict[str, dict[str, float]]:
+    """Print the median cold start timings with minimal and with all Faker providers.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    :return: A dictionary mapping the provider set to median durations in seconds.
+    """
+    parser = ArgumentParser(description="Measure the cold start of the API.")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreters per provider set")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for providers in ("minimal", "all"):
+        runs = [measure_cold_start(providers) for _ in range(args.runs)]
+        results[providers] = {phase: median(run[phase] for run in runs) for phase in runs[0]}
+        timings = ", ".join(f"{phase} {seconds * 1000:7.1f} ms" for phase, seconds in results[providers].items())
+        print(f"{providers:8} providers: {timings}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
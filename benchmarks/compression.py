@@ -0,0 +1,93 @@
+"""Benchmark of compressed bulk pulls: bytes on the wire and end-to-end time per content encoding.
+
+A pull streams records from /generate/stream through the ASGI app and decompresses them on the
+client side, so the time covers generation, serialization, compression and decompression. Transfer
+over a real link overlaps with streaming, so the time of a pull over a link of the given bandwidth
+is estimated as the larger of the measured time and the time to transfer the bytes on the wire.
+
+Usage::
+
+    python -m benchmarks.compression --count 1000000 --bandwidth 100
+"""
+
+import asyncio
+import zlib
+from argparse import ArgumentParser
+from time import perf_counter
+
+import httpx
+
+from main import app
+from src.compression import available_encodings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _decompressor(encoding: str):
+    """Create an incremental decompressor of a content encoding.
+
+    :param encoding: 'identity', 'gzip' or 'zstd'.
+    :return: An object with a decompress(bytes) -> bytes method, or None for 'identity'.
+    """
+    if encoding == "gzip":
+        return zlib.decompressobj(zlib.MAX_WBITS | 16)
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj()
+    return None
+
+
+async def pull(count: int, encoding: str) -> dict[str, float]:
+    """Pull records from /generate/stream with a content encoding.
+
+    :param count: The number of records.
+    :param encoding: 'identity', 'gzip' or 'zstd'.
+    :return: A dictionary with the wire and decompressed bytes, and the elapsed seconds.
+    """
+    decompressor = _decompressor(encoding)
+    wire_bytes = body_bytes = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        started = perf_counter()
+        params = {"count": count, "pooled": True}
+        headers = {"Accept-Encoding": encoding}
+        async with client.stream("GET", "/generate/stream", params=params, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_raw():
+                wire_bytes += len(chunk)
+                body_bytes += len(decompressor.decompress(chunk) if decompressor is not None else chunk)
+        elapsed = perf_counter() - started
+    return {"wire_bytes": wire_bytes, "body_bytes": body_bytes, "seconds": elapsed}
+
+
+def main(argv: list[str] | None = None) -> dict[str, dict[str, float]]:
+    """Print the bytes on the wire and the end-to-end time of a pull per content encoding.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    :return: A dictionary mapping the encoding to its measurements.
+    """
+    parser = ArgumentParser(description="Measure compressed bulk pulls from /generate/stream.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="number of records of a pull")
+    parser.add_argument("--bandwidth", type=float, default=100.0, help="link bandwidth in Mbit/s for the estimate")
+    args = parser.parse_args(argv)
+
+    # Build the value pools and Faker instances before measuring
+    asyncio.run(pull(1000, "identity"))
+    results = {}
+    for encoding in ("identity", *reversed(available_encodings())):
+        result = asyncio.run(pull(args.count, encoding))
+        transfer = result["wire_bytes"] * 8 / (args.bandwidth * 1e6)
+        result["link_seconds"] = max(result["seconds"], transfer)
+        results[encoding] = result
+        print(
+            f"{encoding:8}: {result['wire_bytes'] / 1e6:8.1f} MB on the wire "
+            f"({result['wire_bytes'] / result['body_bytes']:6.1%}), {result['seconds']:6.2f} s end to end, "
+            f"~{result['link_seconds']:6.2f} s over {args.bandwidth:g} Mbit/s"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of the memory taken per record by the representations of fake car insurance data.
+
+Usage::
+
+    python -m benchmarks.memory --count 100000
+"""
+
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+
+from src.fake_data import generate_insurance_batch
+from src.pools import get_pool
+from src.record import InsuranceBatch
+
+
+def measure_bytes_per_record(build: Callable[[], object], count: int) -> float:
+    """Measure the memory retained by an object per record.
+
+    :param build: A function building the object holding count records.
+    :param count: The number of records the object holds.
+    :return: The number of bytes per record.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main(argv: list[str] | None = None) -> dict[str, float]:
+    """Print the bytes per record of nested dictionaries, record tuples and columnar batches.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    :return: A dictionary mapping the representation to bytes per record.
+    """
+    parser = ArgumentParser(description="Measure the memory taken per record.")
+    parser.add_argument("--count", type=int, default=100_000, help="number of records to measure")
+    args = parser.parse_args(argv)
+
+    # Build the value pools up front, so they are not attributed to the first measurement
+    for field in ("first_name", "last_name", "address"):
+        get_pool(field)
+
+    def copy_batch() -> InsuranceBatch:
+        return InsuranceBatch(*(column.copy() for column in batch.columns()))
+
+    # The field strings are shared by all representations, so they are measured once and added to each
+    batch = generate_insurance_batch(args.count, seed=0, pooled=True)
+    columnar = measure_bytes_per_record(lambda: generate_insurance_batch(args.count, seed=0, pooled=True), args.count)
+    columns = measure_bytes_per_record(copy_batch, args.count)
+    strings = columnar - columns
+    results = {
+        "nested dicts": strings + measure_bytes_per_record(batch.to_dicts, args.count),
+        "InsuranceRecord tuples": strings + measure_bytes_per_record(lambda: list(batch), args.count),
+        "InsuranceBatch columns": columnar,
+    }
+    print(f"{'field strings':25} {strings:8.1f} bytes/record")
+    for name, bytes_per_record in results.items():
+        print(f"{name:25} {bytes_per_record:8.1f} bytes/record (incl. strings)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Benchmark suite for the per-field generators, batch generation and the /generate endpoint.
+
+Results are written as JSON and compared against a stored baseline; the run fails (exit code 1) when
+any metric regressed by more than the threshold.
+
+Usage::
+
+    python -m benchmarks                      # run, write results, compare against the baseline
+    python -m benchmarks --update-baseline    # run and store the results as the new baseline
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import platform
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+
+import httpx
+
+from main import app
+from src import car, insurance, owner, policy_number
+from src.fake_data import generate_fake_data, generate_fake_data_batch
+
+# Modules whose generate_* functions are benchmarked one by one
+FIELD_MODULES = (car, owner, policy_number, insurance)
+
+# Number of values generated per call of a *_batch field function
+FIELD_BATCH_SIZE = 1_000
+
+# Batch sizes generate_fake_data_batch() is benchmarked at
+BATCH_SIZES = (1, 100, 10_000)
+
+# Locales of the mixed-locale batch benchmark
+MIXED_LOCALES = ("de_DE", "fr_FR", "pl_PL")
+
+# Requests whose latency is measured through the ASGI app
+ENDPOINT_REQUESTS = {
+    "/generate": {},
+    "/generate?count=100": {"count": 100},
+}
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def measure_ops_per_second(function: Callable[[], object], ops_per_call: int = 1, min_time: float = 0.2) -> float:
+    """Measure how many operations per second a function performs.
+
+    The function is called in growing loops until a loop takes at least min_time, and the best of
+    three such loops is reported to reduce noise.
+
+    :param function: The function to call.
+    :param ops_per_call: The number of operations (e.g. generated values) per call.
+    :param min_time: The minimum duration of a measured loop in seconds.
+    :return: The number of operations per second.
+    """
+    function()
+    loops = 1
+    while True:
+        started = perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(2):
+        started = perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, perf_counter() - started)
+    return loops * ops_per_call / best
+
+
+def benchmark_fields(min_time: float) -> dict[str, dict]:
+    """Benchmark every generate_* function of the field modules.
+
+    :param min_time: The minimum duration of a measured loop in seconds.
+    :return: A dictionary of metrics, e.g. 'car.generate_vin' -> ops/s.
+    """
+    metrics = {}
+    for module in FIELD_MODULES:
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("generate_") or function.__module__ != module.__name__:
+                continue
+            if name.endswith("_batch"):
+                value = measure_ops_per_second(lambda f=function: f(FIELD_BATCH_SIZE), FIELD_BATCH_SIZE, min_time)
+            else:
+                value = measure_ops_per_second(function, min_time=min_time)
+            metrics[f"{module.__name__.removeprefix('src.')}.{name}"] = _metric(value, "ops/s", True)
+    return metrics
+
+
+def benchmark_generation(min_time: float) -> dict[str, dict]:
+    """Benchmark generate_fake_data() and generate_fake_data_batch() at several batch sizes.
+
+    :param min_time: The minimum duration of a measured loop in seconds.
+    :return: A dictionary of metrics in records/s.
+    """
+    metrics = {"fake_data.generate_fake_data": _metric(measure_ops_per_second(generate_fake_data, 1, min_time))}
+    for size in BATCH_SIZES:
+        for pooled in (False, True):
+            value = measure_ops_per_second(
+                lambda s=size, p=pooled: generate_fake_data_batch(s, pooled=p), size, min_time
+            )
+            name = f"fake_data.generate_fake_data_batch[{size}{',pooled' if pooled else ''}]"
+            metrics[name] = _metric(value, "records/s", True)
+    value = measure_ops_per_second(
+        lambda: generate_fake_data_batch(BATCH_SIZES[-1], pooled=True, locale=MIXED_LOCALES), BATCH_SIZES[-1], min_time
+    )
+    metrics[f"fake_data.generate_fake_data_batch[{BATCH_SIZES[-1]},pooled,{'+'.join(MIXED_LOCALES)}]"] = _metric(value)
+    return metrics
+
+
+async def _measure_latencies(path: str, params: dict, requests: int) -> list[float]:
+    """Measure the latencies of sequential requests through the ASGI app.
+
+    :param path: The path of the endpoint.
+    :param params: The query parameters of the request.
+    :param requests: The number of measured requests.
+    :return: A list of latencies in seconds.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for _ in range(5):
+            await client.get(path, params=params)
+        latencies = []
+        for _ in range(requests):
+            started = perf_counter()
+            response = await client.get(path, params=params)
+            latencies.append(perf_counter() - started)
+            response.raise_for_status()
+    return latencies
+
+
+def benchmark_endpoints(requests: int) -> dict[str, dict]:
+    """Benchmark the p50/p95/p99 latency of the /generate endpoint.
+
+    :param requests: The number of measured requests per endpoint.
+    :return: A dictionary of metrics in milliseconds.
+    """
+    metrics = {}
+    for name, params in ENDPOINT_REQUESTS.items():
+        path = name.split("?")[0]
+        latencies = asyncio.run(_measure_latencies(path, params, requests))
+        percentiles = quantiles(latencies, n=100, method="inclusive")
+        for percentile in (50, 95, 99):
+            value = percentiles[percentile - 1] * 1000
+            metrics[f"endpoint {name} p{percentile}"] = _metric(value, "ms", False)
+    return metrics
+
+
+def _metric(value: float, unit: str = "records/s", higher_is_better: bool = True) -> dict:
+    """Build a metric entry of the results.
+
+    :param value: The measured value.
+    :param unit: The unit of the value.
+    :param higher_is_better: Whether a higher value is an improvement.
+    :return: A dictionary describing the metric.
+    """
+    return {"value": round(value, 3), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Compare benchmark results against a baseline.
+
+    Metrics missing from either side are ignored, so adding or removing benchmarks does not fail a run.
+
+    :param baseline: The metrics of the baseline run.
+    :param current: The metrics of the current run.
+    :param threshold: The tolerated relative regression, e.g. 0.2 for 20%.
+    :return: A list of messages describing the regressed metrics.
+    """
+    regressions = []
+    for name, metric in current.items():
+        if name not in baseline:
+            continue
+        expected, actual = baseline[name]["value"], metric["value"]
+        if metric["higher_is_better"]:
+            regressed = actual < expected * (1 - threshold)
+        else:
+            regressed = actual > expected * (1 + threshold)
+        if regressed:
+            regressions.append(f"{name}: {actual:.3f} {metric['unit']} (baseline {expected:.3f} {metric['unit']})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite, write the results and compare them against the baseline.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    :return: The exit code: 0 on success, 1 when a regression exceeds the threshold.
+    """
+    parser = ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"), help="results file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="tolerated relative regression")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of a measured loop in s")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per endpoint")
+    args = parser.parse_args(argv)
+
+    # Keep per-request log lines of the app out of the measurements
+    logging.disable(logging.INFO)
+    metrics = {
+        **benchmark_fields(args.min_time),
+        **benchmark_generation(args.min_time),
+        **benchmark_endpoints(args.requests),
+    }
+    results = {"python": platform.python_version(), "machine": platform.machine(), "metrics": metrics}
+    for name, metric in metrics.items():
+        print(f"{name:60} {metric['value']:14.3f} {metric['unit']}")
+
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Stored baseline in '{args.baseline}'.")
+        return 0
+    if not args.baseline.exists():
+        print(f"There is no baseline in '{args.baseline}'; run with --update-baseline to store one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["metrics"]
+    regressions = compare_results(baseline, metrics, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
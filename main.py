@@ -5,11 +5,145 @@ details about the policy, car, and owner. It is built using FastAPI and is desig
 to be lightweight and easy to use for testing and prototyping purposes.
 """
 
-from fastapi import FastAPI
+import logging
+import os
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+from time import perf_counter
+from typing import Annotated
 
-from src.fake_data import generate_fake_data
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
-app = FastAPI()
+from src.addressing import ADDRESSING_EPOCH, generate_record_at, generate_records_at
+from src.admission import AdmissionController, OverloadedError, admission_from_environment
+from src.buffer import RecordBuffer, buffer_from_environment
+from src.cache import CachedResponse, cache_from_environment, entity_tag, etag_matches
+from src.compression import (
+    DEFAULT_LEVELS,
+    MIN_COMPRESSED_BYTES,
+    Compressor,
+    compress,
+    levels_from_environment,
+    negotiate_encoding,
+)
+from src.dataset import FixedWidthDataset
+from src.fake_data import generate_fake_data, generate_insurance_batch
+from src.locales import Locale
+from src.metrics import (
+    BUFFER_RECORDS_SERVED,
+    FIELD_TIMINGS,
+    RECORDS_GENERATED,
+    RequestMetricsMiddleware,
+    render_metrics,
+)
+from src.schema import default_plan, load_plan
+from src.serialization import FastJSONResponse, encode_batch, encode_ndjson, encode_records, join_records
+from src.stream import DEFAULT_CHUNK_SIZE, iter_fake_data_chunks
+
+# Upper bound for the number of records returned by a single /generate call
+MAX_BATCH_SIZE = 10_000
+
+# Upper bound for the number of records streamed by a single /generate/stream call
+MAX_STREAM_SIZE = 100_000_000
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the producer of the record buffer and open the dataset, if configured, for the lifetime of the app.
+
+    The dataset served by /records is set with the CAR_INSURANCE_DATASET environment variable, the
+    schema of /generate/schema with CAR_INSURANCE_SCHEMA (default is the built-in schema) and the size
+    of the response cache of seeded requests with CAR_INSURANCE_CACHE_BYTES (see src.cache). The
+    compression levels are read from CAR_INSURANCE_GZIP_LEVEL and CAR_INSURANCE_ZSTD_LEVEL (see
+    src.compression). Admission control of generation requests is configured with the
+    CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT, CAR_INSURANCE_ADMISSION_QUEUE and CAR_INSURANCE_ADMISSION_WAIT
+    environment variables (see src.admission).
+
+    :param app: The application.
+    :return: An async context manager running the producer and holding the dataset open.
+    """
+    record_buffer = buffer_from_environment()
+    dataset_path = os.environ.get("CAR_INSURANCE_DATASET")
+    app.state.record_buffer = record_buffer
+    app.state.dataset = FixedWidthDataset(dataset_path) if dataset_path else None
+    schema_path = os.environ.get("CAR_INSURANCE_SCHEMA")
+    app.state.plan = load_plan(schema_path) if schema_path else None
+    app.state.response_cache = cache_from_environment()
+    app.state.compression_levels = levels_from_environment()
+    app.state.admission = admission_from_environment()
+    if record_buffer is not None:
+        record_buffer.start()
+    try:
+        yield
+    finally:
+        if record_buffer is not None:
+            record_buffer.stop()
+        if app.state.dataset is not None:
+            app.state.dataset.close()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(RequestMetricsMiddleware)
+
+
+def requested_records(request: Request) -> int:
+    """Read the number of records of a generation request from its count query parameter.
+
+    :param request: The incoming request.
+    :return: The number of records, 1 when the count is missing or invalid.
+    """
+    count = request.query_params.get("count", "1")
+    # Invalid counts are rejected by the endpoint validation
+    return int(count) if count.isdecimal() else 1
+
+
+def service_unavailable(error: OverloadedError) -> HTTPException:
+    """Convert a rejection of the admission controller into a 503 response with a Retry-After header.
+
+    :param error: The rejection.
+    :return: The HTTP exception.
+    """
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+
+
+@asynccontextmanager
+async def admitted(request: Request, records: int) -> AsyncIterator[None]:
+    """Hold records of the admission controller, if it is enabled, for the lifetime of the context.
+
+    :param request: The incoming request.
+    :param records: The number of records to hold.
+    :return: An async context manager entered once the records are admitted.
+    """
+    admission = getattr(request.app.state, "admission", None)
+    if admission is None:
+        yield
+        return
+    try:
+        weight = await admission.acquire(records)
+    except OverloadedError as e:
+        raise service_unavailable(e) from e
+    try:
+        yield
+    finally:
+        admission.release(weight)
+
+
+async def admit(request: Request) -> AsyncIterator[None]:
+    """Hold a generation request until the admission controller admits its records, if it is enabled.
+
+    The dependency runs on the event loop before the endpoint is handed to the threadpool, and
+    releases the records once the endpoint has returned.
+
+    :param request: The incoming request, whose count query parameter is its number of records.
+    :return: An async iterator yielding once the request is admitted.
+    """
+    async with admitted(request, requested_records(request)):
+        yield
 
 
 @app.get("/")
@@ -21,14 +155,449 @@ def read_root():
     return {"message": "Welcome to the Car Insurance Generator API!"}
 
 
-@app.get("/generate")
-def generate_data():
+@app.get("/generate", response_class=FastJSONResponse)
+async def generate_data(
+    request: Request,
+    count: Annotated[int | None, Query(ge=1, le=MAX_BATCH_SIZE)] = None,
+    seed: Annotated[int | None, Query(ge=0)] = None,
+    pooled: bool = False,
+    locale: Annotated[list[Locale] | None, Query()] = None,
+    index: Annotated[int | None, Query(ge=0)] = None,
+    as_of: Annotated[date | None, Query()] = None,
+):
     """Generate fake car insurance data.
 
-    This endpoint generates a single set of fictional car insurance data,
-    including details about the policy, owner, and car. The data is returned
-    in JSON format.
+    Without parameters this endpoint generates a single set of fictional car insurance data, including
+    details about the policy, owner, and car. When `count` is given, a list of `count` records is
+    generated column-wise in one call. When `seed` is given, the same parameters always produce the same
+    data. The data is serialized straight to JSON bytes with orjson, bypassing FastAPI's
+    jsonable_encoder. `locale` selects the locale of the data; repeat it to mix several locales.
+    Unseeded requests of the default locale are served from the pre-generated record buffer when it is
+    enabled (see src.buffer). With `seed` and `index`, the record at that index of the seeded dataset is
+    computed on its own (see src.addressing), and `count` selects the records from `index` on. Its dates
+    are relative to `as_of`, a fixed epoch by default, so the same parameters return the same records on
+    every day. Seeded responses are cached (see src.cache) and carry an ETag; a matching If-None-Match
+    header gets a 304 response. Responses are compressed with the encoding negotiated from the
+    Accept-Encoding header (see src.compression). Records are generated in the threadpool once the
+    admission controller admits them (see src.admission); cached responses are served right away.
+
+    :param request: The incoming request.
+    :param count: The number of records to generate (optional).
+    :param seed: The seed value that makes the generated data reproducible (optional).
+    :param pooled: Sample names and addresses from precomputed value pools when generating a batch.
+    :param locale: The locales of the data (optional).
+    :param index: The index of the first record in the dataset of the seed (optional, requires seed).
+    :param as_of: The date the addressed records are relative to (optional, requires index).
+    :return: A dictionary containing fake car insurance data, or a list of them when count is given.
+    """
+    if index is not None and seed is None:
+        raise HTTPException(status_code=422, detail="Index requires a seed.")
+    if as_of is not None and index is None:
+        raise HTTPException(status_code=422, detail="As_of requires an index.")
+    if seed is not None:
+        return await serve_seeded_data(request, seed, count, pooled, locale, index, as_of)
+    async with admitted(request, count or 1):
+        return await run_in_threadpool(generate_unseeded_data, request, count, pooled, locale)
+
+
+def generate_unseeded_data(request: Request, count: int | None, pooled: bool, locale: list[str] | None) -> Response:
+    """Serve unseeded data from the record buffer when it can, and generate it otherwise.
+
+    :param request: The incoming request.
+    :param count: The number of records, or None for a single record.
+    :param pooled: Sample names and addresses from precomputed value pools when generating a batch.
+    :param locale: The locales of the data (optional).
+    :return: The compressed response.
+    """
+    record_buffer = getattr(request.app.state, "record_buffer", None)
+    if record_buffer is not None and locale is None and pooled == record_buffer.pooled:
+        return negotiated_response(request, FastJSONResponse(serve_from_buffer(record_buffer, count)))
+    return negotiated_response(request, generate_batch_data(None, count, pooled, locale))
+
+
+def compress_body(request: Request, body: bytes) -> tuple[bytes, str | None]:
+    """Compress a response body with the encoding negotiated from the Accept-Encoding header.
+
+    It is called in the threadpool, so bodies are compressed off the event loop.
+
+    :param request: The incoming request.
+    :param body: The uncompressed body.
+    :return: A tuple of the body and its content encoding, None when it was not compressed.
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is None or len(body) < MIN_COMPRESSED_BYTES:
+        return body, None
+    return compress(body, encoding, compression_level(request, encoding)), encoding
+
+
+def compression_level(request: Request, encoding: str) -> int:
+    """Get the configured compression level of an encoding.
+
+    :param request: The incoming request.
+    :param encoding: The content encoding.
+    :return: The compression level.
+    """
+    levels = getattr(request.app.state, "compression_levels", None) or DEFAULT_LEVELS
+    return levels[encoding]
+
+
+def negotiated_response(request: Request, response: Response) -> Response:
+    """Compress the body of a response with the encoding negotiated from the Accept-Encoding header.
+
+    :param request: The incoming request.
+    :param response: The uncompressed response.
+    :return: The response, compressed when the client accepts a supported encoding.
+    """
+    response.headers["vary"] = "Accept-Encoding"
+    body, encoding = compress_body(request, response.body)
+    if encoding is not None:
+        response.body = body
+        response.headers["content-encoding"] = encoding
+        response.headers["content-length"] = str(len(body))
+    return response
+
+
+def generate_batch_data(
+    seed: int | None, count: int | None, pooled: bool, locale: list[str] | None
+) -> FastJSONResponse:
+    """Generate a single record, or a batch of records column-wise.
+
+    :param seed: The seed value that makes the generated data reproducible, or None.
+    :param count: The number of records, or None for a single record.
+    :param pooled: Sample names and addresses from precomputed value pools when generating a batch.
+    :param locale: The locales of the data (optional).
+    :return: A response with a single record, or a list of them when count is given.
+    """
+    if count is None:
+        record = generate_fake_data(seed=seed, locale=locale)
+        with FIELD_TIMINGS.timer()("serialization"):
+            response = FastJSONResponse(record)
+        RECORDS_GENERATED.inc(1, "/generate")
+        return response
+    batch = generate_insurance_batch(count, seed=seed, pooled=pooled, locale=locale)
+    with FIELD_TIMINGS.timer()("serialization"):
+        response = FastJSONResponse(encode_batch(batch))
+    RECORDS_GENERATED.inc(count, "/generate")
+    return response
+
+
+async def serve_seeded_data(
+    request: Request,
+    seed: int,
+    count: int | None,
+    pooled: bool,
+    locale: list[str] | None,
+    index: int | None,
+    as_of: date | None = None,
+) -> Response:
+    """Serve seeded data from the response cache, generating and caching it on a miss.
 
+    The cache is looked up on the event loop before admission, so a cached response or a 304 holds
+    no records of the admission controller and is never rejected.
+
+    :param request: The incoming request, whose If-None-Match header is checked.
+    :param seed: The seed of the data.
+    :param count: The number of records, or None for a single record.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locales of the data (optional).
+    :param index: The index of the first record in the dataset of the seed, or None.
+    :param as_of: The date addressed records are relative to (default is ADDRESSING_EPOCH).
+    :return: The response, or a 304 response without a body when the client holds it already.
+    """
+    # Addressed records are relative to a fixed date, other seeded data to today
+    as_of = (as_of or ADDRESSING_EPOCH) if index is not None else date.today()
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if response_cache is None:
+        async with admitted(request, count or 1):
+            body, encoding = await run_in_threadpool(
+                generate_seeded_body, request, seed, count, pooled, locale, index, as_of
+            )
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return FastJSONResponse(body, headers=headers)
+
+    # The date the dates are relative to is part of the key, and every encoding is cached on its own
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    key = ("/generate", seed, count, pooled, tuple(locale) if locale else None, index, as_of, encoding)
+    entry = response_cache.get(key)
+    if entry is None:
+        async with admitted(request, count or 1):
+            body, encoding = await run_in_threadpool(
+                generate_seeded_body, request, seed, count, pooled, locale, index, as_of
+            )
+        # A body of today's date generated across midnight may mix both dates and is not cached
+        if index is not None or date.today() == as_of:
+            entry = await run_in_threadpool(response_cache.put, key, body, encoding)
+        else:
+            entry = CachedResponse(body, entity_tag(body), encoding)
+    headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    if entry.encoding is not None:
+        headers["Content-Encoding"] = entry.encoding
+    return FastJSONResponse(entry.body, headers=headers)
+
+
+def generate_seeded_body(
+    request: Request,
+    seed: int,
+    count: int | None,
+    pooled: bool,
+    locale: list[str] | None,
+    index: int | None,
+    as_of: date,
+) -> tuple[bytes, str | None]:
+    """Generate seeded data and compress it with the encoding negotiated from the Accept-Encoding header.
+
+    :param request: The incoming request.
+    :param seed: The seed of the data.
+    :param count: The number of records, or None for a single record.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locales of the data (optional).
+    :param index: The index of the first record in the dataset of the seed, or None.
+    :param as_of: The date addressed records are relative to.
+    :return: A tuple of the body and its content encoding, None when it was not compressed.
+    """
+    if index is not None:
+        body = generate_addressed_data(seed, index, count, pooled, locale, as_of).body
+    else:
+        body = generate_batch_data(seed, count, pooled, locale).body
+    return compress_body(request, body)
+
+
+def generate_addressed_data(
+    seed: int, index: int, count: int | None, pooled: bool, locale: list[str] | None, as_of: date | None = None
+) -> FastJSONResponse:
+    """Generate records at an index of a seeded dataset with counter-based addressing.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the first record.
+    :param count: The number of records, or None for a single record.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locales of the data (optional).
+    :param as_of: The date the records are relative to (default is ADDRESSING_EPOCH).
+    :return: A response with a single record, or a list of them when count is given.
+    """
+    if count is None:
+        response = FastJSONResponse(generate_record_at(seed, index, pooled, as_of, locale).to_dict())
+    else:
+        response = FastJSONResponse(
+            encode_batch(generate_records_at(seed, index, index + count, pooled, as_of, locale))
+        )
+    RECORDS_GENERATED.inc(count or 1, "/generate")
+    return response
+
+
+def serve_from_buffer(record_buffer: RecordBuffer, count: int | None) -> bytes:
+    """Serve records from the record buffer, generating whatever the buffer cannot provide inline.
+
+    :param record_buffer: The record buffer.
+    :param count: The number of records, or None for a single record.
+    :return: The JSON document: an object for a single record, an array otherwise.
+    """
+    wanted = count or 1
+    records = record_buffer.pop(wanted)
+    BUFFER_RECORDS_SERVED.inc(len(records), "buffer")
+    if len(records) < wanted:
+        missing = wanted - len(records)
+        records += encode_records(generate_insurance_batch(missing, pooled=record_buffer.pooled))
+        BUFFER_RECORDS_SERVED.inc(missing, "inline")
+    RECORDS_GENERATED.inc(wanted, "/generate")
+    return records[0] if count is None else join_records(records)
+
+
+async def stream_ndjson(
+    request: Request,
+    count: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pooled: bool = False,
+    locale: list[str] | None = None,
+    compressor: Compressor | None = None,
+    admission: AdmissionController | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream fake car insurance data as newline-delimited JSON chunks.
+
+    Every chunk is generated, encoded and compressed in the threadpool, so the event loop is not
+    blocked. Generation stops as soon as the client disconnects, and the throughput is logged at the end.
+    With an admission controller, the stream waits until the records of one chunk are admitted, since
+    it generates one chunk at a time, and holds them until it ends; a rejection raises OverloadedError.
+
+    :param request: The incoming request, used to detect client disconnects.
+    :param count: The total number of records to stream.
+    :param chunk_size: The number of records generated and flushed together.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locales of the records (optional).
+    :param compressor: The compressor of the content encoding, or None for an uncompressed stream.
+    :param admission: The admission controller, or None when admission control is disabled.
+    :return: An async iterator over NDJSON encoded chunks.
+    """
+    weight = await admission.acquire(min(count, chunk_size)) if admission is not None else 0
+    chunks = iter_fake_data_chunks(count, chunk_size, pooled, locale)
+    records_sent = 0
+    bytes_sent = 0
+    started = perf_counter()
+    try:
+        while records_sent < count:
+            if await request.is_disconnected():
+                logger.info("Client disconnected after %d of %d streamed records.", records_sent, count)
+                break
+            batch = await run_in_threadpool(next, chunks)
+            chunk = await run_in_threadpool(encode_ndjson, batch)
+            if compressor is not None:
+                chunk = await run_in_threadpool(compressor.compress, chunk)
+            yield chunk
+            records_sent += len(batch)
+            RECORDS_GENERATED.inc(len(batch), "/generate/stream")
+            bytes_sent += len(chunk)
+        if compressor is not None and records_sent == count:
+            chunk = compressor.finish()
+            yield chunk
+            bytes_sent += len(chunk)
+    finally:
+        if admission is not None:
+            admission.release(weight)
+        elapsed = perf_counter() - started
+        logger.info(
+            "Streamed %d records (%d bytes) in %.3f s: %.0f records/s.",
+            records_sent,
+            bytes_sent,
+            elapsed,
+            records_sent / elapsed if elapsed else 0.0,
+        )
+
+
+async def prepend_chunk(chunk: bytes, chunks: AsyncGenerator[bytes, None]) -> AsyncIterator[bytes]:
+    """Yield a chunk taken from a stream ahead of the rest of the stream.
+
+    :param chunk: The first chunk.
+    :param chunks: The rest of the stream, closed when the iterator ends.
+    :return: An async iterator over all chunks.
+    """
+    try:
+        yield chunk
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+@app.get("/generate/stream")
+async def generate_data_stream(
+    request: Request,
+    count: Annotated[int, Query(ge=1, le=MAX_STREAM_SIZE)],
+    pooled: bool = False,
+    locale: Annotated[list[Locale] | None, Query()] = None,
+):
+    """Stream fake car insurance data as newline-delimited JSON.
+
+    Records are generated in chunks and flushed as a chunked response, so memory usage
+    stays flat regardless of the requested count. Every chunk is compressed on its own with the
+    encoding negotiated from the Accept-Encoding header (see src.compression). The stream holds the
+    records of one chunk of the admission controller while it runs (see src.admission). The first
+    chunk is generated before the response starts, so a stream that is not admitted gets a 503.
+
+    :param request: The incoming request.
+    :param count: The number of records to stream.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locales of the records (optional).
+    :return: A streaming response with one JSON record per line.
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding"}
+    compressor = None
+    if encoding is not None:
+        compressor = Compressor(encoding, compression_level(request, encoding))
+        headers["Content-Encoding"] = encoding
+    admission = getattr(request.app.state, "admission", None)
+    chunks = stream_ndjson(request, count, pooled=pooled, locale=locale, compressor=compressor, admission=admission)
+    try:
+        first_chunk = await anext(chunks)
+    except OverloadedError as e:
+        raise service_unavailable(e) from e
+    return StreamingResponse(
+        prepend_chunk(first_chunk, chunks),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
+@app.get("/generate/schema", response_class=FastJSONResponse, dependencies=[Depends(admit)])
+def generate_schema_data(
+    request: Request,
+    count: Annotated[int, Query(ge=1, le=MAX_BATCH_SIZE)] = 1,
+    seed: Annotated[int | None, Query(ge=0)] = None,
+    pooled: bool = False,
+):
+    """Generate records described by the configured schema (see src.schema).
+
+    :param request: The incoming request.
+    :param count: The number of records to generate (default is 1).
+    :param seed: The seed value that makes the generated data reproducible (optional).
+    :param pooled: Sample names and addresses of the sources from precomputed value pools.
+    :return: A list of dictionaries nested as described by the schema.
+    """
+    plan = getattr(request.app.state, "plan", None) or default_plan()
+    records = plan.generate(count, seed=seed, pooled=pooled)
+    RECORDS_GENERATED.inc(count, "/generate/schema")
+    return negotiated_response(request, FastJSONResponse(records))
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Expose request counts, generated records and field timings in the Prometheus text format.
+
+    Field timings are only collected while they are enabled (see src.metrics).
+
+    :return: The metrics as plain text.
+    """
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+def get_dataset(request: Request) -> FixedWidthDataset:
+    """Get the dataset opened by the lifespan of the app.
+
+    :param request: The incoming request.
+    :return: The memory-mapped dataset.
+    """
+    dataset = getattr(request.app.state, "dataset", None)
+    if dataset is None:
+        raise HTTPException(status_code=404, detail="No dataset is configured; set CAR_INSURANCE_DATASET.")
+    return dataset
+
+
+@app.get("/records/{index}", response_class=FastJSONResponse)
+def read_record(request: Request, index: Annotated[int, Path(ge=0)]):
+    """Read a single record of the pre-generated dataset by its index.
+
+    The record is decoded from a slice of the memory-mapped dataset file, without generating data.
+
+    :param request: The incoming request.
+    :param index: The index of the record.
     :return: A dictionary containing fake car insurance data.
     """
-    return generate_fake_data()
+    dataset = get_dataset(request)
+    if index >= len(dataset):
+        raise HTTPException(status_code=404, detail=f"The dataset has {len(dataset)} records.")
+    return FastJSONResponse(dataset[index].to_dict())
+
+
+@app.get("/records", response_class=FastJSONResponse)
+def read_records(
+    request: Request,
+    stop: Annotated[int, Query(ge=1)],
+    start: Annotated[int, Query(ge=0)] = 0,
+):
+    """Read a range of records of the pre-generated dataset.
+
+    The range is clamped to the size of the dataset and may hold at most MAX_BATCH_SIZE records.
+
+    :param request: The incoming request.
+    :param stop: The index after the last record.
+    :param start: The index of the first record (default is 0).
+    :return: A list of dictionaries containing fake car insurance data.
+    """
+    if stop - start > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=422, detail=f"A range may hold at most {MAX_BATCH_SIZE} records.")
+    records = [record.to_dict() for record in get_dataset(request).records(start, stop)]
+    return negotiated_response(request, FastJSONResponse(records))
@@ -0,0 +1,152 @@
+"""Module provides counter-based random access generation: record i of a seed is f(seed, i, as_of).
+
+Seeded batches draw every record from one random stream, so record i of a dataset depends on all the
+records before it. Here every field of record i is instead generated from a random state keyed by
+(seed, i, field): the key is hashed with BLAKE2b into the seed of the thread's Faker instance right
+before the field is generated. Any record or range can therefore be computed on its own, in any order
+and in parallel, and regenerated later without being stored. The insurance dates and the ages are
+relative to as_of, which defaults to the fixed ADDRESSING_EPOCH rather than today, so an addressed
+record is the same on every day unless another as_of is given.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+from hashlib import blake2b
+
+from src.car import generate_vin_batch
+from src.insurance import generate_end_date, generate_start_date
+from src.locales import normalize_locales
+from src.owner import (
+    generate_address_batch,
+    generate_birthdate_batch,
+    generate_first_name_batch,
+    generate_last_name_batch,
+    generate_phone_batch,
+)
+from src.policy_number import generate_policy_number_batch
+from src.record import InsuranceBatch, InsuranceRecord
+from src.singleton import FakerSingleton
+
+# Default date addressed records are relative to, fixed so that a record does not change with the day
+ADDRESSING_EPOCH = date(2026, 1, 1)
+
+
+def record_key(seed: int, index: int, field: str) -> int:
+    """Derive the random seed of a field of a record.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the record.
+    :param field: The name of the field.
+    :return: A 64-bit seed.
+    """
+    digest = blake2b(f"{seed}:{index}:{field}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def generate_record_at(
+    seed: int,
+    index: int,
+    pooled: bool = False,
+    as_of: date | None = None,
+    locale: str | Sequence[str] | None = None,
+) -> InsuranceRecord:
+    """Generate the record at an index of a seeded dataset, independently of every other record.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the record.
+    :param pooled: Sample names and addresses from precomputed value pools (see src.pools).
+    :param as_of: The insurance start date and the date ages are calculated at (default is ADDRESSING_EPOCH).
+    :param locale: The locale of the record, or a list of locales to pick it from (optional).
+    :return: The record.
+    """
+    _validate_address(seed, index)
+    return _generate_record_at(seed, index, pooled, as_of or ADDRESSING_EPOCH, normalize_locales(locale))
+
+
+def generate_records_at(
+    seed: int,
+    start: int,
+    stop: int,
+    pooled: bool = False,
+    as_of: date | None = None,
+    locale: str | Sequence[str] | None = None,
+) -> InsuranceBatch:
+    """Generate a range of records of a seeded dataset.
+
+    Record i of the range is the record generate_record_at() returns for index i, so ranges can be
+    split and generated in any order.
+
+    :param seed: The seed of the dataset.
+    :param start: The index of the first record.
+    :param stop: The index after the last record.
+    :param pooled: Sample names and addresses from precomputed value pools (see src.pools).
+    :param as_of: The insurance start date and the date ages are calculated at (default is ADDRESSING_EPOCH).
+    :param locale: The locale of the records, or a list of locales to pick each one from (optional).
+    :return: An InsuranceBatch holding one list per field.
+    """
+    _validate_address(seed, start)
+    if not isinstance(stop, int) or stop <= start:
+        raise ValueError("Stop must be an integer greater than start.")
+
+    as_of = as_of or ADDRESSING_EPOCH
+    locales = normalize_locales(locale)
+    records = [_generate_record_at(seed, index, pooled, as_of, locales) for index in range(start, stop)]
+    return InsuranceBatch(*map(list, zip(*records, strict=True)))
+
+
+def _validate_address(seed: int, index: int) -> None:
+    """Validate the seed and the index of a record.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the record.
+    """
+    for name, value in (("Seed", seed), ("Index", index)):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"{name} must be an integer.")
+        if value < 0:
+            raise ValueError(f"{name} must be a non-negative integer.")
+
+
+def _generate_record_at(seed: int, index: int, pooled: bool, as_of: date, locales: list[str] | None) -> InsuranceRecord:
+    """Generate the record at an index with every field drawn from its own keyed random state.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the record.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param as_of: The insurance start date and the date ages are calculated at.
+    :param locales: The locales to pick the locale of the record from, or None for the default locale.
+    :return: The record.
+    """
+    locale = None
+    if locales is not None:
+        with FakerSingleton.seeded(record_key(seed, index, "locale")) as seeded_fake:
+            locale = seeded_fake.random.choice(locales)
+
+    # seeded() restores an unpredictable random state on exit; the fields reseed it in place
+    with FakerSingleton.localized(locale), FakerSingleton.seeded(seed) as seeded_fake:
+        reseed = seeded_fake.random.seed
+        reseed(record_key(seed, index, "policy_number"))
+        policy_number = generate_policy_number_batch(1, locale=locale)[0]
+        reseed(record_key(seed, index, "first_name"))
+        first_name = generate_first_name_batch(1, pooled, locale)[0]
+        reseed(record_key(seed, index, "last_name"))
+        last_name = generate_last_name_batch(1, pooled, locale)[0]
+        reseed(record_key(seed, index, "birth_date"))
+        birth_date = generate_birthdate_batch(1, as_of=as_of)[0]
+        reseed(record_key(seed, index, "address"))
+        address = generate_address_batch(1, pooled, locale)[0]
+        reseed(record_key(seed, index, "phone"))
+        phone = generate_phone_batch(1, locale)[0]
+        reseed(record_key(seed, index, "vin"))
+        vin = generate_vin_batch(1)[0]
+    return InsuranceRecord(
+        policy_number,
+        first_name,
+        last_name,
+        birth_date,
+        address,
+        phone,
+        vin,
+        generate_start_date(as_of),
+        generate_end_date(as_of),
+    )
@@ -0,0 +1,182 @@
+"""Module provides admission control of generation requests, weighted by the records they generate.
+
+Every admitted request holds its number of records (at least 1, at most max_records) until its
+response is produced, and no more than max_records are generated at a time. A request that does not
+fit waits in a queue of at most max_queue requests for up to max_wait seconds; when the queue is full
+or the wait times out, it is rejected right away with 503 Service Unavailable and a Retry-After
+header, instead of piling up in the threadpool.
+
+Admission is first fit: a request is admitted as soon as its records fit, even when larger requests
+are waiting, and waiting requests are admitted in arrival order as records are released. Small
+requests therefore pass large batches instead of queueing behind them, while a large batch waits at
+most max_wait. Generation holds the GIL, so more records in flight add latency, not throughput.
+
+The controller runs on the event loop, before the endpoints are handed to the threadpool, so its
+state needs no lock. It is enabled by default and configured with the CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT,
+CAR_INSURANCE_ADMISSION_QUEUE and CAR_INSURANCE_ADMISSION_WAIT environment variables (see
+admission_from_environment()).
+"""
+
+import asyncio
+import os
+from collections.abc import Mapping
+from math import ceil
+from time import perf_counter
+
+from src.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTIONS, ADMISSION_WAIT
+
+# Default upper bound of the number of records generated at a time: two batches of the largest size
+# /generate accepts, with headroom for small requests
+DEFAULT_MAX_RECORDS = 25_000
+
+# Default upper bound of the number of requests waiting for admission
+DEFAULT_MAX_QUEUE = 100
+
+# Default number of seconds a request waits for admission before it is rejected
+DEFAULT_MAX_WAIT = 10.0
+
+
+class OverloadedError(Exception):
+    """Raised when a request cannot be admitted."""
+
+    def __init__(self, message: str, retry_after: int):
+        """Initialize the exception.
+
+        :param message: The reason of the rejection.
+        :param retry_after: The number of seconds after which the client should retry.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Limiter of the records generated at a time, with a bounded queue of waiting requests."""
+
+    def __init__(self, max_records: int, max_queue: int = DEFAULT_MAX_QUEUE, max_wait: float = DEFAULT_MAX_WAIT):
+        """Initialize the controller.
+
+        :param max_records: The maximum number of records generated at a time.
+        :param max_queue: The maximum number of waiting requests; 0 rejects every request that does not fit.
+        :param max_wait: The maximum number of seconds a request waits for admission.
+        """
+        if not isinstance(max_records, int) or max_records < 1:
+            raise ValueError("Max records must be a positive integer.")
+        if not isinstance(max_queue, int) or max_queue < 0:
+            raise ValueError("Max queue must be a non-negative integer.")
+        if max_wait <= 0:
+            raise ValueError("Max wait must be positive.")
+        self.max_records = max_records
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self._waiters: list[tuple[int, asyncio.Future]] = []
+
+    @property
+    def queued(self) -> int:
+        """The number of waiting requests."""
+        return len(self._waiters)
+
+    def weight(self, records: int) -> int:
+        """Calculate the weight of a request, so that even the largest request can be admitted alone.
+
+        :param records: The number of records of the request.
+        :return: The number of records the request holds while it is admitted.
+        """
+        return min(max(records, 1), self.max_records)
+
+    async def acquire(self, records: int) -> int:
+        """Wait until a request fits and admit it.
+
+        :param records: The number of records of the request.
+        :return: The weight of the request, to be passed to release().
+        """
+        weight = self.weight(records)
+        if self.in_flight + weight <= self.max_records:
+            self._admit(weight)
+            ADMISSION_WAIT.observe("admitted", 0.0)
+            return weight
+        if len(self._waiters) >= self.max_queue:
+            ADMISSION_REJECTIONS.inc(1, "queue_full")
+            raise OverloadedError("Too many requests are waiting for admission.", self._retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (weight, future)
+        self._waiters.append(waiter)
+        ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+        started = perf_counter()
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await future
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # Admitted while the wait was interrupted
+                self.release(weight)
+            elif waiter in self._waiters:
+                # Not admitted yet; _wake() drops cancelled waiters it reaches first
+                self._waiters.remove(waiter)
+                ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+            if isinstance(e, TimeoutError):
+                ADMISSION_WAIT.observe("timeout", perf_counter() - started)
+                ADMISSION_REJECTIONS.inc(1, "timeout")
+                raise OverloadedError("The request waited too long for admission.", self._retry_after()) from e
+            raise
+        ADMISSION_WAIT.observe("admitted", perf_counter() - started)
+        return weight
+
+    def release(self, weight: int) -> None:
+        """Release the records of an admitted request and admit the waiting requests that fit.
+
+        :param weight: The weight returned by acquire().
+        """
+        self.in_flight -= weight
+        ADMISSION_IN_FLIGHT.set(self.in_flight)
+        self._wake()
+
+    def _admit(self, weight: int) -> None:
+        """Add the records of an admitted request.
+
+        :param weight: The weight of the request.
+        """
+        self.in_flight += weight
+        ADMISSION_IN_FLIGHT.set(self.in_flight)
+
+    def _wake(self) -> None:
+        """Admit the waiting requests that fit, in arrival order, dropping the cancelled ones."""
+        remaining = []
+        for weight, future in self._waiters:
+            if future.done():
+                continue
+            if self.in_flight + weight <= self.max_records:
+                self._admit(weight)
+                future.set_result(None)
+            else:
+                remaining.append((weight, future))
+        self._waiters = remaining
+        ADMISSION_QUEUE_DEPTH.set(len(remaining))
+
+    def _retry_after(self) -> int:
+        """Estimate when a rejected request should be retried.
+
+        :return: A number of seconds.
+        """
+        return max(1, ceil(self.max_wait / 2))
+
+
+def admission_from_environment(environ: Mapping[str, str] = os.environ) -> AdmissionController | None:
+    """Create the admission controller configured by environment variables.
+
+    CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT sets the maximum number of records generated at a time (default
+    is DEFAULT_MAX_RECORDS; 0 disables admission control), CAR_INSURANCE_ADMISSION_QUEUE the maximum
+    number of waiting requests and CAR_INSURANCE_ADMISSION_WAIT the maximum wait in seconds.
+
+    :param environ: The environment variables.
+    :return: An AdmissionController, or None when admission control is disabled.
+    """
+    max_records = int(environ.get("CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT", DEFAULT_MAX_RECORDS))
+    if max_records <= 0:
+        return None
+    return AdmissionController(
+        max_records,
+        int(environ.get("CAR_INSURANCE_ADMISSION_QUEUE", DEFAULT_MAX_QUEUE)),
+        float(environ.get("CAR_INSURANCE_ADMISSION_WAIT", DEFAULT_MAX_WAIT)),
+    )
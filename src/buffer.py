@@ -0,0 +1,178 @@
+"""Module provides a buffer of pre-generated records that a background producer keeps filled.
+
+Records are generated in batches with the same column-wise pipeline as /generate and stored already
+serialized, so serving them only takes joining bytes. The producer refills the buffer up to the high
+watermark whenever it drops to the low watermark. It runs in a thread of the API process and
+therefore shares the GIL with request handling: it moves generation off the request path, it does
+not add CPU capacity.
+
+The buffer is enabled by setting the CAR_INSURANCE_BUFFER_HIGH_WATERMARK environment variable (see
+buffer_from_environment()).
+"""
+
+import logging
+import os
+from collections import deque
+from collections.abc import Mapping
+from datetime import date
+from threading import Event, Thread
+from time import perf_counter
+
+from src.fake_data import generate_insurance_batch
+from src.metrics import BUFFER_CAPACITY, BUFFER_DEPTH, BUFFER_RECORDS_PRODUCED, BUFFER_REFILL_RATE
+from src.serialization import encode_records
+
+# Number of records generated by a single refill step
+DEFAULT_REFILL_BATCH_SIZE = 1_000
+
+# Seconds the idle producer waits before checking the buffer again, e.g. for a date change
+IDLE_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class RecordBuffer:
+    """Bounded ring buffer of serialized records, refilled by a background producer thread."""
+
+    def __init__(
+        self,
+        high_watermark: int,
+        low_watermark: int | None = None,
+        batch_size: int = DEFAULT_REFILL_BATCH_SIZE,
+        pooled: bool = False,
+    ):
+        """Initialize the buffer.
+
+        :param high_watermark: The number of records a refill fills the buffer up to.
+        :param low_watermark: The depth at which the producer starts a refill (default is half the
+            high watermark).
+        :param batch_size: The number of records generated by a single refill step.
+        :param pooled: Generate names and addresses from precomputed value pools.
+        """
+        if low_watermark is None:
+            low_watermark = high_watermark // 2
+        if not isinstance(high_watermark, int) or high_watermark < 1:
+            raise ValueError("High watermark must be a positive integer.")
+        if not isinstance(low_watermark, int) or not 0 <= low_watermark < high_watermark:
+            raise ValueError("Low watermark must be a non-negative integer below the high watermark.")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.batch_size = batch_size
+        self.pooled = pooled
+        self._records: deque[bytes] = deque(maxlen=high_watermark)
+        # The insurance start date of the buffered records; records of a past day are discarded
+        self._as_of: date | None = None
+        self._wake = Event()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        BUFFER_CAPACITY.set(high_watermark)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def pop(self, count: int) -> list[bytes]:
+        """Take up to count records from the buffer.
+
+        Fewer records are returned when the buffer is drained; the caller generates the rest inline.
+        The producer is woken up once the depth drops to the low watermark.
+
+        :param count: The number of records to take.
+        :return: A list of serialized records, possibly shorter than count.
+        """
+        records = []
+        if self._as_of == date.today():
+            popleft = self._records.popleft
+            try:
+                for _ in range(count):
+                    records.append(popleft())
+            except IndexError:
+                pass
+        depth = len(self._records)
+        BUFFER_DEPTH.set(depth)
+        if depth <= self.low_watermark or len(records) < count:
+            self._wake.set()
+        return records
+
+    def refill(self) -> int:
+        """Fill the buffer up to the high watermark in the calling thread.
+
+        Buffered records of a past day are discarded first, so served start dates are always today.
+
+        :return: The number of records produced.
+        """
+        produced = 0
+        if self._as_of != date.today():
+            self._records.clear()
+        while not self._stopped.is_set():
+            missing = self.high_watermark - len(self._records)
+            if missing <= 0:
+                break
+            size = min(self.batch_size, missing)
+            as_of = date.today()
+            started = perf_counter()
+            records = encode_records(generate_insurance_batch(size, pooled=self.pooled, as_of=as_of))
+            if as_of != self._as_of:
+                self._records.clear()
+                self._as_of = as_of
+            self._records.extend(records)
+            elapsed = perf_counter() - started
+            produced += size
+            BUFFER_RECORDS_PRODUCED.inc(size)
+            BUFFER_REFILL_RATE.set(size / elapsed if elapsed else 0.0)
+            BUFFER_DEPTH.set(len(self._records))
+        return produced
+
+    def start(self) -> None:
+        """Start the background producer thread."""
+        if self._thread is not None:
+            raise RuntimeError("The producer of the buffer is already running.")
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="record-buffer-producer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background producer thread and wait for it to finish its current step.
+
+        :param timeout: The maximum number of seconds to wait for the thread (default is no limit).
+        """
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Refill the buffer whenever it drops to the low watermark, until the buffer is stopped."""
+        while not self._stopped.is_set():
+            self._wake.clear()
+            if len(self._records) <= self.low_watermark or self._as_of != date.today():
+                try:
+                    self.refill()
+                except Exception:
+                    logger.exception("Refilling the record buffer failed.")
+            self._wake.wait(IDLE_INTERVAL)
+
+
+def buffer_from_environment(environ: Mapping[str, str] = os.environ) -> RecordBuffer | None:
+    """Create the record buffer configured by environment variables.
+
+    CAR_INSURANCE_BUFFER_HIGH_WATERMARK enables the buffer with that capacity; the optional
+    CAR_INSURANCE_BUFFER_LOW_WATERMARK, CAR_INSURANCE_BUFFER_BATCH_SIZE and CAR_INSURANCE_BUFFER_POOLED
+    (set to 1) tune it.
+
+    :param environ: The environment variables.
+    :return: A RecordBuffer, or None when the buffer is not enabled.
+    """
+    high_watermark = int(environ.get("CAR_INSURANCE_BUFFER_HIGH_WATERMARK", "0"))
+    if high_watermark <= 0:
+        return None
+    low_watermark = environ.get("CAR_INSURANCE_BUFFER_LOW_WATERMARK")
+    return RecordBuffer(
+        high_watermark,
+        int(low_watermark) if low_watermark is not None else None,
+        int(environ.get("CAR_INSURANCE_BUFFER_BATCH_SIZE", DEFAULT_REFILL_BATCH_SIZE)),
+        environ.get("CAR_INSURANCE_BUFFER_POOLED") == "1",
+    )
@@ -0,0 +1,137 @@
+"""Module provides an LRU cache of serialized responses to deterministic requests.
+
+With a seed, the response of /generate is a pure function of its parameters and of the date its
+dates are relative to, so the serialized body is stored once and served again without generating or
+serializing anything. Entries are evicted least recently used first once their bodies take more
+than max_bytes. Every entry carries a strong ETag, the BLAKE2b digest of its body, so a client
+sending it back in If-None-Match gets a 304 Not Modified without a body.
+
+The cache is enabled by default and sized with the CAR_INSURANCE_CACHE_BYTES environment variable
+(see cache_from_environment()); 0 disables it.
+"""
+
+import os
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from hashlib import blake2b
+from threading import Lock
+from typing import NamedTuple
+
+from src.metrics import RESPONSE_CACHE_BYTES, RESPONSE_CACHE_EVICTIONS, RESPONSE_CACHE_LOOKUPS
+
+# Default upper bound of the total size of the cached bodies
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response body, its entity tag and its content encoding."""
+
+    body: bytes
+    etag: str
+    encoding: str | None = None
+
+
+def entity_tag(body: bytes) -> str:
+    """Calculate the strong entity tag of a response body.
+
+    :param body: The response body.
+    :return: The quoted entity tag.
+    """
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an entity tag.
+
+    :param if_none_match: The value of the If-None-Match header, if any.
+    :param etag: The entity tag of the current response.
+    :return: True when the client already holds the response.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of response bodies, bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """Initialize the cache.
+
+        :param max_bytes: The upper bound of the total size of the cached bodies.
+        """
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("Max bytes must be a positive integer.")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Look up a response and mark it as recently used.
+
+        :param key: The parameters the response is a function of.
+        :return: The cached response, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        RESPONSE_CACHE_LOOKUPS.inc(1, "miss" if entry is None else "hit")
+        return entry
+
+    def put(self, key: Hashable, body: bytes, encoding: str | None = None) -> CachedResponse:
+        """Store a response, evicting the least recently used ones until it fits.
+
+        A body larger than max_bytes is not stored.
+
+        :param key: The parameters the response is a function of, including its content encoding.
+        :param body: The serialized response body.
+        :param encoding: The content encoding of the body, or None when it is not compressed.
+        :return: The response with its entity tag.
+        """
+        entry = CachedResponse(body, entity_tag(body), encoding)
+        if len(body) > self.max_bytes:
+            return entry
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.body)
+            while self._entries and self.size + len(body) > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self.size -= len(oldest.body)
+                evicted += 1
+            self._entries[key] = entry
+            self.size += len(body)
+            RESPONSE_CACHE_BYTES.set(self.size)
+        if evicted:
+            RESPONSE_CACHE_EVICTIONS.inc(evicted)
+        return entry
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            RESPONSE_CACHE_BYTES.set(0)
+
+
+def cache_from_environment(environ: Mapping[str, str] = os.environ) -> ResponseCache | None:
+    """Create the response cache configured by environment variables.
+
+    CAR_INSURANCE_CACHE_BYTES sets the upper bound of the cached bodies (default is
+    DEFAULT_CACHE_BYTES); 0 disables the cache.
+
+    :param environ: The environment variables.
+    :return: A ResponseCache, or None when the cache is disabled.
+    """
+    max_bytes = int(environ.get("CAR_INSURANCE_CACHE_BYTES", DEFAULT_CACHE_BYTES))
+    return ResponseCache(max_bytes) if max_bytes > 0 else None
@@ -3,25 +3,128 @@
 from string import ascii_uppercase, digits
 
 from src.singleton import FakerSingleton
+from src.unique import VinRegistry
 
-fake = FakerSingleton.get_instance()
+fake = FakerSingleton.proxy()
+
+# Allowed characters for VIN (excluding I, O, Q)
+VIN_ALPHABET = ascii_uppercase.replace("I", "").replace("O", "").replace("Q", "") + digits
+
+# ISO 3779 transliteration of VIN characters into numeric values
+VIN_TRANSLITERATION = {
+    **{digit: int(digit) for digit in digits},
+    **dict(zip("ABCDEFGH", range(1, 9))),
+    **dict(zip("JKLMN", range(1, 6))),
+    "P": 7,
+    "R": 9,
+    **dict(zip("STUVWXYZ", range(2, 10))),
+}
+
+# Weight of each of the 17 VIN positions in the check digit sum (position 9 is the check digit itself)
+VIN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# World Manufacturer Identifiers (first three VIN characters) of real manufacturers
+WMI_CODES = (
+    "1FA",  # Ford (USA)
+    "1G1",  # Chevrolet (USA)
+    "1HG",  # Honda (USA)
+    "2T1",  # Toyota (Canada)
+    "3VW",  # Volkswagen (Mexico)
+    "JHM",  # Honda (Japan)
+    "JTD",  # Toyota (Japan)
+    "KMH",  # Hyundai (South Korea)
+    "SAL",  # Land Rover (United Kingdom)
+    "SUF",  # Fiat (Poland)
+    "TMB",  # Skoda (Czech Republic)
+    "VF1",  # Renault (France)
+    "VF3",  # Peugeot (France)
+    "WAU",  # Audi (Germany)
+    "WBA",  # BMW (Germany)
+    "WDD",  # Mercedes-Benz (Germany)
+    "WVW",  # Volkswagen (Germany)
+    "YV1",  # Volvo (Sweden)
+    "ZFA",  # Fiat (Italy)
+)
+
+_CHECK_DIGITS = "0123456789X"
+
+# Redraws of rejected VINs before a saturated registry is reported; at its capacity a registry rejects
+# 1e-4 of fresh VINs, at ten times its capacity ~99%
+MAX_VIN_REDRAWS = 20
+
+# Weighted transliteration value of every character for each of the 16 non-check-digit positions
+_WEIGHTED_VALUES = [
+    {char: VIN_TRANSLITERATION[char] * weight for char in VIN_ALPHABET}
+    for position, weight in enumerate(VIN_WEIGHTS)
+    if position != 8
+]
+
+
+def vin_check_digit(vin: str) -> str:
+    """Calculate the ISO 3779 check digit (position 9) of a VIN.
+
+    :param vin: A 17-character VIN; the character at position 9 is ignored.
+    :return: A single character, a digit or 'X', representing the check digit.
+    """
+    if len(vin) != 17:
+        raise ValueError(f"VIN must have 17 characters, but got '{len(vin)}'.")
+    total = sum(VIN_TRANSLITERATION[char] * weight for char, weight in zip(vin, VIN_WEIGHTS, strict=True))
+    return _CHECK_DIGITS[total % 11]
 
 
 def generate_vin():
     """Generates a random Vehicle Identification Number (VIN).
 
     A VIN is a 17-character string that includes uppercase letters (excluding I, O, Q)
-    and digits.
+    and digits, with a valid ISO 3779 check digit at position 9.
 
     :return: A string representing a VIN.
     """
-    # VIN consists of 17 characters
-    vin_length = 17
+    return generate_vin_batch(1)[0]
+
 
-    # Allowed characters for VIN (excluding I, O, Q)
-    allowed_chars = ascii_uppercase.replace("I", "").replace("O", "").replace("Q", "") + digits
+def generate_vin_batch(count: int, use_wmi: bool = False, registry: VinRegistry | None = None) -> list[str]:
+    """Generate a column of random VINs with valid ISO 3779 check digits.
 
-    # Generate random VIN
-    vin = "".join(fake.random_element(allowed_chars) for _ in range(vin_length))
+    The 16 random characters of every VIN are drawn for the whole batch from one bulk random buffer
+    and split into per-position columns, so the check digit sums are computed column-wise. With a
+    registry, VINs that were claimed before are rejected and the shortfall is redrawn in bulk, at most
+    MAX_VIN_REDRAWS times.
+
+    :param count: The number of VINs to generate.
+    :param use_wmi: Draw the first three characters from WMI_CODES instead of random characters.
+    :param registry: The registry of claimed VINs (optional).
+    :return: A list of strings representing VINs.
+    """
+    vins = _draw_vins(count, use_wmi)
+    if registry is not None:
+        vins = registry.claim(vins)
+        redraws = 0
+        while len(vins) < count:
+            if redraws == MAX_VIN_REDRAWS:
+                raise RuntimeError(
+                    f"The VIN registry is saturated: {count - len(vins)} VINs were still rejected after "
+                    f"{MAX_VIN_REDRAWS} redraws. Size it for more than {registry.capacity} VINs."
+                )
+            vins += registry.claim(_draw_vins(count - len(vins), use_wmi))
+            redraws += 1
+    return vins
+
+
+def _draw_vins(count: int, use_wmi: bool) -> list[str]:
+    """Draw a column of random VINs with valid ISO 3779 check digits.
+
+    :param count: The number of VINs to draw.
+    :param use_wmi: Draw the first three characters from WMI_CODES instead of random characters.
+    :return: A list of strings representing VINs.
+    """
+    chars = fake.random.choices(VIN_ALPHABET, k=16 * count)
+    columns = [chars[position::16] for position in range(16)]
+    if use_wmi:
+        columns[0:3] = zip(*fake.random.choices(WMI_CODES, k=count))
 
-    return vin
+    weighted_columns = (map(values.__getitem__, column) for values, column in zip(_WEIGHTED_VALUES, columns))
+    check_digits = [_CHECK_DIGITS[total % 11] for total in map(sum, zip(*weighted_columns))]
+    heads = map("".join, zip(*columns[:8]))
+    tails = map("".join, zip(*columns[8:]))
+    return [head + check + tail for head, check, tail in zip(heads, check_digits, tails)]
@@ -0,0 +1,179 @@
+"""Module provides a compact fixed-width binary file format for datasets of fake car insurance data.
+
+Every record takes the same number of bytes, so record i starts at HEADER.size + i * RECORD.size and
+a memory-mapped file can be read at any index without touching the rest. Text fields are stored as
+NUL-padded UTF-8 of a fixed width (longer values are truncated, see FIELD_WIDTHS), and dates as
+unsigned 32-bit ordinals.
+
+Usage::
+
+    python -m src.export --count 1000000 --seed 42 --format fixed --out data.cidg
+    CAR_INSURANCE_DATASET=data.cidg uvicorn main:app
+"""
+
+import mmap
+import struct
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from src.insurance import format_date
+from src.record import InsuranceBatch, InsuranceRecord
+
+# Magic bytes identifying a dataset file
+MAGIC = b"CIDG"
+
+# Version of the file format; bumped whenever FIELD_WIDTHS or the layout changes
+FORMAT_VERSION = 1
+
+# Maximum number of UTF-8 bytes stored per text field, in InsuranceRecord field order
+FIELD_WIDTHS = {
+    "policy_number": 13,
+    "first_name": 24,
+    "last_name": 48,
+    "address": 96,
+    "phone": 20,
+    "vin": 17,
+}
+
+# Magic, format version, record size and record count
+HEADER = struct.Struct("<4sHHQ")
+
+# Policy number, first name, last name, birth date, address, phone, VIN, start date, end date
+RECORD = struct.Struct("<{policy_number}s{first_name}s{last_name}sI{address}s{phone}s{vin}sII".format_map(FIELD_WIDTHS))
+
+
+@lru_cache(maxsize=2**16)
+def _date_ordinal(text: str) -> int:
+    """Convert a date in MM/DD/YYYY format into its proleptic Gregorian ordinal.
+
+    :param text: A string representing a date in MM/DD/YYYY format.
+    :return: The ordinal of the date.
+    """
+    return date(int(text[6:10]), int(text[0:2]), int(text[3:5])).toordinal()
+
+
+def _decode(field: bytes) -> str:
+    """Decode a NUL-padded text field, dropping a character cut in half by truncation.
+
+    :param field: The raw bytes of the field.
+    :return: The text of the field.
+    """
+    return field.rstrip(b"\0").decode("utf-8", "ignore")
+
+
+class FixedWidthWriter:
+    """Writer of records to a fixed-width dataset file.
+
+    The record count in the header is written when the writer is closed.
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "wb", buffering=1024 * 1024)
+        self._count = 0
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, 0))
+
+    def write(self, batch: InsuranceBatch) -> None:
+        """Write a batch of records.
+
+        :param batch: A batch of fake car insurance data.
+        """
+        encode, ordinal = str.encode, _date_ordinal
+        packed = map(
+            RECORD.pack,
+            map(encode, batch.policy_number),
+            map(encode, batch.first_name),
+            map(encode, batch.last_name),
+            map(ordinal, batch.birth_date),
+            map(encode, batch.address),
+            map(encode, batch.phone),
+            map(encode, batch.vin),
+            map(ordinal, batch.start_date),
+            map(ordinal, batch.end_date),
+        )
+        self._file.write(b"".join(packed))
+        self._count += len(batch)
+
+    def close(self) -> None:
+        """Write the record count into the header and close the file."""
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, self._count))
+        self._file.close()
+
+
+class FixedWidthDataset:
+    """Memory-mapped reader of a fixed-width dataset file with O(1) access by record index."""
+
+    def __init__(self, path: Path):
+        """Open and memory-map a dataset file.
+
+        :param path: The path of the dataset file.
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not a dataset file.")
+        magic, version, record_size, count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not a dataset file of format version {FORMAT_VERSION}.")
+        if len(self._mmap) < HEADER.size + count * RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is truncated.")
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> InsuranceRecord:
+        """Decode a single record.
+
+        :param index: The index of the record; negative indexes count from the end.
+        :return: The record.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Record index out of range.")
+        return self._decode_record(RECORD.unpack_from(self._mmap, HEADER.size + index * RECORD.size))
+
+    def records(self, start: int, stop: int) -> list[InsuranceRecord]:
+        """Decode a range of records with one pass over a slice of the file.
+
+        :param start: The index of the first record.
+        :param stop: The index after the last record; clamped to the number of records.
+        :return: A list of records, empty when the range is empty.
+        """
+        start, stop = max(start, 0), min(stop, self._count)
+        if start >= stop:
+            return []
+        view = memoryview(self._mmap)[HEADER.size + start * RECORD.size : HEADER.size + stop * RECORD.size]
+        try:
+            return [self._decode_record(fields) for fields in RECORD.iter_unpack(view)]
+        finally:
+            view.release()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    @staticmethod
+    def _decode_record(fields: tuple) -> InsuranceRecord:
+        """Build a record from the unpacked fields of the file.
+
+        :param fields: The fields as unpacked by RECORD.
+        :return: The record.
+        """
+        policy_number, first_name, last_name, birth_date, address, phone, vin, start_date, end_date = fields
+        return InsuranceRecord(
+            _decode(policy_number),
+            _decode(first_name),
+            _decode(last_name),
+            format_date(birth_date),
+            _decode(address),
+            _decode(phone),
+            _decode(vin),
+            format_date(start_date),
+            format_date(end_date),
+        )
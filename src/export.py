@@ -0,0 +1,160 @@
+"""Module provides a command line tool to export large fake car insurance datasets to files.
+
+Columnar batches from the parallel generator are streamed straight to a buffered writer, so only a few
+batches are held in memory regardless of the dataset size.
+
+Usage::
+
+    python -m src.export --count 10000000 --format parquet --workers 8 --out data.parquet
+"""
+
+import csv
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+from src.dataset import FixedWidthWriter
+from src.parallel import add_generation_arguments, generate_from_arguments
+from src.record import InsuranceBatch
+from src.serialization import encode_ndjson
+
+# Columns of a flattened record, in InsuranceRecord field order
+COLUMNS = (
+    "policy_number",
+    "owner_first_name",
+    "owner_last_name",
+    "owner_birth_date",
+    "owner_address",
+    "owner_phone",
+    "car_vin",
+    "insurance_start_date",
+    "insurance_end_date",
+)
+
+# Number of rows in a single Parquet row group
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+# Size of the write buffer of the output file
+BUFFER_SIZE = 1024 * 1024
+
+
+class CsvWriter:
+    """Writer of flattened records to a CSV file with a header row."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write(self, batch: InsuranceBatch) -> None:
+        """Write a batch of records.
+
+        :param batch: A batch of fake car insurance data.
+        """
+        self._writer.writerows(batch.rows())
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class NdjsonWriter:
+    """Writer of nested records to a newline-delimited JSON file."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "wb", buffering=BUFFER_SIZE)
+
+    def write(self, batch: InsuranceBatch) -> None:
+        """Write a batch of records.
+
+        :param batch: A batch of fake car insurance data.
+        """
+        self._file.write(encode_ndjson(batch))
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writer of flattened records to a Parquet file, one row group per PARQUET_ROW_GROUP_SIZE rows.
+
+    Requires the optional pyarrow dependency (install the 'parquet' extra).
+    """
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow; install it with the 'parquet' extra.") from e
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(column, pyarrow.string()) for column in COLUMNS])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._columns: list[list[str]] = [[] for _ in COLUMNS]
+
+    def write(self, batch: InsuranceBatch) -> None:
+        """Buffer a batch of records and write a row group once enough rows are buffered.
+
+        :param batch: A batch of fake car insurance data.
+        """
+        for buffered, column in zip(self._columns, batch.columns(), strict=True):
+            buffered += column
+        if len(self._columns[0]) >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered rows as one row group."""
+        if self._columns[0]:
+            arrays = [self._pyarrow.array(column, self._pyarrow.string()) for column in self._columns]
+            self._writer.write_table(self._pyarrow.Table.from_arrays(arrays, schema=self._schema))
+            self._columns = [[] for _ in COLUMNS]
+
+    def close(self) -> None:
+        """Write the remaining rows and close the file."""
+        self._flush()
+        self._writer.close()
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "fixed": FixedWidthWriter,
+    "ndjson": NdjsonWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Export fake car insurance data to a CSV, NDJSON, Parquet or fixed-width file and print the throughput.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    """
+    parser = ArgumentParser(description="Export fake car insurance data to a file.")
+    add_generation_arguments(parser)
+    parser.add_argument("--format", choices=sorted(WRITERS), required=True, help="output file format")
+    parser.add_argument("--out", type=Path, required=True, help="path of the output file")
+    args = parser.parse_args(argv)
+
+    started = perf_counter()
+    rows = 0
+    writer = WRITERS[args.format](args.out)
+    try:
+        for batch in generate_from_arguments(args):
+            writer.write(batch)
+            rows += len(batch)
+    finally:
+        writer.close()
+
+    elapsed = perf_counter() - started
+    megabytes = args.out.stat().st_size / 1_000_000
+    print(
+        f"Wrote {rows} rows ({megabytes:.1f} MB) to '{args.out}' in {elapsed:.2f} s: "
+        f"{rows / elapsed:.0f} rows/s, {megabytes / elapsed:.2f} MB/s.",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
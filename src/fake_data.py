@@ -1,30 +1,234 @@
 """Module provides function to generate fake car insurance data."""
 
-from src.car import generate_vin
-from src.insurance import generate_end_date, generate_start_date
-from src.owner import generate_address, generate_birthdate, generate_first_name, generate_last_name, generate_phone
-from src.policy_number import generate_policy_number
+from collections.abc import Sequence
+from dataclasses import fields
+from datetime import date
 
+from src.car import generate_vin, generate_vin_batch
+from src.insurance import generate_end_date, generate_policy_period_batch, generate_start_date
+from src.locales import normalize_locales
+from src.metrics import FIELD_TIMINGS
+from src.owner import (
+    generate_address,
+    generate_address_batch,
+    generate_birthdate,
+    generate_birthdate_batch,
+    generate_first_name,
+    generate_first_name_batch,
+    generate_last_name,
+    generate_last_name_batch,
+    generate_phone,
+    generate_phone_batch,
+)
+from src.policy_number import generate_policy_number, generate_policy_number_batch
+from src.record import InsuranceBatch
+from src.singleton import FakerSingleton
+from src.unique import UniqueKeys
 
-def generate_fake_data():
+
+def generate_fake_data(seed: int | None = None, locale: str | Sequence[str] | None = None):
     """Generate fake car insurance data.
 
+    :param seed: The seed value that makes the generated data reproducible (optional).
+    :param locale: The locale of the record, or a list of locales to pick it from (optional).
     :return: A dictionary containing fake car insurance data.
     """
+    locales = normalize_locales(locale)
+    with FakerSingleton.seeded(seed) as seeded_fake:
+        if locales is None:
+            return _generate_record()
+        locale = seeded_fake.random.choice(locales)
+        with FakerSingleton.localized(locale), FakerSingleton.seeded(seeded_fake.random.getrandbits(64)):
+            return _generate_record(locale)
+
+
+def _generate_record(locale: str | None = None) -> dict:
+    """Generate a single record of fake car insurance data with the current random state.
+
+    :param locale: The locale of the record, or None for the default locale.
+    :return: A dictionary containing fake car insurance data.
+    """
+    # Read the clock once, so the start and end dates cannot straddle midnight
+    as_of = date.today()
+    timer = FIELD_TIMINGS.timer()
+    with timer("policy_number"):
+        policy_number = generate_policy_number(locale)
+    with timer("first_name"):
+        first_name = generate_first_name(locale)
+    with timer("last_name"):
+        last_name = generate_last_name(locale)
+    with timer("birth_date"):
+        birth_date = generate_birthdate()
+    with timer("address"):
+        address = generate_address(locale)
+    with timer("phone"):
+        phone = generate_phone(locale)
+    with timer("vin"):
+        vin = generate_vin()
+    with timer("start_date"):
+        start_date = generate_start_date(as_of)
+    with timer("end_date"):
+        end_date = generate_end_date(as_of)
     return {
-        "policy_number": generate_policy_number(),
+        "policy_number": policy_number,
         "owner": {
-            "first_name": generate_first_name(),
-            "last_name": generate_last_name(),
-            "birth_date": generate_birthdate(),
-            "address": generate_address(),
-            "phone": generate_phone(),
+            "first_name": first_name,
+            "last_name": last_name,
+            "birth_date": birth_date,
+            "address": address,
+            "phone": phone,
         },
         "car": {
-            "vin": generate_vin(),
+            "vin": vin,
         },
         "insurance": {
-            "start_date": generate_start_date(),
-            "end_date": generate_end_date(),
+            "start_date": start_date,
+            "end_date": end_date,
         },
     }
+
+
+def generate_fake_data_batch(
+    count: int,
+    seed: int | None = None,
+    pooled: bool = False,
+    as_of: date | None = None,
+    window_days: int = 0,
+    unique: UniqueKeys | None = None,
+    locale: str | Sequence[str] | None = None,
+) -> list[dict]:
+    """Generate a batch of fake car insurance data.
+
+    The batch is generated column-wise by generate_insurance_batch() and converted into records with
+    the same structure as generate_fake_data() returns.
+
+    :param count: The number of records to generate.
+    :param seed: The seed value that makes the generated batch reproducible (optional).
+    :param pooled: Sample names and addresses from precomputed value pools (see src.pools).
+    :param as_of: The latest insurance start date, shared by the whole batch (default is today).
+    :param window_days: The number of days before as_of insurance start dates are spread over (default is 0).
+    :param unique: The uniqueness state that keeps policy numbers and VINs unique across batches (optional).
+    :param locale: The locale of the records, or a list of locales to mix (optional, see generate_insurance_batch).
+    :return: A list of dictionaries containing fake car insurance data.
+    """
+    return generate_insurance_batch(count, seed, pooled, as_of, window_days, unique, locale).to_dicts()
+
+
+def generate_insurance_batch(
+    count: int,
+    seed: int | None = None,
+    pooled: bool = False,
+    as_of: date | None = None,
+    window_days: int = 0,
+    unique: UniqueKeys | None = None,
+    locale: str | Sequence[str] | None = None,
+) -> InsuranceBatch:
+    """Generate a batch of fake car insurance data in the compact columnar representation.
+
+    Every field is generated column-at-a-time for the whole batch, and the columns are stored as they
+    are, without building a dictionary per record. With a list of locales every row is assigned one
+    of them at random (repeat a locale to weight it), and the rows of each locale are generated
+    together as one group with that locale's Faker instance. The birthdates and the insurance dates are
+    relative to as_of, so a seeded batch is only reproducible across days when as_of is given.
+
+    :param count: The number of records to generate.
+    :param seed: The seed value that makes the generated batch reproducible (optional).
+    :param pooled: Sample names and addresses from precomputed value pools (see src.pools).
+    :param as_of: The latest insurance start date, shared by the whole batch (default is today).
+    :param window_days: The number of days before as_of insurance start dates are spread over (default is 0).
+    :param unique: The uniqueness state that keeps policy numbers and VINs unique across batches (optional).
+    :param locale: The locale of the records, or a list of locales to mix (optional).
+    :return: An InsuranceBatch holding one list per field.
+    """
+    # Ensure that count is a positive integer
+    if not isinstance(count, int) or isinstance(count, bool):
+        raise TypeError("Count must be an integer.")
+    if count < 1:
+        raise ValueError("Count must be a positive integer.")
+
+    locales = normalize_locales(locale)
+    with FakerSingleton.seeded(seed):
+        if locales is None:
+            return _generate_batch(count, pooled, as_of or date.today(), window_days, unique)
+        return _generate_localized_batch(count, locales, pooled, as_of or date.today(), window_days, unique)
+
+
+def _generate_localized_batch(
+    count: int, locales: list[str], pooled: bool, as_of: date, window_days: int, unique: UniqueKeys | None
+) -> InsuranceBatch:
+    """Generate a batch of fake car insurance data of one or more locales with the current random state.
+
+    Rows are assigned to locales up front, every locale generates its rows as one column-wise group with
+    its own Faker instance seeded from the current random state, and the groups are scattered back into
+    the assigned rows.
+
+    :param count: The number of records to generate.
+    :param locales: The locales to assign the rows to.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param as_of: The latest insurance start date.
+    :param window_days: The number of days before as_of insurance start dates are spread over.
+    :param unique: The uniqueness state of policy numbers and VINs, or None.
+    :return: An InsuranceBatch holding one list per field.
+    """
+    random = FakerSingleton.get_instance().random
+    distinct = list(dict.fromkeys(locales))
+    if len(distinct) == 1:
+        with FakerSingleton.localized(distinct[0]), FakerSingleton.seeded(random.getrandbits(64)):
+            return _generate_batch(count, pooled, as_of, window_days, unique, distinct[0])
+
+    rows: dict[str, list[int]] = {name: [] for name in distinct}
+    for row, slot in enumerate(random.choices(range(len(locales)), k=count)):
+        rows[locales[slot]].append(row)
+    columns: list[list] = [[None] * count for _ in fields(InsuranceBatch)]
+    for name, group_rows in rows.items():
+        if not group_rows:
+            continue
+        with FakerSingleton.localized(name), FakerSingleton.seeded(random.getrandbits(64)):
+            group = _generate_batch(len(group_rows), pooled, as_of, window_days, unique, name)
+        for column, values in zip(columns, group.columns(), strict=True):
+            for row, value in zip(group_rows, values, strict=True):
+                column[row] = value
+    return InsuranceBatch(*columns)
+
+
+def _generate_batch(
+    count: int, pooled: bool, as_of: date, window_days: int, unique: UniqueKeys | None, locale: str | None = None
+) -> InsuranceBatch:
+    """Generate a batch of fake car insurance data column-wise with the current random state.
+
+    :param count: The number of records to generate.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param as_of: The latest insurance start date.
+    :param window_days: The number of days before as_of insurance start dates are spread over.
+    :param unique: The uniqueness state of policy numbers and VINs, or None.
+    :param locale: The locale of the records, or None for the default locale.
+    :return: An InsuranceBatch holding one list per field.
+    """
+    timer = FIELD_TIMINGS.timer()
+    with timer("policy_period"):
+        start_dates, end_dates = generate_policy_period_batch(count, as_of, window_days)
+    with timer("policy_number"):
+        policy_numbers = generate_policy_number_batch(count, unique and unique.policy_numbers, locale)
+    with timer("first_name"):
+        first_names = generate_first_name_batch(count, pooled, locale)
+    with timer("last_name"):
+        last_names = generate_last_name_batch(count, pooled, locale)
+    with timer("birth_date"):
+        birth_dates = generate_birthdate_batch(count, as_of=as_of)
+    with timer("address"):
+        addresses = generate_address_batch(count, pooled, locale)
+    with timer("phone"):
+        phones = generate_phone_batch(count, locale)
+    with timer("vin"):
+        vins = generate_vin_batch(count, registry=unique and unique.vins)
+    return InsuranceBatch(
+        policy_number=policy_numbers,
+        first_name=first_names,
+        last_name=last_names,
+        birth_date=birth_dates,
+        address=addresses,
+        phone=phones,
+        vin=vins,
+        start_date=start_dates,
+        end_date=end_dates,
+    )
@@ -1,24 +1,75 @@
 """Module provides functions to generate data for insurance part in fake car insurance data."""
 
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
 
 from src.singleton import FakerSingleton
 
-fake = FakerSingleton.get_instance()
+fake = FakerSingleton.proxy()
 
+# Format of all dates in fake car insurance data
+DATE_FORMAT = "%m/%d/%Y"
 
-def generate_start_date() -> str:
+# Length of an insurance policy period in days
+POLICY_TERM_DAYS = 365
+
+
+@lru_cache(maxsize=2**16)
+def format_date(ordinal: int) -> str:
+    """Format a date given as a proleptic Gregorian ordinal in MM/DD/YYYY format.
+
+    Every distinct date is formatted only once and then served from the cache.
+
+    :param ordinal: The ordinal of the date, as returned by date.toordinal().
+    :return: A string representing the date in MM/DD/YYYY format.
+    """
+    return date.fromordinal(ordinal).strftime(DATE_FORMAT)
+
+
+def generate_start_date(as_of: date | None = None) -> str:
     """This function returns the start date of car insurance in MM/DD/YYYY format.
 
+    :param as_of: The date the insurance starts on (default is today).
     :return: A string representing the start date of car insurance in MM/DD/YYYY format.
     """
-    return datetime.now().strftime("%m/%d/%Y")
+    as_of = as_of or date.today()
+    return format_date(as_of.toordinal())
 
 
-def generate_end_date() -> str:
+def generate_end_date(as_of: date | None = None) -> str:
     """This function returns the end date of car insurance in MM/DD/YYYY format.
 
+    :param as_of: The date the insurance starts on (default is today).
     :return:  string representing the end date of car insurance in MM/DD/YYYY format.
     """
-    next_year_date = datetime.now() + timedelta(days=365)
-    return next_year_date.strftime("%m/%d/%Y")
+    as_of = as_of or date.today()
+    return format_date(as_of.toordinal() + POLICY_TERM_DAYS)
+
+
+def generate_policy_period_batch(
+    count: int, as_of: date | None = None, window_days: int = 0, term_days: int = POLICY_TERM_DAYS
+) -> tuple[list[str], list[str]]:
+    """Generate columns of car insurance start and end dates in MM/DD/YYYY format.
+
+    Start dates are spread uniformly over the window_days days up to and including as_of, e.g. to
+    simulate the renewals of the past three years. Start offsets are drawn as integer day offsets in
+    one bulk call, and each distinct date is formatted once through format_date().
+
+    :param count: The number of policy periods to generate.
+    :param as_of: The latest possible start date, shared by the whole batch (default is today).
+    :param window_days: The number of days before as_of start dates are spread over (default is 0).
+    :param term_days: The length of a policy period in days (default is 365).
+    :return: A tuple of the start date column and the end date column.
+    """
+    if not isinstance(window_days, int) or window_days < 0:
+        raise ValueError("Window days must be a non-negative integer.")
+
+    as_of_ordinal = (as_of or date.today()).toordinal()
+    if window_days == 0:
+        return [format_date(as_of_ordinal)] * count, [format_date(as_of_ordinal + term_days)] * count
+
+    offsets = fake.random.choices(range(window_days + 1), k=count)
+    start_ordinals = [as_of_ordinal - offset for offset in offsets]
+    start_dates = list(map(format_date, start_ordinals))
+    end_dates = [format_date(ordinal + term_days) for ordinal in start_ordinals]
+    return start_dates, end_dates
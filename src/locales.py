@@ -0,0 +1,83 @@
+"""Module provides the locale-specific formats of phone numbers and policy numbers.
+
+Names, birthdates and addresses come from the Faker instance of a locale (see
+FakerSingleton.localized()); the formats of the fields Faker does not provide are defined here.
+"""
+
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import NamedTuple
+
+
+class LocaleFormat(NamedTuple):
+    """Formats of the locale-specific fields of fake car insurance data.
+
+    Phone numbers are rendered as '+<country_code> <prefix><group> <group> ...', where the prefix is
+    drawn from phone_prefixes and every group has the given number of digits. Groups of more than one
+    digit never start with zero.
+    """
+
+    policy_prefix: str
+    country_code: str
+    phone_prefixes: tuple[str, ...]
+    phone_groups: tuple[int, ...]
+
+    @property
+    def phone_template(self) -> str:
+        """The str.format() template of phone numbers, filled with the prefix and the digit groups.
+
+        :return: The template, e.g. '+48 {}{} {} {}'.
+        """
+        return f"+{self.country_code} {{}}{{}}" + " {}" * (len(self.phone_groups) - 1)
+
+
+LOCALE_FORMATS = {
+    "pl_PL": LocaleFormat(
+        "PL", "48", ("45", "50", "51", "53", "57", "60", "66", "69", "72", "73", "78", "79", "88"), (1, 3, 3)
+    ),
+    "en_US": LocaleFormat(
+        "US", "1", ("20", "21", "30", "31", "41", "50", "51", "60", "61", "70", "71", "80", "81", "91"), (1, 3, 4)
+    ),
+    "en_GB": LocaleFormat("GB", "44", ("73", "74", "75", "77", "78", "79"), (2, 6)),
+    "de_DE": LocaleFormat("DE", "49", ("15", "16", "17"), (1, 8)),
+    "fr_FR": LocaleFormat("FR", "33", ("6", "7"), (0, 2, 2, 2, 2)),
+    "es_ES": LocaleFormat("ES", "34", ("60", "61", "62", "63", "64", "65", "66", "67", "68", "69"), (1, 3, 3)),
+    "it_IT": LocaleFormat("IT", "39", ("32", "33", "34", "35", "36", "37", "38", "39"), (1, 3, 4)),
+    "nl_NL": LocaleFormat("NL", "31", ("6",), (0, 8)),
+}
+
+# Formats used when no locale is requested: Polish phone and policy numbers with default Faker names
+DEFAULT_LOCALE_FORMAT = LOCALE_FORMATS["pl_PL"]
+
+# The supported locales, e.g. for validating API parameters
+Locale = StrEnum("Locale", {locale: locale for locale in LOCALE_FORMATS})
+
+
+def get_locale_format(locale: str | None) -> LocaleFormat:
+    """Get the formats of a locale.
+
+    :param locale: The locale, e.g. 'de_DE', or None for the default formats.
+    :return: The formats of the locale.
+    """
+    if locale is None:
+        return DEFAULT_LOCALE_FORMAT
+    try:
+        return LOCALE_FORMATS[locale]
+    except KeyError:
+        raise ValueError(f"Locale '{locale}' is not supported; use one of {', '.join(LOCALE_FORMATS)}.") from None
+
+
+def normalize_locales(locale: str | Sequence[str] | None) -> list[str] | None:
+    """Validate a locale or a list of locales.
+
+    :param locale: A locale, a list of locales to mix, or None for the default locale.
+    :return: A list of supported locales, or None for the default locale.
+    """
+    if locale is None:
+        return None
+    locales = [locale] if isinstance(locale, str) else list(locale)
+    if not locales:
+        raise ValueError("At least one locale must be given.")
+    for name in locales:
+        get_locale_format(name)
+    return locales
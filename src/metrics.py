@@ -0,0 +1,386 @@
+"""Module provides lightweight counters, histograms and the per-field timing instrumentation.
+
+Metrics are kept in process memory and rendered in the Prometheus text exposition format by
+render_metrics(). Per-field timing of the generators is opt-in: it is enabled by setting the
+CAR_INSURANCE_FIELD_TIMING environment variable to 1, or by calling FIELD_TIMINGS.enable(). While it is
+disabled, a generator pays for one flag check per record or batch and an empty with block per field.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from threading import Lock
+from time import perf_counter
+from typing import ContextManager
+
+# Upper bounds of the latency histogram buckets in seconds
+DURATION_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+# Prefix of every exported metric name
+METRIC_PREFIX = "car_insurance"
+
+# Shared no-op context manager returned while field timing is disabled
+_UNTIMED = nullcontext()
+
+
+class Counter:
+    """A thread-safe counter with one value per label set."""
+
+    __slots__ = ("name", "help", "label_names", "_values", "_lock")
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()):
+        """Initialize the counter.
+
+        :param name: The metric name without the common prefix.
+        :param description: The description of the metric.
+        :param label_names: The names of the labels that distinguish the values.
+        """
+        self.name = name
+        self.help = description
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        """Increase the value of a label set.
+
+        :param amount: The amount to add.
+        :param labels: The label values, in the order of label_names.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the value of a label set.
+
+        :param labels: The label values, in the order of label_names.
+        :return: The current value, 0 if the label set was never increased.
+        """
+        return self._values.get(labels, 0)
+
+    def reset(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> Iterator[str]:
+        """Render the counter in the Prometheus text format.
+
+        :return: An iterator over lines.
+        """
+        name = f"{METRIC_PREFIX}_{self.name}"
+        yield f"# HELP {name} {self.help}"
+        yield f"# TYPE {name} counter"
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{name}{_format_labels(zip(self.label_names, labels))} {_format_value(value)}"
+
+
+class Gauge:
+    """A gauge holding a single value that can go up and down."""
+
+    __slots__ = ("name", "help", "_value")
+
+    def __init__(self, name: str, description: str):
+        """Initialize the gauge.
+
+        :param name: The metric name without the common prefix.
+        :param description: The description of the metric.
+        """
+        self.name = name
+        self.help = description
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the value of the gauge.
+
+        :param value: The new value.
+        """
+        self._value = value
+
+    def value(self) -> float:
+        """Return the value of the gauge.
+
+        :return: The current value.
+        """
+        return self._value
+
+    def render(self) -> Iterator[str]:
+        """Render the gauge in the Prometheus text format.
+
+        :return: An iterator over lines.
+        """
+        name = f"{METRIC_PREFIX}_{self.name}"
+        yield f"# HELP {name} {self.help}"
+        yield f"# TYPE {name} gauge"
+        yield f"{name} {_format_value(self._value)}"
+
+
+class Histogram:
+    """A thread-safe histogram of durations with one series per label set."""
+
+    __slots__ = ("name", "help", "label_name", "buckets", "_series", "_lock")
+
+    def __init__(self, name: str, description: str, label_name: str, buckets: tuple[float, ...] = DURATION_BUCKETS):
+        """Initialize the histogram.
+
+        :param name: The metric name without the common prefix.
+        :param description: The description of the metric.
+        :param label_name: The name of the label that distinguishes the series.
+        :param buckets: The upper bounds of the buckets in ascending order.
+        """
+        self.name = name
+        self.help = description
+        self.label_name = label_name
+        self.buckets = buckets
+        # label -> [bucket counts..., count, sum]
+        self._series: dict[str, list[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, label: str, value: float) -> None:
+        """Record an observation.
+
+        :param label: The label value of the series.
+        :param value: The observed value.
+        """
+        with self._lock:
+            series = self._series.get(label)
+            if series is None:
+                series = self._series[label] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += 1
+            series[-1] += value
+
+    def count(self, label: str) -> int:
+        """Return the number of observations of a series.
+
+        :param label: The label value of the series.
+        :return: The number of observations, 0 if the series is empty.
+        """
+        series = self._series.get(label)
+        return int(series[-2]) if series else 0
+
+    def total(self, label: str) -> float:
+        """Return the sum of the observations of a series.
+
+        :param label: The label value of the series.
+        :return: The cumulative observed value, 0 if the series is empty.
+        """
+        series = self._series.get(label)
+        return series[-1] if series else 0.0
+
+    def reset(self) -> None:
+        """Remove all series."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> Iterator[str]:
+        """Render the histogram in the Prometheus text format.
+
+        :return: An iterator over lines.
+        """
+        name = f"{METRIC_PREFIX}_{self.name}"
+        yield f"# HELP {name} {self.help}"
+        yield f"# TYPE {name} histogram"
+        with self._lock:
+            series = sorted((label, list(values)) for label, values in self._series.items())
+        for label, values in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, values, strict=False):
+                cumulative += bucket_count
+                labels = _format_labels([(self.label_name, label), ("le", _format_value(bound))])
+                yield f"{name}_bucket{labels} {cumulative}"
+            labels = _format_labels([(self.label_name, label), ("le", "+Inf")])
+            yield f"{name}_bucket{labels} {int(values[-2])}"
+            yield f"{name}_sum{_format_labels([(self.label_name, label)])} {_format_value(values[-1])}"
+            yield f"{name}_count{_format_labels([(self.label_name, label)])} {int(values[-2])}"
+
+
+class FieldTimings:
+    """Opt-in timing of the field generators."""
+
+    __slots__ = ("enabled", "histogram")
+
+    def __init__(self, enabled: bool = False):
+        """Initialize the field timings.
+
+        :param enabled: Whether the fields are timed from the start.
+        """
+        self.enabled = enabled
+        self.histogram = Histogram("field_duration_seconds", "Time spent generating or serializing a field.", "field")
+
+    def enable(self, enabled: bool = True) -> None:
+        """Enable or disable the timing of fields.
+
+        :param enabled: Whether the fields are timed.
+        """
+        self.enabled = enabled
+
+    def timer(self) -> Callable[[str], ContextManager]:
+        """Return the timer for a record or batch.
+
+        Callers fetch the timer once per record or batch, so the enabled flag is checked once and a
+        shared no-op context manager is used for every field while timing is disabled.
+
+        :return: A function that maps a field name to a context manager timing the block.
+        """
+        return self.measure if self.enabled else _untimed
+
+    @contextmanager
+    def measure(self, field: str) -> Iterator[None]:
+        """Time a block and record its duration under a field name.
+
+        :param field: The name of the field.
+        :return: A context manager timing the block.
+        """
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram.observe(field, perf_counter() - started)
+
+
+def _untimed(field: str) -> ContextManager:
+    """Return the shared no-op context manager used while field timing is disabled.
+
+    :param field: The name of the field (ignored).
+    :return: A context manager that does nothing.
+    """
+    return _UNTIMED
+
+
+def _format_labels(labels) -> str:
+    """Format label pairs for the Prometheus text format.
+
+    :param labels: An iterable of (name, value) pairs.
+    :return: The formatted labels, or an empty string when there are none.
+    """
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format.
+
+    :param value: The label value.
+    :return: The value with backslashes, double quotes and newlines escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format.
+
+    :param value: The value.
+    :return: The value without a trailing '.0' for whole numbers.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+FIELD_TIMINGS = FieldTimings(enabled=os.environ.get("CAR_INSURANCE_FIELD_TIMING") == "1")
+
+REQUESTS = Counter("requests_total", "Number of handled HTTP requests.", ("path", "status"))
+
+RECORDS_GENERATED = Counter("records_generated_total", "Number of generated records.", ("endpoint",))
+
+
+BUFFER_RECORDS_SERVED = Counter(
+    "buffer_records_served_total", "Number of records served by /generate, by source.", ("source",)
+)
+
+BUFFER_RECORDS_PRODUCED = Counter("buffer_records_produced_total", "Number of records produced into the buffer.")
+
+BUFFER_DEPTH = Gauge("buffer_depth", "Number of ready-to-serve records in the buffer.")
+
+BUFFER_CAPACITY = Gauge("buffer_capacity", "High watermark of the buffer; 0 when the buffer is disabled.")
+
+BUFFER_REFILL_RATE = Gauge("buffer_refill_records_per_second", "Throughput of the most recent buffer refill.")
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "response_cache_lookups_total", "Number of response cache lookups of seeded requests, by result.", ("result",)
+)
+
+RESPONSE_CACHE_EVICTIONS = Counter("response_cache_evictions_total", "Number of responses evicted from the cache.")
+
+RESPONSE_CACHE_BYTES = Gauge("response_cache_bytes", "Total size of the cached response bodies.")
+
+ADMISSION_IN_FLIGHT = Gauge("admission_records_in_flight", "Number of records of the admitted generation requests.")
+
+ADMISSION_QUEUE_DEPTH = Gauge("admission_queue_depth", "Number of generation requests waiting for admission.")
+
+ADMISSION_WAIT = Histogram(
+    "admission_wait_seconds", "Time generation requests waited for admission, by result.", "result"
+)
+
+ADMISSION_REJECTIONS = Counter(
+    "admission_rejections_total", "Number of generation requests rejected with 503, by reason.", ("reason",)
+)
+
+
+def render_metrics() -> str:
+    """Render all metrics in the Prometheus text exposition format.
+
+    :return: The metrics as text.
+    """
+    lines = [
+        *REQUESTS.render(),
+        *RECORDS_GENERATED.render(),
+        *FIELD_TIMINGS.histogram.render(),
+        *BUFFER_RECORDS_SERVED.render(),
+        *BUFFER_RECORDS_PRODUCED.render(),
+        *BUFFER_DEPTH.render(),
+        *BUFFER_CAPACITY.render(),
+        *BUFFER_REFILL_RATE.render(),
+        *RESPONSE_CACHE_LOOKUPS.render(),
+        *RESPONSE_CACHE_EVICTIONS.render(),
+        *RESPONSE_CACHE_BYTES.render(),
+        *ADMISSION_IN_FLIGHT.render(),
+        *ADMISSION_QUEUE_DEPTH.render(),
+        *ADMISSION_WAIT.render(),
+        *ADMISSION_REJECTIONS.render(),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware that counts HTTP requests by route and status code.
+
+    Requests are labelled with the route template (e.g. '/generate') rather than the raw path, so
+    the number of series stays bounded; requests that match no route are labelled 'unmatched'.
+    """
+
+    def __init__(self, app):
+        """Initialize the middleware.
+
+        :param app: The ASGI application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Handle an ASGI call and count it once the response has started.
+
+        :param scope: The ASGI connection scope.
+        :param receive: The ASGI receive channel.
+        :param send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            REQUESTS.inc(1, getattr(route, "path", "unmatched"), status)
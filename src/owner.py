@@ -1,24 +1,36 @@
 """Module provides functions to generate data for owner part in fake car insurance data."""
 
+from datetime import date
+from functools import lru_cache
+
+from src.locales import DEFAULT_LOCALE_FORMAT, get_locale_format
+from src.pools import get_pool
 from src.singleton import FakerSingleton
 
-fake = FakerSingleton.get_instance()
+fake = FakerSingleton.proxy()
+
+# Mobile prefixes of the default (Polish) phone number format
+PHONE_PREFIXES = DEFAULT_LOCALE_FORMAT.phone_prefixes
 
 
-def generate_first_name() -> str:
+def generate_first_name(locale: str | None = None) -> str:
     """Generate a realistic first name.
 
+    :param locale: The locale of the name, e.g. 'de_DE' (default is the current instance's locale).
     :return: A string representing a first name.
     """
-    return fake.first_name()
+    with FakerSingleton.localized(locale) as localized_fake:
+        return localized_fake.first_name()
 
 
-def generate_last_name() -> str:
+def generate_last_name(locale: str | None = None) -> str:
     """Generate a realistic last name.
 
+    :param locale: The locale of the name, e.g. 'de_DE' (default is the current instance's locale).
     :return: A string representing a last name.
     """
-    return fake.last_name()
+    with FakerSingleton.localized(locale) as localized_fake:
+        return localized_fake.last_name()
 
 
 def generate_birthdate(minimum_age: int = 18, maximum_age: int = 63) -> str:
@@ -28,6 +40,21 @@ def generate_birthdate(minimum_age: int = 18, maximum_age: int = 63) -> str:
     :param maximum_age: The maximum age of the person (default is 63).
     :return: A string representing the birthdate in the format 'mm/dd/yyyy'.
     """
+    _validate_age_range(minimum_age, maximum_age)
+
+    # Generate a random birthdate within the specified age range
+    birth_date = fake.date_of_birth(minimum_age=minimum_age, maximum_age=maximum_age)
+
+    # Convert the date to the 'mm/dd/yyyy' string format
+    return birth_date.strftime("%m/%d/%Y")
+
+
+def _validate_age_range(minimum_age: int, maximum_age: int) -> None:
+    """Validate the age range of a person.
+
+    :param minimum_age: The minimum age of the person.
+    :param maximum_age: The maximum age of the person.
+    """
     # Ensure that minimum_age and maximum_age are integers
     if not isinstance(minimum_age, int) or not isinstance(maximum_age, int):
         raise TypeError("Both minimum_age and maximum_age must be integers.")
@@ -40,35 +67,160 @@ def generate_birthdate(minimum_age: int = 18, maximum_age: int = 63) -> str:
     if minimum_age > maximum_age:
         raise ValueError("Minimum age cannot be greater than maximum age.")
 
-    # Generate a random birthdate within the specified age range
-    birth_date = fake.date_of_birth(minimum_age=minimum_age, maximum_age=maximum_age)
 
-    # Convert the date to the 'mm/dd/yyyy' string format
-    return birth_date.strftime("%m/%d/%Y")
+def _years_before(day: date, years: int) -> date:
+    """Shift a date back by a whole number of years, mapping February 29 to February 28.
+
+    :param day: The date to shift.
+    :param years: The number of years to shift the date back by.
+    :return: The shifted date.
+    """
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+def birthdate_window(as_of: date, minimum_age: int, maximum_age: int) -> tuple[int, int]:
+    """Calculate the window of birthdates of people within an age range.
+
+    The window runs from the day after the person turns maximum_age + 1 back to the day the person
+    turns minimum_age.
+
+    :param as_of: The date the ages are calculated at.
+    :param minimum_age: The minimum age of the person.
+    :param maximum_age: The maximum age of the person.
+    :return: A tuple of the ordinals of the earliest and the latest birthdate, inclusive.
+    """
+    return _years_before(as_of, maximum_age + 1).toordinal() + 1, _years_before(as_of, minimum_age).toordinal()
+
 
+@lru_cache(maxsize=8)
+def _birthdate_table(first_ordinal: int, last_ordinal: int) -> tuple[str, ...]:
+    """Build a lookup table of preformatted birthdates for a window of date ordinals.
 
-def generate_address() -> str:
+    :param first_ordinal: The ordinal of the earliest birthdate in the window.
+    :param last_ordinal: The ordinal of the latest birthdate in the window.
+    :return: A tuple of birthdates in the format 'mm/dd/yyyy', indexed by ordinal - first_ordinal.
+    """
+    return tuple(date.fromordinal(ordinal).strftime("%m/%d/%Y") for ordinal in range(first_ordinal, last_ordinal + 1))
+
+
+def generate_address(locale: str | None = None) -> str:
     """Generate a realistic address.
 
+    :param locale: The locale of the address, e.g. 'de_DE' (default is the current instance's locale).
     :return: A string representing an address.
     """
-    return fake.address().replace("\n", ", ")
+    with FakerSingleton.localized(locale) as localized_fake:
+        return localized_fake.address().replace("\n", ", ")
 
 
-def generate_phone() -> str:
-    """Generate a phone number in the format +48 xxx xxx xxx.
+def generate_phone(locale: str | None = None) -> str:
+    """Generate a phone number in the format +48 xxx xxx xxx, or in the format of a locale.
 
     The prefix (first two digits) is chosen from a predefined list, and the rest
     of the digits are generated randomly.
 
+    :param locale: The locale of the phone number format, e.g. 'de_DE' (default is the Polish format).
     :return: A string representing a phone number.
     """
-    prefixes = ["45", "50", "51", "53", "57", "60", "66", "69", "72", "73", "78", "79", "88"]
+    phone_format = get_locale_format(locale)
+    prefix = fake.random_element(phone_format.phone_prefixes)
+    groups = [
+        fake.random_digit() if digits == 1 else fake.random_number(digits=digits, fix_len=True) if digits else ""
+        for digits in phone_format.phone_groups
+    ]
+    return phone_format.phone_template.format(prefix, *groups)
+
+
+def generate_first_name_batch(count: int, pooled: bool = False, locale: str | None = None) -> list[str]:
+    """Generate a column of realistic first names.
+
+    :param count: The number of first names to generate.
+    :param pooled: Sample the names from a precomputed value pool instead of calling Faker per row.
+    :param locale: The locale of the names, e.g. 'de_DE' (default is the current instance's locale).
+    :return: A list of strings representing first names.
+    """
+    with FakerSingleton.localized(locale) as localized_fake:
+        if pooled:
+            return get_pool("first_name", locale).sample(localized_fake.random, count)
+        first_name = localized_fake.first_name
+        return [first_name() for _ in range(count)]
+
+
+def generate_last_name_batch(count: int, pooled: bool = False, locale: str | None = None) -> list[str]:
+    """Generate a column of realistic last names.
+
+    :param count: The number of last names to generate.
+    :param pooled: Sample the names from a precomputed value pool instead of calling Faker per row.
+    :param locale: The locale of the names, e.g. 'de_DE' (default is the current instance's locale).
+    :return: A list of strings representing last names.
+    """
+    with FakerSingleton.localized(locale) as localized_fake:
+        if pooled:
+            return get_pool("last_name", locale).sample(localized_fake.random, count)
+        last_name = localized_fake.last_name
+        return [last_name() for _ in range(count)]
+
 
-    prefix = fake.random_element(prefixes)
-    random_digit = fake.random_digit()
-    middle_digits = fake.random_number(digits=3, fix_len=True)
-    last_digits = fake.random_number(digits=3, fix_len=True)
+def generate_birthdate_batch(
+    count: int, minimum_age: int = 18, maximum_age: int = 63, as_of: date | None = None
+) -> list[str]:
+    """Generate a column of birthdates within the specified age range.
 
-    phone_number = f"+48 {prefix}{random_digit} {middle_digits} {last_digits}"
-    return phone_number
+    The age range is validated once per batch. Every birthdate in the window, from the day after the
+    person turns maximum_age + 1 back to the day the person turns minimum_age, is formatted once into a
+    cached lookup table, which is then sampled for the whole batch with one bulk call. The window moves
+    with as_of, so a seeded batch only repeats its birthdates for the same as_of; without it they
+    change from day to day.
+
+    :param count: The number of birthdates to generate.
+    :param minimum_age: The minimum age of the person (default is 18).
+    :param maximum_age: The maximum age of the person (default is 63).
+    :param as_of: The date the ages are calculated at (default is today).
+    :return: A list of strings representing birthdates in the format 'mm/dd/yyyy'.
+    """
+    _validate_age_range(minimum_age, maximum_age)
+
+    first_ordinal, last_ordinal = birthdate_window(as_of or date.today(), minimum_age, maximum_age)
+    return fake.random.choices(_birthdate_table(first_ordinal, last_ordinal), k=count)
+
+
+def generate_address_batch(count: int, pooled: bool = False, locale: str | None = None) -> list[str]:
+    """Generate a column of realistic addresses.
+
+    :param count: The number of addresses to generate.
+    :param pooled: Sample the addresses from a precomputed pool of composed addresses instead of
+        calling Faker per row.
+    :param locale: The locale of the addresses, e.g. 'de_DE' (default is the current instance's locale).
+    :return: A list of strings representing addresses.
+    """
+    with FakerSingleton.localized(locale) as localized_fake:
+        if pooled:
+            return get_pool("address", locale).sample(localized_fake.random, count)
+        address = localized_fake.address
+        return [address().replace("\n", ", ") for _ in range(count)]
+
+
+def generate_phone_batch(count: int, locale: str | None = None) -> list[str]:
+    """Generate a column of phone numbers in the format +48 xxx xxx xxx, or in the format of a locale.
+
+    Every part of the phone number is drawn for the whole batch with a single bulk call to the random generator.
+
+    :param count: The number of phone numbers to generate.
+    :param locale: The locale of the phone number format, e.g. 'de_DE' (default is the Polish format).
+    :return: A list of strings representing phone numbers.
+    """
+    phone_format = get_locale_format(locale)
+    choices = fake.random.choices
+    prefixes = choices(phone_format.phone_prefixes, k=count)
+    groups = [
+        choices(range(10), k=count) if digits == 1 else choices(range(10 ** (digits - 1), 10**digits), k=count)
+        for digits in phone_format.phone_groups
+        if digits
+    ]
+    if phone_format.phone_groups[0] == 0:
+        groups.insert(0, [""] * count)
+    render = phone_format.phone_template.format
+    return list(map(render, prefixes, *groups))
@@ -0,0 +1,201 @@
+"""Module provides reproducible generation of fake car insurance data across a process pool.
+
+A run is split into fixed-size shards, and every shard is generated from its own seed derived from
+the run seed and the shard index. The output therefore depends only on the seed, the count and the
+shard size, and is identical whether the shards are generated by one worker or by many. The only
+exception is unique mode with several workers: which draw loses a collision then depends on timing.
+
+Usage::
+
+    python -m src.parallel --count 1000000 --seed 42 --workers 8 > data.ndjson
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from hashlib import blake2b
+from random import SystemRandom
+
+from src.fake_data import generate_insurance_batch
+from src.locales import LOCALE_FORMATS, normalize_locales
+from src.record import InsuranceBatch
+from src.serialization import encode_ndjson
+from src.unique import UniqueKeys
+
+# Number of records in a single shard; changing it changes the generated dataset for a given seed
+SHARD_SIZE = 10_000
+
+# Uniqueness state shared with the parent process, set in worker processes by the pool initializer
+_worker_unique_keys: UniqueKeys | None = None
+
+
+def derive_seed(seed: int, shard_index: int) -> int:
+    """Derive the seed of a shard from the seed of the run.
+
+    :param seed: The seed of the whole run.
+    :param shard_index: The zero-based index of the shard.
+    :return: A 64-bit integer seed for the shard.
+    """
+    digest = blake2b(f"{seed}:{shard_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _generate_shard(shard: tuple[int, int], options: dict, unique: UniqueKeys | None = None) -> InsuranceBatch:
+    """Generate a single shard of fake car insurance data.
+
+    :param shard: A tuple of the shard size and the shard seed.
+    :param options: Keyword arguments of generate_insurance_batch() shared by all shards of the run.
+    :param unique: The uniqueness state of the run, or None.
+    :return: A batch of fake car insurance data.
+    """
+    size, shard_seed = shard
+    return generate_insurance_batch(size, seed=shard_seed, unique=unique, **options)
+
+
+def _init_worker(unique: UniqueKeys | None) -> None:
+    """Initialize a worker process of the pool.
+
+    :param unique: The shared uniqueness state of the run, or None.
+    """
+    global _worker_unique_keys
+    _worker_unique_keys = unique
+
+
+def _generate_worker_shard(shard: tuple[int, int], options: dict) -> InsuranceBatch:
+    """Generate a single shard of fake car insurance data in a worker process of the pool.
+
+    :param shard: A tuple of the shard size and the shard seed.
+    :param options: Keyword arguments of generate_insurance_batch() shared by all shards of the run.
+    :return: A batch of fake car insurance data.
+    """
+    return _generate_shard(shard, options, _worker_unique_keys)
+
+
+def iter_shards(count: int, seed: int, shard_size: int = SHARD_SIZE) -> Iterator[tuple[int, int]]:
+    """Split a run into shards.
+
+    :param count: The total number of records in the run.
+    :param seed: The seed of the whole run.
+    :param shard_size: The number of records in a single shard (the last one may be smaller).
+    :return: An iterator over tuples of the shard size and the shard seed.
+    """
+    if not isinstance(shard_size, int) or shard_size < 1:
+        raise ValueError("Shard size must be a positive integer.")
+
+    for shard_index, start in enumerate(range(0, count, shard_size)):
+        yield min(shard_size, count - start), derive_seed(seed, shard_index)
+
+
+def generate_fake_data_parallel(
+    count: int,
+    seed: int | None = None,
+    workers: int = 1,
+    shard_size: int = SHARD_SIZE,
+    pooled: bool = False,
+    as_of: date | None = None,
+    window_days: int = 0,
+    unique: bool = False,
+    locale: str | Sequence[str] | None = None,
+) -> Iterator[InsuranceBatch]:
+    """Generate fake car insurance data in shards, optionally across a pool of worker processes.
+
+    Shards are yielded in order as compact columnar batches, which are also cheap to send between
+    processes, and at most a few shards per worker are in flight at a time.
+
+    :param count: The total number of records to generate.
+    :param seed: The seed of the run; a random seed is drawn when it is None.
+    :param workers: The number of worker processes; 1 generates in the current process.
+    :param shard_size: The number of records in a single shard.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param as_of: The latest insurance start date, fixed once for the whole run (default is today).
+    :param window_days: The number of days before as_of insurance start dates are spread over (default is 0).
+    :param unique: Keep policy numbers and VINs unique across the whole run; with several workers the
+        uniqueness state lives in shared memory (see src.unique).
+    :param locale: The locale of the records, or a list of locales to mix (optional).
+    :return: An iterator over batches of fake car insurance data.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("Number of workers must be a positive integer.")
+    locales = normalize_locales(locale)
+    if seed is None:
+        seed = SystemRandom().getrandbits(64)
+    # Fix the date once, so shards generated around midnight agree with each other
+    options = {"pooled": pooled, "as_of": as_of or date.today(), "window_days": window_days, "locale": locales}
+
+    shards = iter_shards(count, seed, shard_size)
+    with UniqueKeys(vin_capacity=count, shared=workers > 1) if unique else nullcontext() as unique_keys:
+        if workers == 1:
+            yield from (_generate_shard(shard, options, unique_keys) for shard in shards)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(unique_keys,)) as executor:
+            pending = []
+            for shard in shards:
+                pending.append(executor.submit(_generate_worker_shard, shard, options))
+                if len(pending) >= 2 * workers:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+
+def add_generation_arguments(parser: ArgumentParser) -> None:
+    """Add the command line arguments of generate_fake_data_parallel() to a parser.
+
+    :param parser: The parser to add the arguments to.
+    """
+    parser.add_argument("--count", type=int, required=True, help="number of records to generate")
+    parser.add_argument("--seed", type=int, default=None, help="seed that makes the output reproducible")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="number of records in a shard")
+    parser.add_argument("--pooled", action="store_true", help="sample names and addresses from value pools")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="latest start date (YYYY-MM-DD)")
+    parser.add_argument("--window-days", type=int, default=0, help="days before --as-of start dates spread over")
+    parser.add_argument("--unique", action="store_true", help="keep policy numbers and VINs unique")
+    parser.add_argument(
+        "--locale",
+        action="append",
+        choices=list(LOCALE_FORMATS),
+        default=None,
+        help="locale of the records; repeat to mix several locales",
+    )
+
+
+def generate_from_arguments(args: Namespace) -> Iterator[InsuranceBatch]:
+    """Run generate_fake_data_parallel() with parsed command line arguments.
+
+    :param args: The arguments parsed by a parser set up with add_generation_arguments().
+    :return: An iterator over batches of fake car insurance data.
+    """
+    return generate_fake_data_parallel(
+        args.count,
+        args.seed,
+        args.workers,
+        args.shard_size,
+        args.pooled,
+        args.as_of,
+        args.window_days,
+        args.unique,
+        args.locale,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Write reproducible fake car insurance data to standard output as NDJSON.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    """
+    parser = ArgumentParser(description="Generate reproducible fake car insurance data as NDJSON.")
+    add_generation_arguments(parser)
+    args = parser.parse_args(argv)
+
+    output = sys.stdout.buffer
+    for batch in generate_from_arguments(args):
+        output.write(encode_ndjson(batch))
+    output.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,64 @@
 """This module provide functions to manipulate with policy number."""
 
+from string import ascii_uppercase
+
+from src.locales import get_locale_format
 from src.singleton import FakerSingleton
+from src.unique import PolicyNumberRegistry
+
+fake = FakerSingleton.proxy()
 
-fake = FakerSingleton.get_instance()
+# Redraws of rejected policy numbers before an exhausted registry is reported; with half of the
+# 900M bodies claimed, the chance that 20 redraws still leave a number unclaimed is ~1e-6
+MAX_POLICY_NUMBER_REDRAWS = 20
 
 
-def generate_policy_number():
+def generate_policy_number(locale: str | None = None):
     """Generate a policy number.
 
-    The format is 'PL' + 9 random digits + 2 random uppercase letters.
+    The format is 'PL' + 9 random digits + 2 random uppercase letters; with a locale, the prefix is
+    the country code of the locale instead, e.g. 'DE' for 'de_DE'.
 
+    :param locale: The locale of the policy number format (optional).
     :return: A string representing the policy number.
     """
+    prefix = get_locale_format(locale).policy_prefix
     random_digits = fake.random_number(digits=9, fix_len=True)
     random_letters = fake.random_uppercase_letter() + fake.random_uppercase_letter()
-    policy_number = f"PL{random_digits}{random_letters}"
+    policy_number = f"{prefix}{random_digits}{random_letters}"
     return policy_number
+
+
+def generate_policy_number_batch(
+    count: int, registry: PolicyNumberRegistry | None = None, locale: str | None = None
+) -> list[str]:
+    """Generate a column of policy numbers in the same format as generate_policy_number().
+
+    All digits and letters for the batch are drawn with bulk calls to the random generator. With a
+    registry, numbers that were claimed before are rejected and the shortfall is redrawn in bulk, at
+    most MAX_POLICY_NUMBER_REDRAWS times, so the 9-digit part (and therefore the policy number) is
+    unique across the registry.
+
+    :param count: The number of policy numbers to generate.
+    :param registry: The registry of claimed policy numbers (optional).
+    :param locale: The locale of the policy number format (optional).
+    :return: A list of strings representing policy numbers.
+    """
+    prefix = get_locale_format(locale).policy_prefix
+    numbers = fake.random.choices(range(10**8, 10**9), k=count)
+    if registry is not None:
+        numbers = registry.claim(numbers)
+        redraws = 0
+        while len(numbers) < count:
+            if redraws == MAX_POLICY_NUMBER_REDRAWS:
+                raise RuntimeError(
+                    f"The policy number registry is exhausted: {count - len(numbers)} numbers were still "
+                    f"rejected after {MAX_POLICY_NUMBER_REDRAWS} redraws."
+                )
+            numbers += registry.claim(fake.random.choices(range(10**8, 10**9), k=count - len(numbers)))
+            redraws += 1
+    letters = fake.random.choices(ascii_uppercase, k=2 * count)
+    return [
+        f"{prefix}{number}{first}{second}"
+        for number, first, second in zip(numbers, letters[::2], letters[1::2], strict=True)
+    ]
@@ -0,0 +1,104 @@
+"""Module provides precomputed value pools for fast, index-based sampling of owner data.
+
+Going through Faker's provider machinery for every record is expensive, so the value space of each
+provider (or a large sample of composed values, for addresses) is materialized once per process and
+then sampled by random indices in bulk. Pools are built from a dedicated Faker instance with a fixed
+seed, so they are identical in every process and do not disturb the random state of the singleton.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from itertools import accumulate
+from random import Random
+from typing import TYPE_CHECKING
+
+from src.singleton import FakerSingleton
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+# Number of composed addresses materialized in the address pool
+ADDRESS_POOL_SIZE = 10_000
+
+# Number of generated names materialized in the name pools of explicitly requested locales
+NAME_POOL_SIZE = 10_000
+
+# Seed of the Faker instance the pools are built from
+POOL_SEED = 0
+
+
+class ValuePool:
+    """Immutable pool of values sampled by random indices, optionally weighted."""
+
+    __slots__ = ("values", "cum_weights")
+
+    def __init__(self, values: Sequence[str], weights: Sequence[float] | None = None):
+        self.values = tuple(values)
+        self.cum_weights = list(accumulate(weights)) if weights is not None else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def sample(self, rng: Random, count: int) -> list[str]:
+        """Draw values from the pool with replacement.
+
+        :param rng: The random generator that draws the indices.
+        :param count: The number of values to draw.
+        :return: A list of values drawn from the pool.
+        """
+        return rng.choices(self.values, cum_weights=self.cum_weights, k=count)
+
+
+def _provider_values_pool(values: Sequence[str] | Mapping[str, float]) -> ValuePool:
+    """Materialize the value space of a provider attribute.
+
+    :param values: A sequence of values, or a mapping of values to weights.
+    :return: A pool that samples the values with the same weights as Faker does.
+    """
+    if isinstance(values, Mapping):
+        return ValuePool(list(values.keys()), list(values.values()))
+    return ValuePool(values)
+
+
+def _person_provider_attribute(fake: "Faker", attribute: str) -> Sequence[str] | Mapping[str, float]:
+    """Find an attribute of the person provider of a Faker instance.
+
+    :param fake: The Faker instance.
+    :param attribute: The name of the attribute, e.g. 'first_names'.
+    :return: The value of the attribute.
+    """
+    return next(getattr(provider, attribute) for provider in fake.providers if hasattr(provider, attribute))
+
+
+# Pools of the default locale use the value spaces of the person provider, with Faker's weights
+_POOL_BUILDERS: dict[str, Callable[["Faker"], ValuePool]] = {
+    "first_name": lambda fake: _provider_values_pool(_person_provider_attribute(fake, "first_names")),
+    "last_name": lambda fake: _provider_values_pool(_person_provider_attribute(fake, "last_names")),
+    "address": lambda fake: ValuePool([fake.address().replace("\n", ", ") for _ in range(ADDRESS_POOL_SIZE)]),
+}
+
+
+# Locales may compose names differently from their provider attributes (e.g. pl_PL picks last
+# names by gender), so pools of other locales are built from a large sample of generated values
+_LOCALE_POOL_BUILDERS: dict[str, Callable[["Faker"], ValuePool]] = {
+    "first_name": lambda fake: ValuePool([fake.first_name() for _ in range(NAME_POOL_SIZE)]),
+    "last_name": lambda fake: ValuePool([fake.last_name() for _ in range(NAME_POOL_SIZE)]),
+    "address": _POOL_BUILDERS["address"],
+}
+
+
+@lru_cache
+def get_pool(field: str, locale: str | None = None) -> ValuePool:
+    """Get the value pool of a field, building it on first use.
+
+    :param field: The name of the field: 'first_name', 'last_name' or 'address'.
+    :param locale: The locale of the values, e.g. 'de_DE' (default is Faker's default locale).
+    :return: The value pool of the field.
+    """
+    builders = _POOL_BUILDERS if locale is None else _LOCALE_POOL_BUILDERS
+    if field not in builders:
+        raise ValueError(f"There is no value pool for field '{field}'.")
+
+    fake = FakerSingleton.create_instance(locale)
+    fake.seed_instance(POOL_SEED)
+    return builders[field](fake)
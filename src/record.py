@@ -0,0 +1,91 @@
+"""Module provides compact representations of fake car insurance data.
+
+Generators populate these types directly; nested dictionaries are only built at the API or export
+boundary, through to_dict() / to_dicts().
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from typing import NamedTuple
+
+
+class InsuranceRecord(NamedTuple):
+    """A single record of fake car insurance data stored as a flat tuple of strings."""
+
+    policy_number: str
+    first_name: str
+    last_name: str
+    birth_date: str
+    address: str
+    phone: str
+    vin: str
+    start_date: str
+    end_date: str
+
+    def to_dict(self) -> dict:
+        """Convert the record into the nested structure returned by the API.
+
+        :return: A dictionary containing fake car insurance data.
+        """
+        return {
+            "policy_number": self.policy_number,
+            "owner": {
+                "first_name": self.first_name,
+                "last_name": self.last_name,
+                "birth_date": self.birth_date,
+                "address": self.address,
+                "phone": self.phone,
+            },
+            "car": {
+                "vin": self.vin,
+            },
+            "insurance": {
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+            },
+        }
+
+
+@dataclass(slots=True)
+class InsuranceBatch:
+    """A batch of fake car insurance data stored column-wise, one list per field of InsuranceRecord."""
+
+    policy_number: list[str]
+    first_name: list[str]
+    last_name: list[str]
+    birth_date: list[str]
+    address: list[str]
+    phone: list[str]
+    vin: list[str]
+    start_date: list[str]
+    end_date: list[str]
+
+    def __len__(self) -> int:
+        return len(self.policy_number)
+
+    def __getitem__(self, index: int) -> InsuranceRecord:
+        return InsuranceRecord(*(column[index] for column in self.columns()))
+
+    def __iter__(self) -> Iterator[InsuranceRecord]:
+        return map(InsuranceRecord._make, self.rows())
+
+    def columns(self) -> list[list[str]]:
+        """Get the columns of the batch in InsuranceRecord field order.
+
+        :return: A list of columns.
+        """
+        return [getattr(self, field.name) for field in fields(self)]
+
+    def rows(self) -> Iterator[tuple[str, ...]]:
+        """Iterate over the rows of the batch as plain tuples in InsuranceRecord field order.
+
+        :return: An iterator over tuples of field values.
+        """
+        return zip(*self.columns(), strict=True)
+
+    def to_dicts(self) -> list[dict]:
+        """Convert the batch into a list of nested dictionaries, as returned by the API.
+
+        :return: A list of dictionaries containing fake car insurance data.
+        """
+        return [record.to_dict() for record in self]
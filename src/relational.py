@@ -0,0 +1,408 @@
+"""Module provides relational generation of linked owners, cars, policies and claims tables.
+
+Every batch starts with a number of owners; each owner gets a number of cars, each car a number of
+consecutive yearly policies and each policy a number of claims, drawn from configurable cardinality
+distributions. Primary keys are assigned from running counters and foreign keys are copied from the
+parent rows of the same batch, so keys stay consistent without cross-table lookups or joins, and
+only one batch is held in memory regardless of the number of owners. Every batch is generated from
+its own seed derived from the run seed and the batch index.
+
+Usage::
+
+    python -m src.relational --owners 100000 --seed 42 --format csv --out-dir data/
+"""
+
+import csv
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from datetime import date
+from pathlib import Path
+from random import SystemRandom
+from time import perf_counter
+
+import orjson
+
+from src.car import generate_vin_batch
+from src.insurance import POLICY_TERM_DAYS, format_date
+from src.owner import (
+    generate_address_batch,
+    generate_birthdate_batch,
+    generate_first_name_batch,
+    generate_last_name_batch,
+    generate_phone_batch,
+)
+from src.parallel import derive_seed
+from src.policy_number import generate_policy_number_batch
+from src.singleton import FakerSingleton
+from src.unique import UniqueKeys
+
+fake = FakerSingleton.proxy()
+
+# Number of owners generated together in one batch of linked tables
+DEFAULT_OWNER_BATCH_SIZE = 10_000
+
+# Default cardinality distributions, mapping a number of children to its weight
+CARS_PER_OWNER = {1: 60, 2: 30, 3: 10}
+POLICIES_PER_CAR = {1: 50, 2: 30, 3: 20}
+CLAIMS_PER_POLICY = {0: 80, 1: 15, 2: 5}
+
+# Range of claim amounts, inclusive
+CLAIM_AMOUNT_RANGE = (100, 50_000)
+
+# Columns of the tables, in generation order
+TABLE_COLUMNS = {
+    "owners": ("owner_id", "first_name", "last_name", "birth_date", "address", "phone"),
+    "cars": ("car_id", "owner_id", "vin"),
+    "policies": ("policy_id", "car_id", "owner_id", "policy_number", "start_date", "end_date"),
+    "claims": ("claim_id", "policy_id", "claim_date", "amount"),
+}
+
+
+@dataclass
+class RelationalBatch:
+    """A batch of linked tables, each stored column-wise as a mapping of column names to lists."""
+
+    owners: dict[str, list]
+    cars: dict[str, list]
+    policies: dict[str, list]
+    claims: dict[str, list]
+
+    def tables(self) -> Iterator[tuple[str, dict[str, list]]]:
+        """Iterate over the tables of the batch in TABLE_COLUMNS order.
+
+        :return: An iterator over tuples of the table name and its columns.
+        """
+        return ((field.name, getattr(self, field.name)) for field in fields(self))
+
+    def rows(self, table: str) -> Iterator[tuple]:
+        """Iterate over the rows of a table as plain tuples in TABLE_COLUMNS order.
+
+        :param table: The name of the table.
+        :return: An iterator over tuples of column values.
+        """
+        columns = getattr(self, table)
+        return zip(*(columns[name] for name in TABLE_COLUMNS[table]), strict=True)
+
+
+class RelationalGenerator:
+    """Generator of batches of linked tables that keeps the key counters across batches."""
+
+    def __init__(
+        self,
+        cars_per_owner: Mapping[int, float] = CARS_PER_OWNER,
+        policies_per_car: Mapping[int, float] = POLICIES_PER_CAR,
+        claims_per_policy: Mapping[int, float] = CLAIMS_PER_POLICY,
+        pooled: bool = False,
+        as_of: date | None = None,
+        unique: UniqueKeys | None = None,
+    ):
+        """Initialize the generator.
+
+        :param cars_per_owner: The distribution of the number of cars of an owner.
+        :param policies_per_car: The distribution of the number of consecutive policies of a car.
+        :param claims_per_policy: The distribution of the number of claims of a policy.
+        :param pooled: Sample names and addresses from precomputed value pools (see src.pools).
+        :param as_of: The date the latest policies are active at and no claim is after (default is today).
+        :param unique: The uniqueness state that keeps policy numbers and VINs unique across batches (optional).
+        """
+        _validate_cardinality("Cars per owner", cars_per_owner, minimum=1)
+        _validate_cardinality("Policies per car", policies_per_car, minimum=1)
+        _validate_cardinality("Claims per policy", claims_per_policy, minimum=0)
+        self.cars_per_owner = cars_per_owner
+        self.policies_per_car = policies_per_car
+        self.claims_per_policy = claims_per_policy
+        self.pooled = pooled
+        self.as_of = as_of
+        self.unique = unique
+        # The last key assigned in every table
+        self.last_keys = dict.fromkeys(TABLE_COLUMNS, 0)
+
+    def generate(self, owner_count: int, seed: int | None = None) -> RelationalBatch:
+        """Generate a batch of linked tables for a number of owners.
+
+        :param owner_count: The number of owners in the batch.
+        :param seed: The seed value that makes the generated batch reproducible (optional).
+        :return: A RelationalBatch holding the rows of every table.
+        """
+        if not isinstance(owner_count, int) or owner_count < 1:
+            raise ValueError("Owner count must be a positive integer.")
+
+        as_of = self.as_of or date.today()
+        with FakerSingleton.seeded(seed):
+            owners = self._generate_owners(owner_count, as_of)
+            cars = self._generate_cars(owners["owner_id"])
+            policies = self._generate_policies(cars["car_id"], cars["owner_id"], as_of)
+            claims = self._generate_claims(policies["policy_id"], policies["start_ordinal"], as_of)
+        del policies["start_ordinal"]
+        return RelationalBatch(owners, cars, policies, claims)
+
+    def _next_keys(self, table: str, count: int) -> list[int]:
+        """Assign the next keys of a table from its counter.
+
+        :param table: The name of the table.
+        :param count: The number of keys.
+        :return: A list of consecutive keys.
+        """
+        first = self.last_keys[table] + 1
+        self.last_keys[table] += count
+        return list(range(first, first + count))
+
+    def _generate_owners(self, count: int, as_of: date) -> dict[str, list]:
+        """Generate the owners table of a batch.
+
+        :param count: The number of owners.
+        :param as_of: The date ages are calculated at.
+        :return: The columns of the table.
+        """
+        return {
+            "owner_id": self._next_keys("owners", count),
+            "first_name": generate_first_name_batch(count, self.pooled),
+            "last_name": generate_last_name_batch(count, self.pooled),
+            "birth_date": generate_birthdate_batch(count, as_of=as_of),
+            "address": generate_address_batch(count, self.pooled),
+            "phone": generate_phone_batch(count),
+        }
+
+    def _generate_cars(self, owner_ids: list[int]) -> dict[str, list]:
+        """Generate the cars table of a batch.
+
+        :param owner_ids: The keys of the owners of the batch.
+        :return: The columns of the table.
+        """
+        car_owner_ids = _expand(owner_ids, _draw_counts(self.cars_per_owner, len(owner_ids)))
+        return {
+            "car_id": self._next_keys("cars", len(car_owner_ids)),
+            "owner_id": car_owner_ids,
+            "vin": generate_vin_batch(len(car_owner_ids), registry=self.unique and self.unique.vins),
+        }
+
+    def _generate_policies(self, car_ids: list[int], owner_ids: list[int], as_of: date) -> dict[str, list]:
+        """Generate the policies table of a batch.
+
+        The policies of a car are consecutive yearly terms; the latest one started within the last
+        term before as_of, so it is active at as_of.
+
+        :param car_ids: The keys of the cars of the batch.
+        :param owner_ids: The keys of the owners of the cars.
+        :param as_of: The date the latest policies are active at.
+        :return: The columns of the table, with the start ordinals of the policies under 'start_ordinal'.
+        """
+        counts = _draw_counts(self.policies_per_car, len(car_ids))
+        offsets = fake.random.choices(range(POLICY_TERM_DAYS), k=len(car_ids))
+        as_of_ordinal = as_of.toordinal()
+        start_ordinals = [
+            as_of_ordinal - offset - term * POLICY_TERM_DAYS
+            for offset, count in zip(offsets, counts, strict=True)
+            for term in range(count - 1, -1, -1)
+        ]
+        count = len(start_ordinals)
+        return {
+            "policy_id": self._next_keys("policies", count),
+            "car_id": _expand(car_ids, counts),
+            "owner_id": _expand(owner_ids, counts),
+            "policy_number": generate_policy_number_batch(count, self.unique and self.unique.policy_numbers),
+            "start_date": list(map(format_date, start_ordinals)),
+            "end_date": [format_date(ordinal + POLICY_TERM_DAYS) for ordinal in start_ordinals],
+            "start_ordinal": start_ordinals,
+        }
+
+    def _generate_claims(self, policy_ids: list[int], start_ordinals: list[int], as_of: date) -> dict[str, list]:
+        """Generate the claims table of a batch.
+
+        A claim falls within the term of its policy and not after as_of.
+
+        :param policy_ids: The keys of the policies of the batch.
+        :param start_ordinals: The start dates of the policies as ordinals.
+        :param as_of: The latest possible claim date.
+        :return: The columns of the table.
+        """
+        counts = _draw_counts(self.claims_per_policy, len(policy_ids))
+        claim_starts = _expand(start_ordinals, counts)
+        count = len(claim_starts)
+        as_of_ordinal = as_of.toordinal()
+        random = fake.random.random
+        claim_ordinals = [
+            start + int(random() * (min(start + POLICY_TERM_DAYS - 1, as_of_ordinal) - start + 1))
+            for start in claim_starts
+        ]
+        low, high = CLAIM_AMOUNT_RANGE
+        return {
+            "claim_id": self._next_keys("claims", count),
+            "policy_id": _expand(policy_ids, counts),
+            "claim_date": list(map(format_date, claim_ordinals)),
+            "amount": fake.random.choices(range(low, high + 1), k=count),
+        }
+
+
+def _validate_cardinality(name: str, distribution: Mapping[int, float], minimum: int) -> None:
+    """Validate a cardinality distribution.
+
+    :param name: The name of the distribution, for error messages.
+    :param distribution: A mapping of numbers of children to weights.
+    :param minimum: The smallest allowed number of children.
+    """
+    if not distribution or any(not isinstance(count, int) or count < minimum for count in distribution):
+        raise ValueError(f"{name} must map integers of at least {minimum} to weights.")
+    if any(weight < 0 for weight in distribution.values()) or not sum(distribution.values()) > 0:
+        raise ValueError(f"{name} must have non-negative weights with a positive sum.")
+
+
+def _draw_counts(distribution: Mapping[int, float], count: int) -> list[int]:
+    """Draw the numbers of children of a column of parents in one bulk call.
+
+    :param distribution: A mapping of numbers of children to weights.
+    :param count: The number of parents.
+    :return: A list of numbers of children.
+    """
+    return fake.random.choices(list(distribution), list(distribution.values()), k=count)
+
+
+def _expand(values: list, counts: list[int]) -> list:
+    """Repeat every value of a column as many times as its count.
+
+    :param values: The values, e.g. the keys of the parents.
+    :param counts: The number of repetitions of every value.
+    :return: The expanded column.
+    """
+    return [value for value, count in zip(values, counts, strict=True) for _ in range(count)]
+
+
+def iter_relational_batches(
+    owner_count: int,
+    batch_size: int = DEFAULT_OWNER_BATCH_SIZE,
+    seed: int | None = None,
+    generator: RelationalGenerator | None = None,
+) -> Iterator[RelationalBatch]:
+    """Lazily generate linked tables in batches of owners.
+
+    :param owner_count: The total number of owners.
+    :param batch_size: The maximum number of owners in a single batch.
+    :param seed: The seed of the run; a random seed is drawn when it is None.
+    :param generator: The generator holding the cardinalities and options (default is a new one with the defaults).
+    :return: An iterator over batches of linked tables.
+    """
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("Batch size must be a positive integer.")
+    if seed is None:
+        seed = SystemRandom().getrandbits(64)
+    generator = generator or RelationalGenerator()
+
+    for batch_index, start in enumerate(range(0, owner_count, batch_size)):
+        yield generator.generate(min(batch_size, owner_count - start), derive_seed(seed, batch_index))
+
+
+def parse_cardinality(text: str) -> dict[int, float]:
+    """Parse a cardinality distribution from the command line.
+
+    :param text: Comma-separated pairs of a number of children and its weight, e.g. '1:60,2:30,3:10'.
+    :return: A mapping of numbers of children to weights.
+    """
+    try:
+        pairs = (pair.split(":") for pair in text.split(","))
+        return {int(count): float(weight) for count, weight in pairs}
+    except ValueError as e:
+        raise ValueError(f"Invalid cardinality '{text}'; expected e.g. '1:60,2:30,3:10'.") from e
+
+
+class CsvTableWriter:
+    """Writer of linked tables to one CSV file per table, with a header row."""
+
+    suffix = ".csv"
+
+    def __init__(self, path: Path, table: str):
+        self._file = open(path, "w", newline="", encoding="utf-8", buffering=1024 * 1024)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(TABLE_COLUMNS[table])
+
+    def write(self, rows: Iterator[tuple]) -> None:
+        """Write rows of the table.
+
+        :param rows: The rows as tuples in TABLE_COLUMNS order.
+        """
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class NdjsonTableWriter:
+    """Writer of linked tables to one newline-delimited JSON file per table."""
+
+    suffix = ".ndjson"
+
+    def __init__(self, path: Path, table: str):
+        self._file = open(path, "wb", buffering=1024 * 1024)
+        self._columns = TABLE_COLUMNS[table]
+
+    def write(self, rows: Iterator[tuple]) -> None:
+        """Write rows of the table.
+
+        :param rows: The rows as tuples in TABLE_COLUMNS order.
+        """
+        columns, dumps = self._columns, orjson.dumps
+        self._file.write(b"".join(dumps(dict(zip(columns, row, strict=True))) + b"\n" for row in rows))
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+TABLE_WRITERS = {
+    "csv": CsvTableWriter,
+    "ndjson": NdjsonTableWriter,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Write linked owners, cars, policies and claims tables to a directory and print the throughput.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    """
+    parser = ArgumentParser(description="Generate linked owners, cars, policies and claims tables.")
+    parser.add_argument("--owners", type=int, required=True, help="number of owners to generate")
+    parser.add_argument("--seed", type=int, default=None, help="seed that makes the output reproducible")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_OWNER_BATCH_SIZE, help="owners in a batch")
+    parser.add_argument("--cars-per-owner", type=parse_cardinality, default=CARS_PER_OWNER, help="e.g. 1:60,2:40")
+    parser.add_argument("--policies-per-car", type=parse_cardinality, default=POLICIES_PER_CAR, help="e.g. 1:1")
+    parser.add_argument("--claims-per-policy", type=parse_cardinality, default=CLAIMS_PER_POLICY, help="e.g. 0:9,1:1")
+    parser.add_argument("--pooled", action="store_true", help="sample names and addresses from value pools")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="latest policy date (YYYY-MM-DD)")
+    parser.add_argument("--unique", action="store_true", help="keep policy numbers and VINs unique")
+    parser.add_argument("--format", choices=sorted(TABLE_WRITERS), required=True, help="output file format")
+    parser.add_argument("--out-dir", type=Path, required=True, help="directory of the output files")
+    args = parser.parse_args(argv)
+
+    # Size the VIN filter for the most cars the owners can have, so it never runs past its capacity
+    unique = UniqueKeys(vin_capacity=max(1, args.owners * max(args.cars_per_owner))) if args.unique else None
+    generator = RelationalGenerator(
+        args.cars_per_owner, args.policies_per_car, args.claims_per_policy, args.pooled, args.as_of, unique
+    )
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    writer_class = TABLE_WRITERS[args.format]
+    writers = {table: writer_class(args.out_dir / f"{table}{writer_class.suffix}", table) for table in TABLE_COLUMNS}
+
+    started = perf_counter()
+    try:
+        for batch in iter_relational_batches(args.owners, args.batch_size, args.seed, generator):
+            for table, writer in writers.items():
+                writer.write(batch.rows(table))
+    finally:
+        for writer in writers.values():
+            writer.close()
+        if unique is not None:
+            unique.close()
+
+    elapsed = perf_counter() - started
+    rows = sum(generator.last_keys.values())
+    counts = ", ".join(f"{count} {table}" for table, count in generator.last_keys.items())
+    print(
+        f"Wrote {rows} rows ({counts}) to '{args.out_dir}' in {elapsed:.2f} s: {rows / elapsed:.0f} rows/s.",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+r"""Module provides declarative record schemas compiled into column-wise generation plans.
+
+A schema is a JSON (or TOML) document describing the fields of a record, their nesting and where their values
+come from, so fields can be added or formats changed without code changes::
+
+    {
+      "locale": "de_DE",
+      "fields": {
+        "policy_number": {"pattern": "DE%########??"},
+        "owner": {"fields": {"first_name": {"source": "first_name"}}},
+        "tier": {"choices": ["basic", "plus", "premium"], "weights": [6, 3, 1]}
+      }
+    }
+
+Every field is one of:
+
+- ``{"pattern": ...}``: a mask where ``#`` is a digit, ``%`` a non-zero digit, ``?`` an uppercase
+  letter, ``{a|b|c}`` one of the alternatives and ``\`` escapes the next character; everything else
+  is copied as it is,
+- ``{"source": ...}``: a column of a built-in generator (see SOURCES),
+- ``{"choices": [...]}``: one of the values, optionally weighted by ``"weights"``,
+- ``{"fields": {...}}``: a nested object.
+
+Any other key of a schema, an object or a field is rejected, so a typo cannot go unnoticed.
+
+compile_schema() turns a schema into a GenerationPlan once. Consecutive mask tokens are compiled into
+a single draw (e.g. ``%##`` draws from 100-999), so a pattern costs one bulk call to the random
+generator per token run for the whole batch, and the values are rendered with one str.format() per
+row. The optional ``"locale"`` is passed to the sources. The default schema (DEFAULT_SCHEMA_PATH)
+describes the records of generate_fake_data().
+"""
+
+import json
+import tomllib
+from collections.abc import Callable, Sequence
+from datetime import date
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
+from string import ascii_uppercase
+from typing import Any, NamedTuple
+
+from src.car import generate_vin_batch
+from src.insurance import generate_end_date, generate_start_date
+from src.locales import get_locale_format
+from src.owner import (
+    generate_address_batch,
+    generate_birthdate_batch,
+    generate_first_name_batch,
+    generate_last_name_batch,
+    generate_phone_batch,
+)
+from src.policy_number import generate_policy_number_batch
+from src.singleton import FakerSingleton
+
+# The schema of the records returned by generate_fake_data()
+DEFAULT_SCHEMA_PATH = Path(__file__).with_name("schema.json")
+
+# Keys of a schema and of the specification of every kind of field; other keys are rejected
+SCHEMA_KEYS = ("locale", "fields")
+FIELD_KEYS = {
+    "pattern": ("pattern",),
+    "source": ("source",),
+    "choices": ("choices", "weights"),
+    "fields": ("fields",),
+}
+
+# Maximum number of digits drawn as one integer; larger ranges would lose uniformity in random.choices()
+MAX_DIGITS_PER_DRAW = 15
+
+# Maximum number of letters drawn as one value of a precomputed table of all combinations
+MAX_LETTERS_PER_DRAW = 3
+
+fake = FakerSingleton.proxy()
+
+# Built-in value sources: (count, pooled, as_of, locale) -> a column of count values
+SOURCES: dict[str, Callable[[int, bool, date, str | None], list]] = {
+    "policy_number": lambda count, pooled, as_of, locale: generate_policy_number_batch(count, locale=locale),
+    "first_name": lambda count, pooled, as_of, locale: generate_first_name_batch(count, pooled, locale),
+    "last_name": lambda count, pooled, as_of, locale: generate_last_name_batch(count, pooled, locale),
+    "birth_date": lambda count, pooled, as_of, locale: generate_birthdate_batch(count, as_of=as_of),
+    "address": lambda count, pooled, as_of, locale: generate_address_batch(count, pooled, locale),
+    "phone": lambda count, pooled, as_of, locale: generate_phone_batch(count, locale),
+    "vin": lambda count, pooled, as_of, locale: generate_vin_batch(count),
+    "start_date": lambda count, pooled, as_of, locale: [generate_start_date(as_of)] * count,
+    "end_date": lambda count, pooled, as_of, locale: [generate_end_date(as_of)] * count,
+}
+
+
+class Draw(NamedTuple):
+    """A placeholder of a compiled pattern, filled with values drawn from a population."""
+
+    population: Sequence
+    format_spec: str = ""
+
+
+class CompiledPattern(NamedTuple):
+    """A pattern compiled into a str.format() template and the draws that fill its placeholders."""
+
+    template: str
+    draws: tuple[Draw, ...]
+
+    def generate(self, count: int) -> list[str]:
+        """Generate a column of values of the pattern.
+
+        :param count: The number of values to generate.
+        :return: A list of strings.
+        """
+        if not self.draws:
+            return [self.template.format()] * count
+        choices = fake.random.choices
+        columns = [choices(draw.population, k=count) for draw in self.draws]
+        return list(map(self.template.format, *columns))
+
+
+class GenerationPlan:
+    """A schema compiled into column generators and the nesting of their values."""
+
+    def __init__(self, columns: list[tuple[tuple[str, ...], Callable]], locale: str | None = None):
+        """Initialize the plan.
+
+        :param columns: The path of every field and the function generating its column, in field order.
+        :param locale: The locale passed to the sources (optional).
+        """
+        self.columns = columns
+        self.locale = locale
+
+    @property
+    def field_names(self) -> list[str]:
+        """The dotted paths of the fields, e.g. 'owner.first_name'.
+
+        :return: A list of field paths in field order.
+        """
+        return [".".join(path) for path, _ in self.columns]
+
+    def generate(
+        self, count: int, seed: int | None = None, pooled: bool = False, as_of: date | None = None
+    ) -> list[dict]:
+        """Generate a batch of records column-wise.
+
+        :param count: The number of records to generate.
+        :param seed: The seed value that makes the generated batch reproducible (optional).
+        :param pooled: Sample names and addresses of the sources from precomputed value pools.
+        :param as_of: The date the sources calculate dates at (default is today).
+        :return: A list of dictionaries nested as described by the schema.
+        """
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise TypeError("Count must be an integer.")
+        if count < 1:
+            raise ValueError("Count must be a positive integer.")
+
+        as_of = as_of or date.today()
+        with FakerSingleton.localized(self.locale), FakerSingleton.seeded(seed):
+            values = [(path, generate(count, pooled, as_of, self.locale)) for path, generate in self.columns]
+        return _nest(values, 0)
+
+
+def _nest(values: list[tuple[tuple[str, ...], list]], depth: int) -> list[dict]:
+    """Assemble columns into a list of nested dictionaries, one comprehension per level of nesting.
+
+    :param values: The path and the column of every field of an object, in field order.
+    :param depth: The depth of the object in the paths.
+    :return: A list of dictionaries.
+    """
+    names: list[str] = []
+    columns: list[list] = []
+    groups: dict[str, list[tuple[tuple[str, ...], list]]] = {}
+    for path, column in values:
+        name = path[depth]
+        if len(path) == depth + 1:
+            names.append(name)
+            columns.append(column)
+            continue
+        if name not in groups:
+            groups[name] = []
+            names.append(name)
+            columns.append(groups[name])
+        groups[name].append((path, column))
+    # Nested groups are assembled in place of the list holding their fields
+    columns = [_nest(column, depth + 1) if name in groups else column for name, column in zip(names, columns)]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+@lru_cache(maxsize=None)
+def _letter_table(length: int) -> tuple[str, ...]:
+    """Build all combinations of a number of uppercase letters.
+
+    :param length: The number of letters.
+    :return: A tuple of strings.
+    """
+    return tuple(map("".join, product(ascii_uppercase, repeat=length)))
+
+
+def compile_pattern(pattern: str) -> CompiledPattern:
+    """Compile a pattern mask into a str.format() template and its draws.
+
+    :param pattern: The pattern, e.g. 'PL%########??'.
+    :return: The compiled pattern.
+    """
+    template: list[str] = []
+    draws: list[Draw] = []
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char in "#%":
+            end = position + 1
+            while end < len(pattern) and pattern[end] == "#":
+                end += 1
+            while position < end:
+                digits = min(end - position, MAX_DIGITS_PER_DRAW)
+                if pattern[position] == "%":
+                    draws.append(Draw(range(10 ** (digits - 1), 10**digits)))
+                    template.append("{}")
+                else:
+                    draws.append(Draw(range(10**digits), f"0{digits}d"))
+                    template.append(f"{{:0{digits}d}}")
+                position += digits
+        elif char == "?":
+            end = position
+            while end < len(pattern) and pattern[end] == "?":
+                end += 1
+            while position < end:
+                letters = min(end - position, MAX_LETTERS_PER_DRAW)
+                draws.append(Draw(_letter_table(letters)))
+                template.append("{}")
+                position += letters
+        elif char == "{":
+            end = pattern.find("}", position)
+            if end == -1:
+                raise ValueError(f"Unclosed alternatives in pattern '{pattern}'.")
+            draws.append(Draw(tuple(pattern[position + 1 : end].split("|"))))
+            template.append("{}")
+            position = end + 1
+        else:
+            if char == "\\":
+                position += 1
+                if position == len(pattern):
+                    raise ValueError(f"Pattern '{pattern}' ends with an escape.")
+                char = pattern[position]
+            template.append(char.replace("{", "{{").replace("}", "}}"))
+            position += 1
+    return CompiledPattern("".join(template), tuple(draws))
+
+
+def _reject_unknown_keys(name: str, spec: dict, known: tuple[str, ...]) -> None:
+    """Reject the keys of a specification that are not part of the schema format, e.g. typos.
+
+    :param name: The name of the specified object or field, for error messages.
+    :param spec: The specification.
+    :param known: The keys the specification may have.
+    """
+    unknown = sorted(str(key) for key in spec if key not in known)
+    if unknown:
+        raise ValueError(f"'{name}' has unknown keys {', '.join(map(repr, unknown))}; expected {', '.join(known)}.")
+
+
+def _compile_field(path: tuple[str, ...], spec: Any) -> Callable:
+    """Compile the specification of a field into the function generating its column.
+
+    :param path: The path of the field, for error messages.
+    :param spec: The specification of the field.
+    :return: A function (count, pooled, as_of, locale) -> column.
+    """
+    name = ".".join(path)
+    kinds = [kind for kind in ("pattern", "source", "choices") if isinstance(spec, dict) and kind in spec]
+    if len(kinds) != 1:
+        raise ValueError(f"Field '{name}' must have exactly one of 'pattern', 'source', 'choices' or 'fields'.")
+    _reject_unknown_keys(name, spec, FIELD_KEYS[kinds[0]])
+    if kinds[0] == "pattern":
+        compiled = compile_pattern(spec["pattern"])
+        return lambda count, pooled, as_of, locale: compiled.generate(count)
+    if kinds[0] == "source":
+        if spec["source"] not in SOURCES:
+            raise ValueError(f"Field '{name}' has an unknown source '{spec['source']}'.")
+        return SOURCES[spec["source"]]
+    values, weights = spec["choices"], spec.get("weights")
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"Field '{name}' must have a non-empty list of choices.")
+    if weights is not None and len(weights) != len(values):
+        raise ValueError(f"Field '{name}' must have one weight per choice.")
+    values = tuple(values)
+    return lambda count, pooled, as_of, locale: fake.random.choices(values, weights, k=count)
+
+
+def _compile_fields(path: tuple[str, ...], fields: Any, columns: list[tuple[tuple[str, ...], Callable]]) -> None:
+    """Compile the fields of an object, depth first, into a list of column generators.
+
+    :param path: The path of the object.
+    :param fields: The field specifications of the object.
+    :param columns: The list the path and generator of every field are appended to.
+    """
+    if not isinstance(fields, dict) or not fields:
+        raise ValueError(f"Object '{'.'.join(path) or '<root>'}' must have a non-empty mapping of fields.")
+    for name, spec in fields.items():
+        if isinstance(spec, dict) and "fields" in spec:
+            _reject_unknown_keys(".".join((*path, name)), spec, FIELD_KEYS["fields"])
+            _compile_fields((*path, name), spec["fields"], columns)
+        else:
+            columns.append(((*path, name), _compile_field((*path, name), spec)))
+
+
+def compile_schema(schema: dict) -> GenerationPlan:
+    """Compile a schema into a generation plan.
+
+    :param schema: The schema, as parsed from JSON.
+    :return: The generation plan.
+    """
+    if not isinstance(schema, dict):
+        raise ValueError("A schema must be a mapping.")
+    _reject_unknown_keys("<root>", schema, SCHEMA_KEYS)
+    locale = schema.get("locale")
+    if locale is not None:
+        # Validate the locale
+        get_locale_format(locale)
+    columns: list[tuple[tuple[str, ...], Callable]] = []
+    _compile_fields((), schema.get("fields"), columns)
+    return GenerationPlan(columns, locale)
+
+
+def load_plan(path: str | Path = DEFAULT_SCHEMA_PATH) -> GenerationPlan:
+    """Load a schema file and compile it into a generation plan.
+
+    :param path: The path of the JSON schema, or of a TOML schema when it ends with '.toml' (default is
+        the schema of generate_fake_data()).
+    :return: The generation plan.
+    """
+    if Path(path).suffix == ".toml":
+        with open(path, "rb") as file:
+            return compile_schema(tomllib.load(file))
+    with open(path, encoding="utf-8") as file:
+        return compile_schema(json.load(file))
+
+
+@lru_cache(maxsize=1)
+def default_plan() -> GenerationPlan:
+    """Get the generation plan of the default schema, compiled once per process.
+
+    :return: The generation plan.
+    """
+    return load_plan()
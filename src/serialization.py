@@ -0,0 +1,69 @@
+"""Module provides fast JSON serialization of fake car insurance data for API responses and exports."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+from src.record import InsuranceBatch
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content into compact JSON bytes.
+
+    :param content: The content to serialize; dicts, lists and strings of generated data.
+    :return: The JSON document as UTF-8 encoded bytes.
+    """
+    return orjson.dumps(content)
+
+
+def encode_batch(batch: InsuranceBatch) -> bytes:
+    """Serialize a batch into a JSON array of nested records.
+
+    :param batch: The batch to serialize.
+    :return: The JSON array as UTF-8 encoded bytes.
+    """
+    return orjson.dumps(batch.to_dicts())
+
+
+def encode_records(batch: InsuranceBatch) -> list[bytes]:
+    """Serialize every record of a batch into its own JSON document.
+
+    :param batch: The batch to serialize.
+    :return: A list of JSON objects as UTF-8 encoded bytes, one per record.
+    """
+    return [orjson.dumps(record) for record in batch.to_dicts()]
+
+
+def join_records(records: list[bytes]) -> bytes:
+    """Join serialized records into a JSON array.
+
+    :param records: JSON objects as returned by encode_records().
+    :return: The JSON array as UTF-8 encoded bytes.
+    """
+    return b"[" + b",".join(records) + b"]"
+
+
+def encode_ndjson(batch: InsuranceBatch) -> bytes:
+    """Serialize a batch as newline-delimited JSON of nested records.
+
+    :param batch: The batch to serialize.
+    :return: Bytes with one compact JSON document per line, each terminated by a newline.
+    """
+    return b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in batch.to_dicts())
+
+
+class FastJSONResponse(Response):
+    """JSON response serialized with orjson, bypassing jsonable_encoder and the stdlib json encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content of the response.
+
+        :param content: The content to serialize.
+        :return: The JSON document as UTF-8 encoded bytes.
+        """
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -1,20 +1,170 @@
 """There is module for Singleton pattern."""
 
-from faker import Faker
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from threading import local
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+# Faker providers the generators use; the base provider with random_* helpers is always included
+FAKER_PROVIDERS = ("faker.providers.address", "faker.providers.date_time", "faker.providers.person")
+
+# Number of locale instances of Faker every thread keeps before evicting the least recently used one
+LOCALE_CACHE_SIZE = 8
 
 
 class FakerSingleton:
-    """Singleton class for creating and reusing a single instance of Faker."""
+    """Singleton class for creating and reusing Faker instances, one instance per thread.
+
+    FastAPI runs sync endpoints in a threadpool, so a single shared Faker (and its single random.Random)
+    would make concurrent requests contend for and interfere with the same random state. Every thread
+    gets its own lazily created instance instead, which is reused for all work done on that thread.
+    Work on the event loop thread is synchronous, so asyncio tasks cannot interleave within a block
+    that uses the instance.
+
+    Faker itself is imported and constructed on first use rather than at import time, and only the
+    providers in FAKER_PROVIDERS are loaded, which keeps the start-up of short-lived workers cheap.
+
+    Instances for other locales are expensive to construct too, so every thread keeps the most recently
+    used ones in a small LRU cache, bounded by LOCALE_CACHE_SIZE (see configure()).
+    """
+
+    __local = local()
+    __providers: tuple[str, ...] | None = FAKER_PROVIDERS
+    __locale_cache_size = LOCALE_CACHE_SIZE
+
+    @staticmethod
+    def configure(
+        providers: Sequence[str] | None = FAKER_PROVIDERS, locale_cache_size: int = LOCALE_CACHE_SIZE
+    ) -> None:
+        """Configure the providers and the locale cache of Faker instances created from now on.
+
+        Instances that threads have already created keep their providers, so call this before the
+        first use, e.g. to load all default providers for code that needs providers beyond the ones
+        the generators use.
+
+        :param providers: The module paths of the providers, or None to load all default providers.
+        :param locale_cache_size: The number of locale instances every thread keeps.
+        """
+        if not isinstance(locale_cache_size, int) or locale_cache_size < 1:
+            raise ValueError("Locale cache size must be a positive integer.")
+        FakerSingleton.__providers = tuple(providers) if providers is not None else None
+        FakerSingleton.__locale_cache_size = locale_cache_size
+
+    @staticmethod
+    def create_instance(locale: str | None = None) -> "Faker":
+        """Create a new Faker instance with the configured providers.
+
+        :param locale: The locale of the instance, e.g. 'de_DE' (default is Faker's default locale).
+        :return: A new instance of Faker with its own random state, not shared with any thread.
+        """
+        from faker import Faker
+
+        providers = FakerSingleton.__providers
+        instance = Faker(locale, providers=list(providers) if providers is not None else None)
+        # New instances share the module-level random.Random of faker.generator; give this one its own,
+        # seeded from system randomness
+        instance.seed_instance()
+        return instance
+
+    @staticmethod
+    def get_locale_instance(locale: str) -> "Faker":
+        """Get the Faker instance of a locale from the LRU cache of the calling thread.
+
+        :param locale: The locale of the instance, e.g. 'de_DE'.
+        :return: The Faker instance of the locale for the calling thread.
+        """
+        instances = getattr(FakerSingleton.__local, "locales", None)
+        if instances is None:
+            instances = FakerSingleton.__local.locales = OrderedDict()
+        instance = instances.get(locale)
+        if instance is not None:
+            instances.move_to_end(locale)
+            return instance
+        instance = instances[locale] = FakerSingleton.create_instance(locale)
+        while len(instances) > FakerSingleton.__locale_cache_size:
+            instances.popitem(last=False)
+        return instance
 
-    __instance = None
+    @staticmethod
+    def get_instance() -> "Faker":
+        """Get the instance of Faker of the calling thread.
+
+        Within a localized() block this is the instance of that locale.
+
+        :return: The Faker instance of the calling thread.
+        """
+        instance = getattr(FakerSingleton.__local, "instance", None)
+        if instance is None:
+            # Create a new instance of Faker if this thread doesn't have one yet
+            instance = FakerSingleton.__local.instance = FakerSingleton.create_instance()
+        return instance
 
     @staticmethod
-    def get_instance() -> Faker:
-        """Get the singleton instance of Faker.
+    def proxy() -> "FakerProxy":
+        """Get a proxy that forwards to the Faker instance of whichever thread uses it.
+
+        Modules keep the proxy in a module-level variable, so they do not bind one thread's instance
+        at import time.
 
-        :return: A single instance of Faker.
+        :return: A proxy of the Faker instance of the calling thread.
         """
-        if FakerSingleton.__instance is None:
-            # Create a new instance of Faker if it doesn't exist
-            FakerSingleton.__instance = Faker()
-        return FakerSingleton.__instance
+        return _FAKER_PROXY
+
+    @staticmethod
+    @contextmanager
+    def localized(locale: str | None) -> Iterator["Faker"]:
+        """Make the instance of a locale the instance of the calling thread for the duration of a with block.
+
+        Within the block, get_instance() and the proxy return the locale instance, so all generators
+        produce data of that locale. When locale is None the current instance is kept.
+
+        :param locale: The locale, e.g. 'de_DE', or None to keep the current instance.
+        :return: A context manager yielding the instance of the locale.
+        """
+        previous = FakerSingleton.get_instance()
+        if locale is None:
+            yield previous
+            return
+        instance = FakerSingleton.__local.instance = FakerSingleton.get_locale_instance(locale)
+        try:
+            yield instance
+        finally:
+            FakerSingleton.__local.instance = previous
+
+    @staticmethod
+    @contextmanager
+    def seeded(seed: int | None) -> Iterator["Faker"]:
+        """Seed the Faker instance of the calling thread for the duration of a with block.
+
+        The instance is reseeded from system randomness on exit, so generation outside the block
+        stays unpredictable. When seed is None the instance is left untouched. Other threads are not
+        affected, so seeded blocks on different threads produce the same data for the same seed.
+
+        :param seed: The seed value, or None to keep the current random state.
+        :return: A context manager yielding the seeded instance of Faker.
+        """
+        instance = FakerSingleton.get_instance()
+        if seed is None:
+            yield instance
+            return
+        instance.seed_instance(seed)
+        try:
+            yield instance
+        finally:
+            instance.seed_instance()
+
+
+class FakerProxy:
+    """Proxy forwarding attribute access to the Faker instance of the calling thread."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(FakerSingleton.get_instance(), name)
+
+
+_FAKER_PROXY = FakerProxy()
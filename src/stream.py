@@ -0,0 +1,35 @@
+"""Module provides generator pipelines to stream large amounts of fake car insurance data."""
+
+from collections.abc import Iterator, Sequence
+
+from src.fake_data import generate_insurance_batch
+from src.record import InsuranceBatch
+
+# Number of records generated and flushed together by the streaming pipeline
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+def iter_fake_data_chunks(
+    count: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pooled: bool = False,
+    locale: str | Sequence[str] | None = None,
+) -> Iterator[InsuranceBatch]:
+    """Lazily generate fake car insurance data in chunks.
+
+    Only one chunk is held in memory at a time, so memory usage does not depend on count.
+
+    :param count: The total number of records to generate.
+    :param chunk_size: The maximum number of records in a single chunk.
+    :param pooled: Sample names and addresses from precomputed value pools.
+    :param locale: The locale of the records, or a list of locales to mix (optional).
+    :return: An iterator over batches of fake car insurance data.
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield generate_insurance_batch(size, pooled=pooled, locale=locale)
+        remaining -= size
@@ -0,0 +1,228 @@
+"""Module provides memory-compact registries that guarantee unique policy numbers and VINs.
+
+Memory usage does not grow with the number of stored keys in the same way as a Python set would:
+
+* policy numbers are tracked exactly in a bitset with one bit per possible 9-digit number, which takes
+  a fixed 112.5 MB whether it holds 10 thousand or 100 million keys. Random bodies are spread over the
+  whole bitset and a 4 KiB page covers 32,768 numbers, so after ~100k keys nearly every page has been
+  touched and the full 112.5 MB is resident;
+* VINs are tracked in a Bloom filter sized for the expected number of keys at a false positive rate of
+  1e-4, which takes ~19.2 bits (2.4 bytes) per key, i.e. ~24 MB per 10M VINs. A false positive only
+  rejects a fresh VIN and causes a redraw, so it can never let a duplicate through.
+
+For comparison, a Python set of 10M strings takes well over 1 GB.
+
+Both registries can live in shared memory so the uniqueness state is shared by a pool of worker processes.
+Shared registries are allocated in /dev/shm, which must then hold 112.5 MB plus the VIN filter (~2.4
+bytes per VIN of capacity); Docker's default of 64 MB is too small, so run containers with e.g.
+--shm-size=256m.
+"""
+
+from collections.abc import Iterable
+from contextlib import nullcontext
+from hashlib import blake2b
+from math import ceil, log
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+
+# Smallest 9-digit number and the number of 9-digit numbers a policy number can contain
+POLICY_NUMBER_MIN = 10**8
+POLICY_NUMBER_SPACE = 9 * 10**8
+
+# Default number of VINs the Bloom filter is sized for
+DEFAULT_VIN_CAPACITY = 10_000_000
+
+# False positive rate of the VIN Bloom filter at full capacity
+VIN_FALSE_POSITIVE_RATE = 1e-4
+
+
+class Bitset:
+    """Fixed-size bitset backed by a private bytearray or by a named shared memory block."""
+
+    def __init__(self, size: int, shared: bool = False, name: str | None = None):
+        self.size = size
+        self._shared_memory = None
+        if name is not None:
+            self._shared_memory = SharedMemory(name=name)
+            self._bits = self._shared_memory.buf
+        elif shared:
+            # Shared memory blocks are zero-filled on creation
+            self._shared_memory = SharedMemory(create=True, size=ceil(size / 8))
+            self._bits = self._shared_memory.buf
+        else:
+            self._bits = bytearray(ceil(size / 8))
+
+    @property
+    def name(self) -> str | None:
+        """Name of the shared memory block, or None when the bitset is private."""
+        return self._shared_memory.name if self._shared_memory else None
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def add(self, index: int) -> None:
+        """Set a bit.
+
+        :param index: The index of the bit.
+        """
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def close(self, unlink: bool = False) -> None:
+        """Release the shared memory block of the bitset.
+
+        :param unlink: Also destroy the shared memory block; only its creator should do that.
+        """
+        if self._shared_memory is not None:
+            self._bits = None
+            self._shared_memory.close()
+            if unlink:
+                self._shared_memory.unlink()
+
+
+class PolicyNumberRegistry:
+    """Exact registry of claimed 9-digit policy number bodies, one bit per possible number."""
+
+    def __init__(self, bitset: Bitset | None = None, lock=None):
+        self.bitset = bitset or Bitset(POLICY_NUMBER_SPACE)
+        self.lock = lock or nullcontext()
+
+    def claim(self, numbers: Iterable[int]) -> list[int]:
+        """Claim policy number bodies, rejecting the ones claimed before or repeated within the batch.
+
+        :param numbers: The 9-digit numbers to claim.
+        :return: A list of the numbers that were claimed, in their original order.
+        """
+        claimed = []
+        with self.lock:
+            for number in numbers:
+                index = number - POLICY_NUMBER_MIN
+                if index not in self.bitset:
+                    self.bitset.add(index)
+                    claimed.append(number)
+        return claimed
+
+    def check_and_add(self, numbers: Iterable[int]) -> list[bool]:
+        """Add policy number bodies and report for each one whether it was added before.
+
+        :param numbers: The 9-digit numbers to add.
+        :return: A list of flags, True for the numbers added before (or repeated within numbers).
+        """
+        seen = []
+        bitset = self.bitset
+        with self.lock:
+            for number in numbers:
+                index = number - POLICY_NUMBER_MIN
+                seen.append(index in bitset)
+                bitset.add(index)
+        return seen
+
+
+class VinRegistry:
+    """Bloom filter registry of claimed VINs.
+
+    A VIN that may have been claimed before is rejected, so false positives cause redraws but a
+    duplicate can never be accepted.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_VIN_CAPACITY, bitset: Bitset | None = None, lock=None):
+        self.capacity = capacity
+        self.size, self.hashes = bloom_filter_parameters(capacity, VIN_FALSE_POSITIVE_RATE)
+        self.bitset = bitset or Bitset(self.size)
+        self.lock = lock or nullcontext()
+
+    def _positions(self, vin: str) -> list[int]:
+        """Calculate the bit positions of a VIN with double hashing.
+
+        :param vin: The VIN.
+        :return: A list of bit positions.
+        """
+        digest = blake2b(vin.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def claim(self, vins: Iterable[str]) -> list[str]:
+        """Claim VINs, rejecting the ones that may have been claimed before or repeat within the batch.
+
+        :param vins: The VINs to claim.
+        :return: A list of the VINs that were claimed, in their original order.
+        """
+        claimed = []
+        bitset = self.bitset
+        with self.lock:
+            for vin in vins:
+                positions = self._positions(vin)
+                if not all(position in bitset for position in positions):
+                    for position in positions:
+                        bitset.add(position)
+                    claimed.append(vin)
+        return claimed
+
+
+def bloom_filter_parameters(capacity: int, false_positive_rate: float) -> tuple[int, int]:
+    """Calculate the optimal size and number of hash functions of a Bloom filter.
+
+    :param capacity: The number of keys the filter is sized for.
+    :param false_positive_rate: The false positive rate at full capacity.
+    :return: A tuple of the size in bits and the number of hash functions.
+    """
+    if not isinstance(capacity, int) or capacity < 1:
+        raise ValueError("Capacity must be a positive integer.")
+    size = ceil(-capacity * log(false_positive_rate) / log(2) ** 2)
+    hashes = max(1, round(size / capacity * log(2)))
+    return size, hashes
+
+
+class UniqueKeys:
+    """Uniqueness state for the policy numbers and VINs of a dataset.
+
+    With shared=True both registries live in shared memory and are guarded by a process lock. Such an
+    instance can be passed to worker processes (e.g. as a pool initializer argument), where it attaches
+    to the same shared memory. The creator should call close() or use the instance as a context manager.
+    """
+
+    def __init__(self, vin_capacity: int = DEFAULT_VIN_CAPACITY, shared: bool = False):
+        self.shared = shared
+        self._owner = True
+        lock = Lock() if shared else None
+        self.policy_numbers = PolicyNumberRegistry(Bitset(POLICY_NUMBER_SPACE, shared=shared), lock)
+        vin_size, _ = bloom_filter_parameters(vin_capacity, VIN_FALSE_POSITIVE_RATE)
+        self.vins = VinRegistry(vin_capacity, Bitset(vin_size, shared=shared), lock)
+
+    @classmethod
+    def _attach(cls, vin_capacity: int, policy_number_name: str, vin_name: str, lock) -> "UniqueKeys":
+        """Attach to the shared memory of a UniqueKeys instance created by another process.
+
+        :param vin_capacity: The VIN capacity of the original instance.
+        :param policy_number_name: The name of the shared policy number bitset.
+        :param vin_name: The name of the shared VIN bitset.
+        :param lock: The process lock of the original instance.
+        :return: A UniqueKeys instance sharing the state of the original instance.
+        """
+        instance = cls.__new__(cls)
+        instance.shared = True
+        instance._owner = False
+        instance.policy_numbers = PolicyNumberRegistry(Bitset(POLICY_NUMBER_SPACE, name=policy_number_name), lock)
+        vin_size, _ = bloom_filter_parameters(vin_capacity, VIN_FALSE_POSITIVE_RATE)
+        instance.vins = VinRegistry(vin_capacity, Bitset(vin_size, name=vin_name), lock)
+        return instance
+
+    def __reduce__(self):
+        if not self.shared:
+            raise TypeError("Only UniqueKeys created with shared=True can be passed to other processes.")
+        return UniqueKeys._attach, (
+            self.vins.capacity,
+            self.policy_numbers.bitset.name,
+            self.vins.bitset.name,
+            self.policy_numbers.lock,
+        )
+
+    def close(self) -> None:
+        """Release the shared memory; the creating process also destroys it."""
+        self.policy_numbers.bitset.close(unlink=self._owner)
+        self.vins.bitset.close(unlink=self._owner)
+
+    def __enter__(self) -> "UniqueKeys":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,589 @@
+"""Module provides a bulk validator of exported fake car insurance datasets.
+
+The dataset is split into chunks (line-aligned byte ranges of NDJSON and CSV files, row groups of
+Parquet files) that are parsed into columns and checked column-wise, optionally in a pool of worker
+processes:
+
+* formats of policy numbers, VINs (including the ISO 3779 check digit) and phone numbers of every
+  supported locale, and non-empty names and addresses,
+* valid MM/DD/YYYY dates, a policy term of exactly POLICY_TERM_DAYS days and an owner age within the
+  age window at the insurance start date,
+* uniqueness of policy numbers and VINs across the whole dataset.
+
+Uniqueness is checked in two passes with bounded memory. In the first pass the workers reduce the keys
+to integers, the 9-digit bodies of policy numbers and 64-bit fingerprints of VINs, and the main process
+flags the bodies seen before in an exact bitset (see src.unique) and the fingerprints a Bloom filter
+may have seen before. Only when keys were flagged, a second pass collects the rows of the flagged keys
+and reports the exact duplicates. Violations are reported with 1-based record numbers (the
+header of a CSV file is not counted). CSV files are split at line breaks, so fields must not contain
+line breaks, which holds for every exported dataset.
+
+Usage::
+
+    python -m src.validate data.ndjson --workers 8
+"""
+
+import csv
+import re
+import sys
+from argparse import ArgumentParser
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache, partial
+from hashlib import blake2b
+from math import ceil
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+import orjson
+
+from src.car import vin_check_digit
+from src.export import COLUMNS
+from src.insurance import POLICY_TERM_DAYS
+from src.locales import LOCALE_FORMATS, LocaleFormat
+from src.owner import birthdate_window
+from src.unique import PolicyNumberRegistry
+
+# Number of bytes of an NDJSON or CSV file validated as one chunk
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Number of violations reported in full; all violations are counted
+DEFAULT_MAX_VIOLATIONS = 100
+
+# Formats of the extensions of exported datasets; other extensions require an explicit format
+FORMATS_BY_SUFFIX = {".jsonl": "ndjson", ".ndjson": "ndjson", ".csv": "csv", ".parquet": "parquet"}
+
+# Age window of owners at the insurance start date, as generated by generate_birthdate_batch()
+MINIMUM_AGE = 18
+MAXIMUM_AGE = 63
+
+# Rough lower bound of the size of an exported record in bytes, used to size the VIN Bloom filter
+MIN_RECORD_BYTES = 100
+
+# Bits per VIN and probes of the VIN Bloom filter; false positives only cost work in the second pass
+FILTER_BITS_PER_KEY = 16
+FILTER_PROBES = 3
+
+# Formats of the validated fields
+POLICY_NUMBER_PATTERN = re.compile(
+    f"(?:{'|'.join(sorted({locale_format.policy_prefix for locale_format in LOCALE_FORMATS.values()}))})"
+    r"[1-9]\d{8}[A-Z]{2}"
+)
+VIN_PATTERN = re.compile(r"[A-HJ-NPR-Z0-9]{8}[0-9X][A-HJ-NPR-Z0-9]{8}")
+DATE_PATTERN = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+
+def _phone_pattern(locale_format: LocaleFormat) -> str:
+    """Build the regular expression of the phone numbers of a locale, as generated by generate_phone_batch().
+
+    :param locale_format: The formats of the locale.
+    :return: The regular expression.
+    """
+    groups = [
+        r"\d" if digits == 1 else rf"[1-9]\d{{{digits - 1}}}" if digits else "" for digits in locale_format.phone_groups
+    ]
+    prefixes = "|".join(map(re.escape, locale_format.phone_prefixes))
+    return rf"\+{locale_format.country_code} (?:{prefixes}){groups[0]}" + "".join(f" {group}" for group in groups[1:])
+
+
+PHONE_PATTERN = re.compile(
+    "|".join(f"(?:{_phone_pattern(locale_format)})" for locale_format in LOCALE_FORMATS.values())
+)
+
+# Indexes of the columns in COLUMNS
+(
+    POLICY_NUMBER,
+    FIRST_NAME,
+    LAST_NAME,
+    BIRTH_DATE,
+    ADDRESS,
+    PHONE,
+    VIN,
+    START_DATE,
+    END_DATE,
+) = range(len(COLUMNS))
+
+
+class Violation(NamedTuple):
+    """A violated check of a record."""
+
+    row: int
+    check: str
+    message: str
+
+
+class ChunkResult(NamedTuple):
+    """The result of validating a chunk: row count, violations and the keys checked for uniqueness."""
+
+    rows: int
+    counts: Counter
+    violations: list[Violation]
+    policy_bodies: array
+    vin_fingerprints: array
+
+
+class FingerprintFilter:
+    """Bloom filter of 64-bit fingerprints with few probes, flagging keys that may repeat."""
+
+    def __init__(self, capacity: int):
+        """Initialize the filter.
+
+        :param capacity: The number of keys the filter is sized for.
+        """
+        self.size = max(64, capacity * FILTER_BITS_PER_KEY)
+        self._bits = bytearray(ceil(self.size / 8))
+
+    def check_and_add(self, fingerprints: array) -> list[int]:
+        """Add fingerprints and return the ones that may have been added before.
+
+        :param fingerprints: The fingerprints to add.
+        :return: The fingerprints that may have been added before, including repeats within fingerprints.
+        """
+        bits, size = self._bits, self.size
+        flagged = []
+        for fingerprint in fingerprints:
+            # The halves of a fingerprint are the two hashes of double hashing
+            first, second = fingerprint & 0xFFFFFFFF, (fingerprint >> 32) | 1
+            seen = True
+            for probe in range(FILTER_PROBES):
+                position = (first + probe * second) % size
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    seen = False
+                    bits[position >> 3] |= mask
+            if seen:
+                flagged.append(fingerprint)
+        return flagged
+
+
+@dataclass
+class ValidationReport:
+    """The result of validating a dataset."""
+
+    rows: int = 0
+    counts: Counter = field(default_factory=Counter)
+    violations: list[Violation] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the dataset has no violations."""
+        return not self.counts
+
+    def add(self, violations: list[Violation], counts: Counter, max_violations: int) -> None:
+        """Add the violations of a chunk.
+
+        :param violations: The violations to report in full, with dataset row numbers.
+        :param counts: The number of violations of every check.
+        :param max_violations: The maximum number of violations reported in full.
+        """
+        self.counts.update(counts)
+        self.violations += violations[: max(0, max_violations - len(self.violations))]
+
+
+@lru_cache(maxsize=2**16)
+def _date_ordinal(text: str) -> int | None:
+    """Convert a date in MM/DD/YYYY format into its ordinal.
+
+    :param text: The date.
+    :return: The ordinal of the date, or None when it is not a valid date in that format.
+    """
+    if not isinstance(text, str) or DATE_PATTERN.fullmatch(text) is None:
+        return None
+    try:
+        return date(int(text[6:10]), int(text[0:2]), int(text[3:5])).toordinal()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2**12)
+def _age_window(start_ordinal: int, window_days: int) -> tuple[int, int]:
+    """Calculate the window of valid birthdates of an owner for an insurance start date.
+
+    Birthdates are generated for the ages at the generation date, which lies up to window_days after
+    the start date.
+
+    :param start_ordinal: The ordinal of the insurance start date.
+    :param window_days: The number of days start dates were spread over before the generation date.
+    :return: A tuple of the ordinals of the earliest and the latest valid birthdate.
+    """
+    earliest, _ = birthdate_window(date.fromordinal(start_ordinal), MINIMUM_AGE, MAXIMUM_AGE)
+    _, latest = birthdate_window(date.fromordinal(start_ordinal + window_days), MINIMUM_AGE, MAXIMUM_AGE)
+    return earliest, latest
+
+
+def vin_fingerprint(vin: str) -> int:
+    """Reduce a VIN to a 64-bit fingerprint.
+
+    :param vin: The VIN.
+    :return: The fingerprint.
+    """
+    return int.from_bytes(blake2b(vin.encode(), digest_size=8).digest(), "little")
+
+
+def _check_pattern(pattern: re.Pattern, column: list) -> list[int]:
+    """Find the values of a column that do not match a pattern.
+
+    :param pattern: The compiled pattern.
+    :param column: The values.
+    :return: The indexes of the values that are not strings matching the whole pattern.
+    """
+    fullmatch = pattern.fullmatch
+    return [index for index, value in enumerate(column) if not isinstance(value, str) or fullmatch(value) is None]
+
+
+def check_columns(columns: list[list], window_days: int = 0) -> list[tuple[int, str, str]]:
+    """Check the columns of a chunk of records.
+
+    :param columns: The columns in COLUMNS order.
+    :param window_days: The number of days start dates were spread over before the generation date.
+    :return: A list of (index, check, message) tuples of the violations, ordered by check.
+    """
+    violations = []
+
+    def report(check: str, indexes: list[int], column: int, message: str) -> None:
+        values = columns[column]
+        violations.extend((index, check, f"{message}: {values[index]!r}") for index in indexes)
+
+    report(
+        "policy_number_format",
+        _check_pattern(POLICY_NUMBER_PATTERN, columns[POLICY_NUMBER]),
+        POLICY_NUMBER,
+        "invalid policy number",
+    )
+    for column, name in ((FIRST_NAME, "first_name"), (LAST_NAME, "last_name"), (ADDRESS, "address")):
+        empty = [
+            index for index, value in enumerate(columns[column]) if not isinstance(value, str) or not value.strip()
+        ]
+        report(f"{name}_empty", empty, column, f"empty {name.replace('_', ' ')}")
+    report("phone_format", _check_pattern(PHONE_PATTERN, columns[PHONE]), PHONE, "invalid phone number")
+
+    vins = columns[VIN]
+    bad_vins = set(_check_pattern(VIN_PATTERN, vins))
+    report("vin_format", sorted(bad_vins), VIN, "invalid VIN")
+    check_digits = [index for index, vin in enumerate(vins) if index not in bad_vins and vin[8] != vin_check_digit(vin)]
+    report("vin_check_digit", check_digits, VIN, "wrong VIN check digit")
+
+    ordinals = {}
+    for column, name in ((BIRTH_DATE, "birth_date"), (START_DATE, "start_date"), (END_DATE, "end_date")):
+        ordinals[column] = list(map(_date_ordinal, columns[column]))
+        invalid = [index for index, ordinal in enumerate(ordinals[column]) if ordinal is None]
+        report(f"{name}_format", invalid, column, f"invalid {name.replace('_', ' ')}")
+
+    terms = [
+        index
+        for index, (start, end) in enumerate(zip(ordinals[START_DATE], ordinals[END_DATE], strict=True))
+        if start is not None and end is not None and end - start != POLICY_TERM_DAYS
+    ]
+    report("policy_term", terms, END_DATE, f"end date is not {POLICY_TERM_DAYS} days after the start date")
+
+    ages = []
+    for index, (birth, start) in enumerate(zip(ordinals[BIRTH_DATE], ordinals[START_DATE], strict=True)):
+        if birth is not None and start is not None:
+            earliest, latest = _age_window(start, window_days)
+            if not earliest <= birth <= latest:
+                ages.append(index)
+    report("owner_age", ages, BIRTH_DATE, f"owner is not {MINIMUM_AGE}-{MAXIMUM_AGE} years old at the start date")
+    return violations
+
+
+def _ndjson_rows(lines: list[bytes]) -> Iterator[tuple | None]:
+    """Parse NDJSON lines into flat rows in COLUMNS order.
+
+    :param lines: The lines of the chunk.
+    :return: An iterator over rows, None for a line that is not a valid record.
+    """
+    loads = orjson.loads
+    for line in lines:
+        try:
+            record = loads(line)
+            owner, car, insurance = record["owner"], record["car"], record["insurance"]
+            yield (
+                record["policy_number"],
+                owner["first_name"],
+                owner["last_name"],
+                owner["birth_date"],
+                owner["address"],
+                owner["phone"],
+                car["vin"],
+                insurance["start_date"],
+                insurance["end_date"],
+            )
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            yield None
+
+
+def _csv_rows(lines: list[bytes]) -> Iterator[tuple | None]:
+    """Parse CSV lines into flat rows in COLUMNS order.
+
+    :param lines: The lines of the chunk.
+    :return: An iterator over rows, None for a line without the expected number of fields.
+    """
+    for row in csv.reader(line.decode("utf-8", "replace") for line in lines):
+        yield tuple(row) if len(row) == len(COLUMNS) else None
+
+
+def _read_lines(path: Path, start: int, stop: int) -> list[bytes]:
+    """Read the lines of a byte range of a file that starts and ends at line boundaries.
+
+    :param path: The path of the file.
+    :param start: The offset of the first byte.
+    :param stop: The offset after the last byte.
+    :return: The lines without line breaks.
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        return file.read(stop - start).splitlines()
+
+
+def _chunk_columns(path: Path, file_format: str, chunk: tuple[int, int]) -> tuple[list[list], list[int]]:
+    """Read a chunk of a dataset into columns.
+
+    :param path: The path of the dataset.
+    :param file_format: The format of the dataset.
+    :param chunk: The byte range of an NDJSON or CSV chunk, or the row group index of a Parquet chunk.
+    :return: A tuple of the columns in COLUMNS order and the indexes of malformed rows.
+    """
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        table = pyarrow.parquet.ParquetFile(path).read_row_group(chunk[0], columns=list(COLUMNS)).to_pydict()
+        return [table[column] for column in COLUMNS], []
+
+    parse = _ndjson_rows if file_format == "ndjson" else _csv_rows
+    rows = list(parse(_read_lines(path, *chunk)))
+    malformed = [index for index, row in enumerate(rows) if row is None]
+    if malformed:
+        empty = (None,) * len(COLUMNS)
+        rows = [row or empty for row in rows]
+    columns = [list(column) for column in zip(*rows, strict=True)] if rows else [[] for _ in COLUMNS]
+    return columns, malformed
+
+
+def validate_chunk(
+    path: Path, file_format: str, window_days: int, max_violations: int, chunk: tuple[int, int]
+) -> ChunkResult:
+    """Validate a chunk of a dataset.
+
+    :param path: The path of the dataset.
+    :param file_format: The format of the dataset.
+    :param window_days: The number of days start dates were spread over before the generation date.
+    :param max_violations: The maximum number of violations returned in full.
+    :param chunk: The chunk, as returned by iter_chunks().
+    :return: The result of the chunk with row numbers relative to the chunk.
+    """
+    columns, malformed = _chunk_columns(path, file_format, chunk)
+    rows = len(columns[0])
+    violations = [(index, "malformed_record", "not a record of the expected layout") for index in malformed]
+    if malformed:
+        # Check the remaining rows only
+        keep = sorted(set(range(rows)) - set(malformed))
+        checked = check_columns([[column[index] for index in keep] for column in columns], window_days)
+        violations += [(keep[index], check, message) for index, check, message in checked]
+    else:
+        checked = check_columns(columns, window_days)
+        violations += checked
+    counts = Counter(check for _, check, _ in violations)
+    violations.sort()
+    reported = [Violation(index, check, message) for index, check, message in violations[:max_violations]]
+    return ChunkResult(rows, counts, reported, *_unique_keys(columns))
+
+
+def _unique_keys(columns: list[list]) -> tuple[array, array]:
+    """Reduce the keys of a chunk that are checked for uniqueness to integers.
+
+    Keys of an invalid format cannot be compared reliably and are reported by the format checks, so
+    they are skipped.
+
+    :param columns: The columns of the chunk in COLUMNS order.
+    :return: A tuple of the policy number bodies and the VIN fingerprints.
+    """
+    fullmatch = POLICY_NUMBER_PATTERN.fullmatch
+    bodies = array("Q", [int(key[2:11]) for key in columns[POLICY_NUMBER] if isinstance(key, str) and fullmatch(key)])
+    fullmatch = VIN_PATTERN.fullmatch
+    fingerprints = array("Q", [vin_fingerprint(key) for key in columns[VIN] if isinstance(key, str) and fullmatch(key)])
+    return bodies, fingerprints
+
+
+def find_flagged_keys(
+    path: Path,
+    file_format: str,
+    policy_bodies: frozenset[int],
+    vin_fingerprints: frozenset[int],
+    chunk: tuple[int, int],
+) -> tuple[int, list[tuple[int, str, str]]]:
+    """Find the rows of a chunk of a dataset with flagged keys, without checking the records.
+
+    :param path: The path of the dataset.
+    :param file_format: The format of the dataset.
+    :param policy_bodies: The flagged policy number bodies.
+    :param vin_fingerprints: The flagged VIN fingerprints.
+    :param chunk: The chunk, as returned by iter_chunks().
+    :return: A tuple of the number of rows of the chunk and (index, check, key) tuples of the flagged rows.
+    """
+    columns, _ = _chunk_columns(path, file_format, chunk)
+    flagged = []
+    fullmatch = POLICY_NUMBER_PATTERN.fullmatch
+    for index, key in enumerate(columns[POLICY_NUMBER]):
+        if isinstance(key, str) and fullmatch(key) and int(key[2:11]) in policy_bodies:
+            flagged.append((index, "policy_number_unique", key))
+    fullmatch = VIN_PATTERN.fullmatch
+    for index, key in enumerate(columns[VIN]):
+        if isinstance(key, str) and fullmatch(key) and vin_fingerprint(key) in vin_fingerprints:
+            flagged.append((index, "vin_unique", key))
+    return len(columns[0]), flagged
+
+
+def iter_chunks(path: Path, file_format: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[tuple[int, int]]:
+    """Split a dataset into chunks.
+
+    :param path: The path of the dataset.
+    :param file_format: The format of the dataset.
+    :param chunk_bytes: The approximate number of bytes of an NDJSON or CSV chunk.
+    :return: An iterator over byte ranges aligned to line boundaries, or over (row group index, 0) tuples.
+    """
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        for row_group in range(pyarrow.parquet.ParquetFile(path).num_row_groups):
+            yield row_group, 0
+        return
+
+    size = path.stat().st_size
+    with open(path, "rb") as file:
+        start = 0
+        if file_format == "csv":
+            header = file.readline()
+            if tuple(next(csv.reader([header.decode("utf-8", "replace")]), ())) != COLUMNS:
+                raise ValueError(f"'{path}' does not have the header of an exported CSV file.")
+            start = len(header)
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            stop = min(file.tell(), size)
+            yield start, stop
+            start = stop
+
+
+def _find_duplicates(
+    find_chunk_keys: Callable[[tuple[int, int]], tuple[int, list[tuple[int, str, str]]]],
+    chunks: list[tuple[int, int]],
+    map_chunks: Callable,
+) -> Iterator[Violation]:
+    """Find the exact duplicates among the rows of flagged keys with a second pass over the dataset.
+
+    :param find_chunk_keys: find_flagged_keys() bound to the dataset and the flagged keys.
+    :param chunks: The chunks of the dataset.
+    :param map_chunks: A function mapping a function over the chunks, in order.
+    :return: An iterator over the duplicates, with the row number of the first occurrence in the message.
+    """
+    first_rows: dict[tuple[str, str], int] = {}
+    offset = 0
+    for rows, flagged in map_chunks(find_chunk_keys, chunks):
+        for index, check, key in flagged:
+            row = offset + index + 1
+            first = first_rows.setdefault((check, key), row)
+            if first != row:
+                yield Violation(row, check, f"duplicate of row {first}: {key!r}")
+        offset += rows
+
+
+def validate_dataset(
+    path: Path,
+    file_format: str | None = None,
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    window_days: int = 0,
+    max_violations: int = DEFAULT_MAX_VIOLATIONS,
+) -> ValidationReport:
+    """Validate an exported dataset.
+
+    :param path: The path of the dataset.
+    :param file_format: 'ndjson', 'csv' or 'parquet' (default is derived from the file extension, see
+        FORMATS_BY_SUFFIX).
+    :param workers: The number of worker processes; 1 validates in the calling process.
+    :param chunk_bytes: The approximate number of bytes of an NDJSON or CSV chunk.
+    :param window_days: The number of days start dates were spread over before the generation date
+        (the --window-days of the export).
+    :param max_violations: The maximum number of violations reported in full.
+    :return: The validation report.
+    """
+    path = Path(path)
+    file_format = file_format or FORMATS_BY_SUFFIX.get(path.suffix.lower())
+    if file_format not in ("ndjson", "csv", "parquet"):
+        raise ValueError(f"Unsupported dataset format '{file_format or path.suffix}'; pass --format to set it.")
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("Workers must be a positive integer.")
+
+    chunks = list(iter_chunks(path, file_format, chunk_bytes))
+    policy_numbers, vins = PolicyNumberRegistry(), FingerprintFilter(path.stat().st_size // MIN_RECORD_BYTES)
+    flagged_bodies: set[int] = set()
+    flagged_fingerprints: set[int] = set()
+    report = ValidationReport()
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    map_chunks = executor.map if executor is not None else map
+    try:
+        check_chunk = partial(validate_chunk, path, file_format, window_days, max_violations)
+        for result in map_chunks(check_chunk, chunks):
+            violations = [Violation(report.rows + row + 1, check, message) for row, check, message in result.violations]
+            report.add(violations, result.counts, max_violations)
+            report.rows += result.rows
+
+            bodies = result.policy_bodies
+            flagged_bodies.update(
+                body for body, seen in zip(bodies, policy_numbers.check_and_add(bodies), strict=True) if seen
+            )
+            flagged_fingerprints.update(vins.check_and_add(result.vin_fingerprints))
+
+        if flagged_bodies or flagged_fingerprints:
+            find_chunk_keys = partial(
+                find_flagged_keys, path, file_format, frozenset(flagged_bodies), frozenset(flagged_fingerprints)
+            )
+            duplicates = list(_find_duplicates(find_chunk_keys, chunks, map_chunks))
+            report.add(sorted(duplicates), Counter(violation.check for violation in duplicates), max_violations)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Validate a dataset, print its violations and return the exit code.
+
+    :param argv: Command line arguments; sys.argv is used when None.
+    :return: 0 when the dataset is valid, 1 otherwise.
+    """
+    parser = ArgumentParser(description="Validate an exported fake car insurance dataset.")
+    parser.add_argument("path", type=Path, help="path of the NDJSON, CSV or Parquet dataset")
+    parser.add_argument("--format", choices=("csv", "ndjson", "parquet"), default=None, help="dataset format")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES, help="bytes of a chunk")
+    parser.add_argument("--window-days", type=int, default=0, help="--window-days the dataset was exported with")
+    parser.add_argument("--max-violations", type=int, default=DEFAULT_MAX_VIOLATIONS, help="violations to print")
+    args = parser.parse_args(argv)
+
+    started = perf_counter()
+    report = validate_dataset(
+        args.path, args.format, args.workers, args.chunk_bytes, args.window_days, args.max_violations
+    )
+    elapsed = perf_counter() - started
+
+    for violation in report.violations:
+        print(f"row {violation.row}: {violation.check}: {violation.message}")
+    for check, count in sorted(report.counts.items()):
+        print(f"{check}: {count} violations", file=sys.stderr)
+    print(
+        f"Validated {report.rows} rows of '{args.path}' in {elapsed:.2f} s: {report.rows / elapsed:.0f} rows/s, "
+        f"{sum(report.counts.values())} violations.",
+        file=sys.stderr,
+    )
+    return 0 if report.valid else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
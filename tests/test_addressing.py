@@ -0,0 +1,86 @@
+"""Module provides tests for counter-based random access generation."""
+
+from datetime import date, timedelta
+
+from pytest import mark, raises
+
+from src.addressing import ADDRESSING_EPOCH, generate_record_at, generate_records_at, record_key
+from tests.test_generate_fake_data import FakeDataModel
+
+AS_OF = date(2026, 1, 1)
+
+
+def test_record_key_depends_on_every_part():
+    """Test that the key of a field changes with the seed, the index and the field."""
+    keys = {record_key(1, 2, "vin"), record_key(2, 2, "vin"), record_key(1, 3, "vin"), record_key(1, 2, "phone")}
+    assert len(keys) == 4, "Every part of the address should change the key."
+    assert record_key(1, 2, "vin") == record_key(1, 2, "vin"), "The key should be deterministic."
+
+
+@mark.parametrize("pooled", [False, True])
+def test_record_does_not_depend_on_order(pooled):
+    """Test that a record is the same whether generated alone, in a range or after other records.
+
+    :param pooled: Sample names and addresses from precomputed value pools.
+    """
+    backwards = [generate_record_at(7, index, pooled, AS_OF) for index in reversed(range(10))][::-1]
+    assert list(generate_records_at(7, 0, 10, pooled, AS_OF)) == backwards, "Ranges should match single records."
+    assert list(generate_records_at(7, 4, 6, pooled, AS_OF)) == backwards[4:6], "A sub-range should match."
+    for record in backwards:
+        FakeDataModel(**record.to_dict())
+
+
+def test_records_differ_by_index_and_seed():
+    """Test that different indexes and seeds address different records."""
+    records = {generate_record_at(seed, index, as_of=AS_OF) for seed in range(3) for index in range(5)}
+    assert len(records) == 15, f"Expected '15' distinct records, but got '{len(records)}'."
+
+
+def test_record_at_large_index_and_locale():
+    """Test that a record far into the dataset is computed directly, in one of the requested locales."""
+    record = generate_record_at(3, 10**12, locale=["de_DE", "fr_FR"], as_of=AS_OF)
+    assert record.policy_number[:2] in ("DE", "FR"), f"Unexpected policy number: '{record.policy_number}'."
+    assert record == generate_record_at(3, 10**12, locale=["de_DE", "fr_FR"], as_of=AS_OF), "Should be reproducible."
+
+
+def test_record_is_pinned_across_days(monkeypatch):
+    """Test that a record addressed without as_of is the same on different days, and as_of moves its dates.
+
+    :param monkeypatch: Pytest fixture moving today to the next day.
+    """
+    today = generate_record_at(7, 5_000_000)
+
+    class Tomorrow(date):
+        """Date whose today() is tomorrow."""
+
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    for module in ("src.addressing", "src.insurance", "src.owner"):
+        monkeypatch.setattr(f"{module}.date", Tomorrow)
+    assert generate_record_at(7, 5_000_000) == today, "An addressed record should not change with the day."
+    assert generate_record_at(7, 5_000_000, as_of=ADDRESSING_EPOCH) == today, "The default as_of should be the epoch."
+    later = generate_record_at(7, 5_000_000, as_of=ADDRESSING_EPOCH + timedelta(days=30))
+    assert later.start_date == "01/31/2026", f"Unexpected start date: '{later.start_date}'."
+    assert later.vin == today.vin, "as_of should only move the dates."
+
+
+@mark.parametrize(
+    ("seed", "index", "error"), [(-1, 0, ValueError), (0, -1, ValueError), (0, 1.5, TypeError), (True, 0, TypeError)]
+)
+def test_record_at_invalid_address(seed, index, error):
+    """Test that invalid seeds and indexes are rejected.
+
+    :param seed: The seed of the dataset.
+    :param index: The index of the record.
+    :param error: The expected exception type.
+    """
+    with raises(error):
+        generate_record_at(seed, index)
+
+
+def test_records_at_invalid_range():
+    """Test that an empty range is rejected."""
+    with raises(ValueError):
+        generate_records_at(0, 5, 5)
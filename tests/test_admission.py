@@ -0,0 +1,133 @@
+"""Module provides tests for the admission control of generation requests."""
+
+import asyncio
+
+from pytest import mark, raises
+
+from src.admission import AdmissionController, OverloadedError, admission_from_environment
+from src.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTIONS, ADMISSION_WAIT
+
+
+def test_requests_are_admitted_up_to_max_records():
+    """Test that requests are admitted right away while their records fit, and released records are freed."""
+
+    async def scenario():
+        controller = AdmissionController(100)
+        weights = [await controller.acquire(60), await controller.acquire(40)]
+        assert controller.in_flight == 100, f"Expected 100 records in flight, but got '{controller.in_flight}'."
+        assert ADMISSION_IN_FLIGHT.value() == 100, "The in-flight gauge should follow the controller."
+        for weight in weights:
+            controller.release(weight)
+        assert controller.in_flight == 0, f"Expected no records in flight, but got '{controller.in_flight}'."
+
+    asyncio.run(scenario())
+
+
+def test_small_requests_pass_waiting_large_ones():
+    """Test that a request that fits is admitted while a larger one waits, and waiters are admitted in order."""
+
+    async def scenario():
+        controller = AdmissionController(10)
+        held = await controller.acquire(8)
+        admitted = []
+
+        async def request(name, records):
+            weight = await controller.acquire(records)
+            admitted.append(name)
+            return weight
+
+        first = asyncio.create_task(request("first", 5))
+        second = asyncio.create_task(request("second", 4))
+        await asyncio.sleep(0)
+        small = await request("small", 2)
+        assert admitted == ["small"], f"The small request should have passed the waiting ones: '{admitted}'."
+        assert controller.queued == 2, f"Expected 2 waiting requests, but got '{controller.queued}'."
+        assert ADMISSION_QUEUE_DEPTH.value() == 2, "The queue depth gauge should follow the controller."
+
+        controller.release(held)
+        controller.release(small)
+        await asyncio.gather(first, second)
+        assert admitted == ["small", "first", "second"], f"Unexpected admission order: '{admitted}'."
+        assert controller.in_flight == 9, f"Expected 9 records in flight, but got '{controller.in_flight}'."
+
+    waits = ADMISSION_WAIT.count("admitted")
+    asyncio.run(scenario())
+    assert ADMISSION_WAIT.count("admitted") - waits == 4, "Every admission should record its wait time."
+
+
+def test_full_queue_rejects_right_away():
+    """Test that a request is rejected without waiting when the queue is full."""
+
+    async def scenario():
+        controller = AdmissionController(10, max_queue=1, max_wait=4)
+        await controller.acquire(10)
+        waiting = asyncio.create_task(controller.acquire(1))
+        await asyncio.sleep(0)
+        with raises(OverloadedError) as e:
+            await controller.acquire(1)
+        assert e.value.retry_after == 2, f"Unexpected Retry-After: '{e.value.retry_after}'."
+        waiting.cancel()
+
+    rejections = ADMISSION_REJECTIONS.value("queue_full")
+    asyncio.run(scenario())
+    assert ADMISSION_REJECTIONS.value("queue_full") - rejections == 1, "The rejection should be counted."
+
+
+def test_wait_timeout_rejects():
+    """Test that a request that waited max_wait seconds is rejected and leaves the queue."""
+
+    async def scenario():
+        controller = AdmissionController(10, max_wait=0.05)
+        await controller.acquire(5)
+        with raises(OverloadedError, match="too long"):
+            await controller.acquire(10)
+        assert controller.queued == 0, f"Expected an empty queue, but got '{controller.queued}'."
+        assert controller.in_flight == 5, f"Expected 5 records in flight, but got '{controller.in_flight}'."
+
+    rejections, timeouts = ADMISSION_REJECTIONS.value("timeout"), ADMISSION_WAIT.count("timeout")
+    asyncio.run(scenario())
+    assert ADMISSION_REJECTIONS.value("timeout") - rejections == 1, "The timeout should be counted."
+    assert ADMISSION_WAIT.count("timeout") - timeouts == 1, "The wait of the rejected request should be recorded."
+
+
+def test_cancelled_request_leaves_the_queue():
+    """Test that a request cancelled while waiting, e.g. by a client disconnect, holds no records."""
+
+    async def scenario():
+        controller = AdmissionController(10)
+        held = await controller.acquire(10)
+        waiting = asyncio.create_task(controller.acquire(3))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with raises(asyncio.CancelledError):
+            await waiting
+        controller.release(held)
+        assert controller.queued == 0 and controller.in_flight == 0, "A cancelled request should hold no records."
+
+    asyncio.run(scenario())
+
+
+@mark.parametrize(("records", "weight"), [(0, 1), (1, 1), (50, 50), (1000, 100)])
+def test_weight_is_clamped(records, weight):
+    """Test that weights are at least 1 and at most max_records, so the largest request can run alone.
+
+    :param records: The number of records of the request.
+    :param weight: The expected weight.
+    """
+    assert AdmissionController(100).weight(records) == weight, f"Unexpected weight of '{records}' records."
+
+
+def test_admission_from_environment():
+    """Test that admission control is enabled by default, configured by the environment and disabled with 0."""
+    controller = admission_from_environment(
+        {
+            "CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT": "500",
+            "CAR_INSURANCE_ADMISSION_QUEUE": "3",
+            "CAR_INSURANCE_ADMISSION_WAIT": "0.5",
+        }
+    )
+    assert (controller.max_records, controller.max_queue, controller.max_wait) == (500, 3, 0.5), "Unexpected limits."
+    assert admission_from_environment({}) is not None, "Admission control should be enabled by default."
+    assert admission_from_environment({"CAR_INSURANCE_MAX_RECORDS_IN_FLIGHT": "0"}) is None, "0 should disable it."
+    with raises(ValueError):
+        AdmissionController(10, max_queue=-1)
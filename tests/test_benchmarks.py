@@ -0,0 +1,73 @@
+"""Module provides tests for the benchmark suite's measurements and baseline comparison."""
+
+from json import dumps, loads
+
+from pytest import fixture
+
+from benchmarks.suite import compare_results, main, measure_ops_per_second
+
+
+@fixture
+def baseline_fx() -> dict:
+    """Fixture to build baseline metrics.
+
+    :return: A dictionary with a throughput and a latency metric.
+    """
+    return {
+        "throughput": {"value": 1000.0, "unit": "ops/s", "higher_is_better": True},
+        "latency": {"value": 10.0, "unit": "ms", "higher_is_better": False},
+    }
+
+
+def test_measure_ops_per_second_counts_operations():
+    """Test that ops_per_call scales the measured throughput."""
+    single = measure_ops_per_second(lambda: None, min_time=0.01)
+    assert single > 0, f"Expected a positive throughput, but got {single}."
+    batched = measure_ops_per_second(lambda: None, ops_per_call=1000, min_time=0.01)
+    assert batched > single, f"Expected {batched} to exceed {single} when 1000 operations are done per call."
+
+
+def test_compare_results_within_threshold(baseline_fx):
+    """Test that changes within the threshold are not reported."""
+    current = {
+        "throughput": {**baseline_fx["throughput"], "value": 850.0},
+        "latency": {**baseline_fx["latency"], "value": 11.5},
+    }
+    regressions = compare_results(baseline_fx, current, 0.2)
+    assert regressions == [], f"Expected no regressions, but got {regressions}."
+
+
+def test_compare_results_reports_regressions(baseline_fx):
+    """Test that lower throughput and higher latency beyond the threshold are reported."""
+    current = {
+        "throughput": {**baseline_fx["throughput"], "value": 700.0},
+        "latency": {**baseline_fx["latency"], "value": 13.0},
+    }
+    regressions = compare_results(baseline_fx, current, 0.2)
+    assert len(regressions) == 2, f"Expected 2 regressions, but got {regressions}."
+    assert regressions[0].startswith("throughput"), f"Unexpected regression message: '{regressions[0]}'."
+
+
+def test_compare_results_ignores_new_metrics(baseline_fx):
+    """Test that metrics missing from the baseline are not reported."""
+    current = {"new": {"value": 0.0, "unit": "ops/s", "higher_is_better": True}}
+    regressions = compare_results(baseline_fx, current, 0.2)
+    assert regressions == [], f"Expected no regressions, but got {regressions}."
+
+
+def test_main_fails_on_regression(tmp_path, monkeypatch, baseline_fx):
+    """Test that the suite writes JSON results and exits with 1 on a regression."""
+    monkeypatch.setattr("benchmarks.suite.benchmark_fields", lambda min_time: {})
+    monkeypatch.setattr("benchmarks.suite.benchmark_generation", lambda min_time: {})
+    monkeypatch.setattr(
+        "benchmarks.suite.benchmark_endpoints",
+        lambda requests: {"throughput": {**baseline_fx["throughput"], "value": 1.0}},
+    )
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+
+    assert main(["--output", str(output), "--baseline", str(baseline), "--update-baseline"]) == 0
+    baseline.write_text(dumps({"metrics": baseline_fx}))
+    exit_code = main(["--output", str(output), "--baseline", str(baseline)])
+    assert exit_code == 1, f"Expected exit code 1 on a regression, but got {exit_code}."
+    results = loads(output.read_text())
+    assert results["metrics"]["throughput"]["value"] == 1.0, f"Unexpected results: {results}."
@@ -0,0 +1,108 @@
+"""Module provides tests for the buffer of pre-generated records."""
+
+from datetime import date, timedelta
+from json import loads
+from time import sleep
+
+from pytest import fixture, mark, raises
+
+from src.buffer import RecordBuffer, buffer_from_environment
+from src.metrics import BUFFER_DEPTH, BUFFER_RECORDS_PRODUCED
+from tests.test_generate_fake_data import FakeDataModel
+
+
+@fixture
+def buffer_fx() -> RecordBuffer:
+    """Fixture to create a small pooled buffer filled in the calling thread.
+
+    :return: A RecordBuffer filled up to its high watermark.
+    """
+    record_buffer = RecordBuffer(50, 10, batch_size=20, pooled=True)
+    record_buffer.refill()
+    return record_buffer
+
+
+def test_refill_fills_up_to_high_watermark(buffer_fx):
+    """Test that a refill fills the buffer exactly up to the high watermark with valid records."""
+    assert len(buffer_fx) == 50, f"Expected 50 buffered records, but got '{len(buffer_fx)}'."
+    assert BUFFER_DEPTH.value() == 50, f"The depth gauge should be 50, but is '{BUFFER_DEPTH.value()}'."
+    for record in buffer_fx.pop(50):
+        FakeDataModel(**loads(record))
+    assert buffer_fx.refill() == 50, "A refill of a drained buffer should produce 50 records."
+
+
+def test_pop_returns_fewer_records_when_drained(buffer_fx):
+    """Test that popping more records than buffered returns what is available."""
+    assert len(buffer_fx.pop(30)) == 30, "The buffer should serve 30 of 50 records."
+    assert len(buffer_fx.pop(30)) == 20, "The drained buffer should serve the remaining 20 records."
+    assert buffer_fx.pop(5) == [], "An empty buffer should serve no records."
+
+
+def test_pop_discards_records_of_a_past_day(buffer_fx, monkeypatch):
+    """Test that records generated on a past day are not served."""
+    monkeypatch.setattr(buffer_fx, "_as_of", date.today() - timedelta(days=1))
+    assert buffer_fx.pop(5) == [], "Records of a past day should not be served."
+    buffer_fx.refill()
+    start_dates = {loads(record)["insurance"]["start_date"] for record in buffer_fx.pop(50)}
+    assert start_dates == {date.today().strftime("%m/%d/%Y")}, f"Unexpected start dates: '{start_dates}'."
+
+
+def test_producer_refills_below_low_watermark():
+    """Test that the background producer fills the buffer and refills it after it is drained."""
+    record_buffer = RecordBuffer(40, 10, batch_size=10, pooled=True)
+    produced = BUFFER_RECORDS_PRODUCED.value()
+    record_buffer.start()
+    try:
+        _wait_for(lambda: len(record_buffer) == 40)
+        record_buffer.pop(35)
+        _wait_for(lambda: len(record_buffer) == 40)
+    finally:
+        record_buffer.stop(timeout=5)
+    assert BUFFER_RECORDS_PRODUCED.value() - produced == 75, "The producer should have produced 40 + 35 records."
+
+
+def test_producer_cannot_start_twice():
+    """Test that starting a running producer raises RuntimeError."""
+    record_buffer = RecordBuffer(10, pooled=True)
+    record_buffer.start()
+    try:
+        with raises(RuntimeError):
+            record_buffer.start()
+    finally:
+        record_buffer.stop(timeout=5)
+
+
+@mark.parametrize("high_watermark, low_watermark, batch_size", [(0, None, 10), (10, 10, 10), (10, -1, 10), (10, 5, 0)])
+def test_invalid_watermarks(high_watermark, low_watermark, batch_size):
+    """Test that invalid watermarks and batch sizes raise ValueError."""
+    with raises(ValueError):
+        RecordBuffer(high_watermark, low_watermark, batch_size)
+
+
+def test_buffer_from_environment():
+    """Test that the buffer is configured by environment variables and disabled by default."""
+    assert buffer_from_environment({}) is None, "The buffer should be disabled without a high watermark."
+    record_buffer = buffer_from_environment(
+        {
+            "CAR_INSURANCE_BUFFER_HIGH_WATERMARK": "100",
+            "CAR_INSURANCE_BUFFER_LOW_WATERMARK": "20",
+            "CAR_INSURANCE_BUFFER_BATCH_SIZE": "25",
+            "CAR_INSURANCE_BUFFER_POOLED": "1",
+        }
+    )
+    settings = (record_buffer.high_watermark, record_buffer.low_watermark, record_buffer.batch_size)
+    assert settings == (100, 20, 25), f"Unexpected buffer settings: '{settings}'."
+    assert record_buffer.pooled, "The buffer should generate pooled records."
+
+
+def _wait_for(condition, timeout: float = 10.0) -> None:
+    """Wait until a condition holds.
+
+    :param condition: A function returning whether the condition holds.
+    :param timeout: The maximum number of seconds to wait.
+    """
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        sleep(0.01)
+    raise AssertionError("The condition did not hold in time.")
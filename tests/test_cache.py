@@ -0,0 +1,80 @@
+"""Module provides tests for the response cache of seeded requests."""
+
+from pytest import fixture, mark, raises
+
+from src.cache import DEFAULT_CACHE_BYTES, ResponseCache, cache_from_environment, entity_tag, etag_matches
+from src.metrics import RESPONSE_CACHE_BYTES, RESPONSE_CACHE_EVICTIONS, RESPONSE_CACHE_LOOKUPS
+
+
+@fixture(name="cache_fx")
+def cache_fixture():
+    """Fixture to create a cache of 100 bytes.
+
+    :return: A ResponseCache.
+    """
+    return ResponseCache(100)
+
+
+def test_get_returns_stored_response(cache_fx):
+    """Test that a stored body is returned with its entity tag and lookups are counted."""
+    hits, misses = RESPONSE_CACHE_LOOKUPS.value("hit"), RESPONSE_CACHE_LOOKUPS.value("miss")
+    assert cache_fx.get("a") is None, "An empty cache should miss."
+    entry = cache_fx.put("a", b"[1,2,3]")
+    assert cache_fx.get("a") == entry, "The stored response should be returned."
+    assert entry.etag == entity_tag(b"[1,2,3]"), f"Unexpected entity tag: '{entry.etag}'."
+    assert RESPONSE_CACHE_LOOKUPS.value("hit") - hits == 1, "One hit should have been counted."
+    assert RESPONSE_CACHE_LOOKUPS.value("miss") - misses == 1, "One miss should have been counted."
+
+
+def test_least_recently_used_responses_are_evicted(cache_fx):
+    """Test that the least recently used responses are evicted once the bodies exceed the byte cap."""
+    evictions = RESPONSE_CACHE_EVICTIONS.value()
+    cache_fx.put("a", b"a" * 40)
+    cache_fx.put("b", b"b" * 40)
+    cache_fx.get("a")
+    cache_fx.put("c", b"c" * 40)
+    assert cache_fx.get("b") is None, "The least recently used response should have been evicted."
+    assert cache_fx.get("a") is not None and cache_fx.get("c") is not None, "Recently used responses should be kept."
+    assert cache_fx.size == 80, f"The cache should hold 80 bytes, but holds '{cache_fx.size}'."
+    assert RESPONSE_CACHE_BYTES.value() == 80, f"Unexpected size gauge: '{RESPONSE_CACHE_BYTES.value()}'."
+    assert RESPONSE_CACHE_EVICTIONS.value() - evictions == 1, "One eviction should have been counted."
+
+
+def test_oversized_and_replaced_responses(cache_fx):
+    """Test that a body larger than the cap is not stored and a replaced body is not counted twice."""
+    cache_fx.put("a", b"a" * 30)
+    entry = cache_fx.put("big", b"x" * 101)
+    assert entry.body == b"x" * 101, "An oversized body should still be returned."
+    assert cache_fx.get("big") is None and len(cache_fx) == 1, "An oversized body should not be stored."
+    cache_fx.put("a", b"a" * 50)
+    assert cache_fx.size == 50, f"The cache should hold 50 bytes, but holds '{cache_fx.size}'."
+    cache_fx.clear()
+    assert len(cache_fx) == 0 and cache_fx.size == 0, "A cleared cache should be empty."
+
+
+@mark.parametrize(
+    ("if_none_match", "matches"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('"x", W/"abc"', True),
+        ("*", True),
+        ('"abd"', False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    """Test the comparison of If-None-Match headers with an entity tag.
+
+    :param if_none_match: The value of the If-None-Match header.
+    :param matches: Whether the header should match.
+    """
+    assert etag_matches(if_none_match, '"abc"') is matches, f"Unexpected match of '{if_none_match}'."
+
+
+def test_cache_from_environment():
+    """Test that the cache is enabled by default, sized by the environment and disabled with 0."""
+    assert cache_from_environment({}).max_bytes == DEFAULT_CACHE_BYTES, "Unexpected default size."
+    assert cache_from_environment({"CAR_INSURANCE_CACHE_BYTES": "1024"}).max_bytes == 1024, "Unexpected size."
+    assert cache_from_environment({"CAR_INSURANCE_CACHE_BYTES": "0"}) is None, "0 should disable the cache."
+    with raises(ValueError):
+        ResponseCache(0)
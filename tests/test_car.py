@@ -1,8 +1,8 @@
 """Module provides tests for car part in fake car insurance data."""
 
-from pytest import fixture
+from pytest import fixture, mark, raises
 
-from src.car import generate_vin
+from src.car import WMI_CODES, generate_vin, generate_vin_batch, vin_check_digit
 
 
 @fixture
@@ -40,3 +40,54 @@ def test_vin_allowed_chars(vin_fx):
     allowed_chars = set("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
     for char in vin_fx:
         assert char in allowed_chars, f"VIN contains invalid character: '{char}'."
+
+
+def test_vin_batch():
+    """Test that a batch of VINs has the requested size and only valid VINs."""
+    allowed_chars = set("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
+    batch = generate_vin_batch(50)
+    assert len(batch) == 50, f"Expected '50' VINs, but got '{len(batch)}'."
+    for vin in batch:
+        assert len(vin) == 17 and set(vin) <= allowed_chars, f"Invalid VIN: '{vin}'."
+
+
+def test_vin_check_digit(vin_fx):
+    """Test to ensure the generated VIN carries a valid ISO 3779 check digit at position 9.
+
+    :param vin_fx: The generated VIN from the fixture.
+    """
+    assert vin_fx[8] == vin_check_digit(vin_fx), f"VIN '{vin_fx}' has an invalid check digit."
+
+
+@mark.parametrize(
+    "vin, check_digit", [("1M8GDM9AXKP042788", "X"), ("11111111111111111", "1"), ("1HGCM82633A004352", "3")]
+)
+def test_vin_check_digit_known_values(vin, check_digit):
+    """Test the check digit calculation against VINs with known check digits.
+
+    :param vin: A VIN with a known check digit.
+    :param check_digit: The expected check digit.
+    """
+    assert vin_check_digit(vin) == check_digit, f"Expected check digit '{check_digit}' for VIN '{vin}'."
+
+
+@mark.parametrize("vin", ["", "1M8GDM9AXKP04278", "1M8GDM9AXKP0427888"])
+def test_vin_check_digit_invalid_length(vin):
+    """Test that the check digit calculation rejects VINs that are not 17 characters long.
+
+    :param vin: A VIN with invalid length.
+    """
+    with raises(ValueError):
+        vin_check_digit(vin)
+
+
+@mark.parametrize("use_wmi", [False, True])
+def test_vin_batch_check_digits(use_wmi):
+    """Test that every VIN of a batch carries a valid check digit.
+
+    :param use_wmi: Whether the VINs are generated with real WMI prefixes.
+    """
+    for vin in generate_vin_batch(500, use_wmi=use_wmi):
+        assert vin[8] == vin_check_digit(vin), f"VIN '{vin}' has an invalid check digit."
+        if use_wmi:
+            assert vin[:3] in WMI_CODES, f"VIN '{vin}' does not start with a known WMI."
@@ -0,0 +1,96 @@
+"""Module provides tests for the content-negotiated compression of responses."""
+
+import zlib
+
+from pytest import importorskip, mark, raises
+
+from src.compression import Compressor, compress, levels_from_environment, negotiate_encoding
+
+
+@mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, GZIP;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("gzip;q=invalid", None),
+    ],
+)
+def test_negotiate_encoding(monkeypatch, accept_encoding, encoding):
+    """Test the selection of the content encoding from an Accept-Encoding header without zstandard.
+
+    :param monkeypatch: Pytest fixture hiding the optional zstandard package.
+    :param accept_encoding: The value of the Accept-Encoding header.
+    :param encoding: The expected encoding.
+    """
+    monkeypatch.setattr("src.compression.zstandard", None)
+    assert negotiate_encoding(accept_encoding) == encoding, f"Unexpected encoding for '{accept_encoding}'."
+
+
+def test_negotiate_encoding_prefers_zstd(monkeypatch):
+    """Test that zstd is preferred over gzip when zstandard is installed.
+
+    :param monkeypatch: Pytest fixture standing in for the optional zstandard package.
+    """
+    monkeypatch.setattr("src.compression.zstandard", object())
+    assert negotiate_encoding("gzip, zstd") == "zstd", "zstd should be preferred."
+    assert negotiate_encoding("gzip, zstd;q=0") == "gzip", "A refused zstd should fall back to gzip."
+
+
+def test_gzip_compressor_flushes_every_chunk():
+    """Test that every compressed chunk decompresses on its own arrival and the stream ends with a trailer."""
+    compressor = Compressor("gzip")
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    chunks = [b'{"policy_number":"PL123456789AB"}\n' * 100 for _ in range(3)]
+    for chunk in chunks:
+        assert decompressor.decompress(compressor.compress(chunk)) == chunk, "A chunk should decompress at once."
+    assert decompressor.decompress(compressor.finish()) == b"", "The trailer should not hold data."
+    assert decompressor.eof, "The stream should be complete after finish()."
+
+
+def test_compress_gzip_round_trip():
+    """Test that a compressed body decompresses to the original and is smaller."""
+    body = b'{"start_date":"01/01/2026"}' * 1000
+    compressed = compress(body, "gzip", 6)
+    assert zlib.decompress(compressed, zlib.MAX_WBITS | 16) == body, "The body should survive compression."
+    assert len(compressed) < len(body) / 10, f"Repetitive JSON should compress well, got '{len(compressed)}' bytes."
+
+
+def test_zstd_round_trip():
+    """Test zstd compression of bodies and streams when the optional zstandard package is installed."""
+    zstandard = importorskip("zstandard")
+    body = b'{"phone":"+48 500 123 456"}\n' * 1000
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(compress(body, "zstd")) == body, (
+        "The body should survive compression."
+    )
+    compressor = Compressor("zstd")
+    stream = compressor.compress(body) + compressor.compress(body) + compressor.finish()
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(stream) == body * 2, (
+        "The stream should survive compression."
+    )
+
+
+def test_unsupported_encoding(monkeypatch):
+    """Test that unsupported encodings are rejected.
+
+    :param monkeypatch: Pytest fixture hiding the optional zstandard package.
+    """
+    monkeypatch.setattr("src.compression.zstandard", None)
+    with raises(ValueError, match="zstd"):
+        Compressor("zstd")
+    with raises(ValueError, match="br"):
+        compress(b"{}", "br")
+
+
+def test_levels_from_environment():
+    """Test that the compression levels are read from the environment and validated."""
+    assert levels_from_environment({}) == {"gzip": 1, "zstd": 3}, "Unexpected default levels."
+    levels = levels_from_environment({"CAR_INSURANCE_GZIP_LEVEL": "9", "CAR_INSURANCE_ZSTD_LEVEL": "19"})
+    assert levels == {"gzip": 9, "zstd": 19}, f"Unexpected levels: '{levels}'."
+    with raises(ValueError, match="gzip"):
+        levels_from_environment({"CAR_INSURANCE_GZIP_LEVEL": "10"})
@@ -0,0 +1,127 @@
+"""Module provides tests for the memory-mapped fixed-width dataset format."""
+
+from json import loads
+
+from pytest import fixture, mark, raises
+
+from src.dataset import FIELD_WIDTHS, HEADER, RECORD, FixedWidthDataset, FixedWidthWriter
+from src.export import main
+from src.fake_data import generate_insurance_batch
+from src.record import InsuranceBatch
+from src.singleton import FakerSingleton
+
+
+def _slice(batch: InsuranceBatch, start: int, stop: int) -> InsuranceBatch:
+    """Take a range of records of a batch.
+
+    :param batch: The batch.
+    :param start: The index of the first record.
+    :param stop: The index after the last record.
+    :return: A new batch holding the range.
+    """
+    return InsuranceBatch(*(column[start:stop] for column in batch.columns()))
+
+
+@fixture(name="batch_fx")
+def batch_fixture():
+    """Fixture generating a seeded batch of records.
+
+    :return: An InsuranceBatch of 50 records.
+    """
+    with FakerSingleton.seeded(7):
+        return generate_insurance_batch(50)
+
+
+@fixture(name="dataset_fx")
+def dataset_fixture(tmp_path, batch_fx):
+    """Fixture writing the seeded batch into a dataset file in two writes and opening it.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param batch_fx: The seeded batch of records.
+    :return: An iterator over the opened FixedWidthDataset.
+    """
+    path = tmp_path / "data.cidg"
+    writer = FixedWidthWriter(path)
+    writer.write(_slice(batch_fx, 0, 20))
+    writer.write(_slice(batch_fx, 20, 50))
+    writer.close()
+    dataset = FixedWidthDataset(path)
+    yield dataset
+    dataset.close()
+
+
+def test_dataset_round_trip(dataset_fx, batch_fx):
+    """Test that every record reads back unchanged, by index and by range."""
+    expected = list(batch_fx)
+    assert len(dataset_fx) == 50, f"Expected '50' records, but got '{len(dataset_fx)}'."
+    assert [dataset_fx[index] for index in range(50)] == expected, "Records read by index should round-trip."
+    assert dataset_fx.records(0, 50) == expected, "Records read by range should round-trip."
+    assert dataset_fx[-1] == expected[-1], "A negative index should count from the end."
+
+
+@mark.parametrize("index", [50, -51])
+def test_dataset_index_out_of_range(dataset_fx, index):
+    """Test that an index outside the dataset raises an IndexError.
+
+    :param index: The out-of-range index.
+    """
+    with raises(IndexError):
+        dataset_fx[index]
+
+
+@mark.parametrize(("start", "stop", "expected"), [(45, 100, 5), (-5, 3, 3), (30, 10, 0), (50, 60, 0)])
+def test_dataset_records_range_is_clamped(dataset_fx, start, stop, expected):
+    """Test that a range is clamped to the records of the dataset.
+
+    :param start: The index of the first record.
+    :param stop: The index after the last record.
+    :param expected: The expected number of records.
+    """
+    records = dataset_fx.records(start, stop)
+    assert len(records) == expected, f"Expected '{expected}' records, but got '{len(records)}'."
+
+
+def test_dataset_truncates_long_fields(tmp_path, batch_fx):
+    """Test that a text field longer than its width is truncated without breaking a character."""
+    batch = _slice(batch_fx, 0, 1)
+    batch.address[0] = "ż" * FIELD_WIDTHS["address"]
+    path = tmp_path / "data.cidg"
+    writer = FixedWidthWriter(path)
+    writer.write(batch)
+    writer.close()
+    dataset = FixedWidthDataset(path)
+    try:
+        address = dataset[0].address
+    finally:
+        dataset.close()
+    assert address == "ż" * (FIELD_WIDTHS["address"] // 2), f"Unexpected truncated address: '{address}'."
+
+
+@mark.parametrize(
+    "content",
+    [b"", b"NOPE" + bytes(HEADER.size), HEADER.pack(b"CIDG", 1, RECORD.size, 2) + bytes(RECORD.size)],
+    ids=["empty", "bad-magic", "truncated"],
+)
+def test_dataset_rejects_invalid_files(tmp_path, content):
+    """Test that a file that is not a complete dataset is rejected with a ValueError.
+
+    :param content: The content of the file.
+    """
+    path = tmp_path / "data.cidg"
+    path.write_bytes(content)
+    with raises(ValueError):
+        FixedWidthDataset(path)
+
+
+def test_export_fixed_matches_ndjson(tmp_path):
+    """Test that the fixed-width export holds the same records as the NDJSON export of the same seed."""
+    fixed, ndjson = tmp_path / "data.cidg", tmp_path / "data.ndjson"
+    main(["--count", "120", "--seed", "3", "--format", "fixed", "--out", str(fixed), "--shard-size", "50"])
+    main(["--count", "120", "--seed", "3", "--format", "ndjson", "--out", str(ndjson), "--shard-size", "50"])
+    expected = [loads(line) for line in ndjson.read_text(encoding="utf-8").splitlines()]
+    dataset = FixedWidthDataset(fixed)
+    try:
+        records = [record.to_dict() for record in dataset.records(0, len(dataset))]
+    finally:
+        dataset.close()
+    assert records == expected, "The fixed-width export should hold the same records as the NDJSON export."
@@ -1,10 +1,23 @@
 """The module with unit tests."""
 
+import asyncio
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import httpx
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
-from pytest import fail, fixture
+from pytest import fail, fixture, mark
 
-from main import app
+from main import MAX_BATCH_SIZE, app, stream_ndjson
+from src.admission import AdmissionController
+from src.buffer import RecordBuffer
+from src.cache import ResponseCache
+from src.dataset import FixedWidthDataset, FixedWidthWriter
+from src.fake_data import generate_insurance_batch
+from src.metrics import BUFFER_RECORDS_SERVED, RECORDS_GENERATED, REQUESTS, RESPONSE_CACHE_LOOKUPS
+from src.stream import DEFAULT_CHUNK_SIZE
 from tests.test_generate_fake_data import FakeDataModel
 
 client = TestClient(app)
@@ -53,3 +66,400 @@ def test_read_generate_response_content(generate_response):
         FakeDataModel(**generate_response.json())
     except ValidationError as e:
         fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
+
+
+def test_read_generate_batch_response_content():
+    """Test that the generate endpoint returns a list of valid records when count is given."""
+    response = client.get("/generate", params={"count": 25})
+    assert response.status_code == 200, f"Expected status code '200', but got '{response.status_code}'."
+    records = response.json()
+    assert len(records) == 25, f"Expected '25' records, but got '{len(records)}'."
+    try:
+        for record in records:
+            FakeDataModel(**record)
+    except ValidationError as e:
+        fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
+
+
+@mark.parametrize("count", [0, -1, MAX_BATCH_SIZE + 1, "many"])
+def test_read_generate_batch_invalid_count(count):
+    """Test that the generate endpoint rejects counts outside the allowed range.
+
+    :param count: The invalid count to test.
+    """
+    response = client.get("/generate", params={"count": count})
+    assert response.status_code == 422, f"Expected status code '422', but got '{response.status_code}'."
+
+
+def test_read_generate_stream_content():
+    """Test that the stream endpoint returns the requested number of valid NDJSON records."""
+    response = client.get("/generate/stream", params={"count": 2500})
+    assert response.status_code == 200, f"Expected status code '200', but got '{response.status_code}'."
+    assert response.headers["content-type"] == "application/x-ndjson", (
+        f"Unexpected content type: '{response.headers['content-type']}'."
+    )
+    lines = response.text.splitlines()
+    assert len(lines) == 2500, f"Expected '2500' records, but got '{len(lines)}'."
+    try:
+        for line in lines:
+            FakeDataModel.model_validate_json(line)
+    except ValidationError as e:
+        fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
+
+
+@mark.parametrize(
+    ("path", "params"),
+    [("/generate", {"count": 100}), ("/generate", {"count": 100, "seed": 4}), ("/generate/stream", {"count": 2500})],
+)
+def test_responses_are_compressed(monkeypatch, path, params):
+    """Test that responses are gzip-compressed when the client accepts it, and sent as they are otherwise.
+
+    :param monkeypatch: Pytest fixture hiding the optional zstandard package.
+    :param path: The path of the endpoint.
+    :param params: The query parameters of the request.
+    """
+    monkeypatch.setattr("src.compression.zstandard", None)
+    with client.stream("GET", path, params=params, headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == "gzip", f"Unexpected headers: '{response.headers}'."
+    assert response.headers["vary"] == "Accept-Encoding", "Compressed responses should vary by Accept-Encoding."
+    body = zlib.decompress(raw, zlib.MAX_WBITS | 16)
+    assert len(raw) < len(body) / 2, f"Expected '{len(body)}' bytes to compress well, got '{len(raw)}'."
+
+    with client.stream("GET", path, params=params, headers={"Accept-Encoding": "identity"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert "content-encoding" not in response.headers, "Uncompressed responses should not have an encoding."
+    if "seed" in params:
+        assert raw == body, "The compressed seeded response should decompress to the uncompressed one."
+
+
+@mark.parametrize("count", [0, -1, "all"])
+def test_read_generate_stream_invalid_count(count):
+    """Test that the stream endpoint rejects invalid counts.
+
+    :param count: The invalid count to test.
+    """
+    response = client.get("/generate/stream", params={"count": count})
+    assert response.status_code == 422, f"Expected status code '422', but got '{response.status_code}'."
+
+
+def test_stream_ndjson_stops_on_disconnect():
+    """Test that streaming stops generating records as soon as the client disconnects."""
+
+    class DisconnectingRequest:
+        """Request stub that reports a disconnect after the first chunk has been sent."""
+
+        def __init__(self):
+            self.checks = 0
+
+        async def is_disconnected(self) -> bool:
+            self.checks += 1
+            return self.checks > 1
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in stream_ndjson(DisconnectingRequest(), count=1_000_000, chunk_size=10)]
+
+    chunks = asyncio.run(collect())
+    assert len(chunks) == 1, f"Expected streaming to stop after '1' chunk, but got '{len(chunks)}'."
+
+
+@mark.parametrize("params", [{"seed": 13}, {"seed": 13, "count": 5}])
+def test_read_generate_seed_is_reproducible(params):
+    """Test that the generate endpoint returns the same data for the same seed.
+
+    :param params: The query parameters of the request.
+    """
+    first = client.get("/generate", params=params).json()
+    second = client.get("/generate", params=params).json()
+    assert first == second, f"Responses for the same seed differ: '{first}' != '{second}'."
+
+
+def test_read_generate_concurrently():
+    """Test that concurrent seeded and unseeded requests from many threads all return correct data."""
+    expected = {seed: client.get("/generate", params={"seed": seed, "count": 20}).json() for seed in range(4)}
+
+    def request(index: int) -> tuple[int | None, list[dict]]:
+        seed = index % 5 if index % 5 < 4 else None
+        params = {"count": 20} if seed is None else {"count": 20, "seed": seed}
+        response = client.get("/generate", params=params)
+        assert response.status_code == 200, f"Expected status code '200', but got '{response.status_code}'."
+        return seed, response.json()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(request, range(100)))
+    for seed, records in results:
+        if seed is not None:
+            assert records == expected[seed], f"Concurrent request with seed '{seed}' returned different data."
+        for record in records:
+            FakeDataModel(**record)
+
+
+def test_metrics_endpoint_counts_requests_and_records():
+    """Test that /metrics reports handled requests and generated records."""
+    before = RECORDS_GENERATED.value("/generate")
+    requests_before = REQUESTS.value("/generate", "200")
+    client.get("/generate", params={"count": 7})
+    response = client.get("/metrics")
+    assert response.status_code == 200, f"Unexpected status code: '{response.status_code}'."
+    assert response.headers["content-type"].startswith("text/plain"), f"Unexpected type: {response.headers}."
+    assert RECORDS_GENERATED.value("/generate") == before + 7, "Generated records were not counted."
+    assert REQUESTS.value("/generate", "200") == requests_before + 1, "The request was not counted."
+    assert 'car_insurance_requests_total{path="/generate",status="200"}' in response.text, (
+        f"Request counts are missing: '{response.text}'."
+    )
+
+
+def test_generate_locale():
+    """Test that the generate endpoints accept one or more locales."""
+    response = client.get("/generate", params={"count": 20, "locale": ["de_DE", "es_ES"], "seed": 1})
+    assert response.status_code == 200, f"Unexpected status code: '{response.status_code}'."
+    prefixes = {record["policy_number"][:2] for record in response.json()}
+    assert prefixes == {"DE", "ES"}, f"Unexpected policy number prefixes: '{prefixes}'."
+    record = client.get("/generate", params={"locale": "en_GB"}).json()
+    assert record["owner"]["phone"].startswith("+44 "), f"Unexpected phone number: '{record['owner']['phone']}'."
+    lines = client.get("/generate/stream", params={"count": 3, "locale": "nl_NL"}).text.splitlines()
+    assert all('"policy_number":"NL' in line for line in lines), f"Unexpected streamed records: '{lines}'."
+
+
+def test_generate_unsupported_locale():
+    """Test that an unsupported locale is rejected with 422."""
+    response = client.get("/generate", params={"locale": "xx_XX"})
+    assert response.status_code == 422, f"Unexpected status code: '{response.status_code}'."
+
+
+def test_generate_serves_from_record_buffer(monkeypatch):
+    """Test that unseeded requests are served from the record buffer and fall back to inline generation."""
+    record_buffer = RecordBuffer(5, 1, pooled=False)
+    record_buffer.refill()
+    monkeypatch.setattr(app.state, "record_buffer", record_buffer, raising=False)
+    buffered, inline = BUFFER_RECORDS_SERVED.value("buffer"), BUFFER_RECORDS_SERVED.value("inline")
+
+    FakeDataModel(**client.get("/generate").json())
+    records = client.get("/generate", params={"count": 7}).json()
+    assert len(records) == 7, f"Expected 7 records, but got '{len(records)}'."
+    for record in records:
+        FakeDataModel(**record)
+    assert BUFFER_RECORDS_SERVED.value("buffer") - buffered == 5, "5 records should have come from the buffer."
+    assert BUFFER_RECORDS_SERVED.value("inline") - inline == 3, "3 records should have been generated inline."
+
+    seeded = client.get("/generate", params={"count": 3, "seed": 1}).json()
+    assert seeded == client.get("/generate", params={"count": 3, "seed": 1}).json(), (
+        "Seeded requests should bypass the buffer."
+    )
+    assert BUFFER_RECORDS_SERVED.value("inline") - inline == 3, "Seeded requests should not count as buffer misses."
+
+
+def test_seeded_responses_are_cached(monkeypatch):
+    """Test that seeded responses are served from the cache with an ETag and unseeded ones bypass it."""
+    monkeypatch.setattr(app.state, "response_cache", ResponseCache(1024 * 1024), raising=False)
+    hits, misses = RESPONSE_CACHE_LOOKUPS.value("hit"), RESPONSE_CACHE_LOOKUPS.value("miss")
+    generated = RECORDS_GENERATED.value("/generate")
+
+    params = {"count": 20, "seed": 7, "locale": ["de_DE", "fr_FR"]}
+    first = client.get("/generate", params=params)
+    second = client.get("/generate", params=params)
+    assert second.content == first.content, "A cached response should be identical to the generated one."
+    assert second.headers["etag"] == first.headers["etag"], "A cached response should keep its ETag."
+    assert RECORDS_GENERATED.value("/generate") - generated == 20, "The cached response should not be regenerated."
+    assert RESPONSE_CACHE_LOOKUPS.value("hit") - hits == 1, "The second request should hit the cache."
+
+    not_modified = client.get("/generate", params=params, headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304, f"Unexpected status code: '{not_modified.status_code}'."
+    assert not_modified.content == b"", "A 304 response should not have a body."
+
+    client.get("/generate", params={"seed": 7, "index": 3})
+    client.get("/generate", params={"count": 20, "seed": 7, "locale": ["fr_FR", "de_DE"]})
+    unseeded = client.get("/generate", params={"count": 5})
+    assert "etag" not in unseeded.headers, "Unseeded responses should bypass the cache."
+    assert RESPONSE_CACHE_LOOKUPS.value("miss") - misses == 3, "Other parameters should miss the cache."
+
+
+def test_generate_is_rejected_when_overloaded(monkeypatch):
+    """Test that generation requests are rejected with 503 and Retry-After when no records can be admitted."""
+    admission = AdmissionController(100, max_queue=0)
+    monkeypatch.setattr(app.state, "admission", admission, raising=False)
+    response = client.get("/generate/schema", params={"count": 100})
+    assert response.status_code == 200, f"Unexpected status code: '{response.status_code}'."
+    assert admission.in_flight == 0, f"The records should be released, but '{admission.in_flight}' are in flight."
+
+    admission.in_flight = 100
+    response = client.get("/generate", params={"count": 5})
+    assert response.status_code == 503, f"Expected status code '503', but got '{response.status_code}'."
+    assert response.headers["retry-after"] == "5", f"Unexpected Retry-After: '{response.headers['retry-after']}'."
+    assert client.get("/").status_code == 200, "Requests that generate nothing should not be limited."
+
+
+def test_cached_responses_bypass_admission(monkeypatch):
+    """Test that cached seeded responses and 304 responses are served while no records can be admitted.
+
+    :param monkeypatch: Pytest fixture patching the app state.
+    """
+    monkeypatch.setattr(app.state, "response_cache", ResponseCache(1024 * 1024), raising=False)
+    admission = AdmissionController(100, max_queue=0)
+    monkeypatch.setattr(app.state, "admission", admission, raising=False)
+    params = {"count": 50, "seed": 21}
+    first = client.get("/generate", params=params)
+    assert first.status_code == 200, f"Unexpected status code: '{first.status_code}'."
+
+    admission.in_flight = 100
+    cached = client.get("/generate", params=params)
+    assert cached.status_code == 200, f"A cached response should not be rejected, got '{cached.status_code}'."
+    assert cached.content == first.content, "The cached response should be served."
+    not_modified = client.get("/generate", params=params, headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304, f"Unexpected status code: '{not_modified.status_code}'."
+    missed = client.get("/generate", params={"count": 50, "seed": 22})
+    assert missed.status_code == 503, f"A cache miss should be admitted, got '{missed.status_code}'."
+    assert admission.in_flight == 100, f"Cached responses should hold no records, but '{admission.in_flight}' do."
+
+
+def test_stream_holds_admission_until_it_ends(monkeypatch):
+    """Test that a running stream holds the records of a chunk, so other generation requests are rejected.
+
+    :param monkeypatch: Pytest fixture patching the app state.
+    """
+    admission = AdmissionController(DEFAULT_CHUNK_SIZE, max_queue=0)
+    monkeypatch.setattr(app.state, "admission", admission, raising=False)
+
+    async def scenario():
+        first_chunk, finish = asyncio.Event(), asyncio.Event()
+
+        async def receive():
+            await finish.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and not first_chunk.is_set():
+                first_chunk.set()
+                await finish.wait()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/generate/stream",
+            "raw_path": b"/generate/stream",
+            "root_path": "",
+            "query_string": b"count=1000000",
+            "headers": [(b"host", b"test")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("test", 80),
+        }
+        stream = asyncio.create_task(app(scope, receive, send))
+        await first_chunk.wait()
+        assert admission.in_flight == DEFAULT_CHUNK_SIZE, f"Unexpected records in flight: '{admission.in_flight}'."
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as other_client:
+            responses = [
+                await other_client.get("/generate", params={"count": 5}),
+                await other_client.get("/generate/stream", params={"count": 10}),
+            ]
+        finish.set()
+        await stream
+        return responses
+
+    for response in asyncio.run(scenario()):
+        assert response.status_code == 503, f"Expected status code '503', but got '{response.status_code}'."
+        assert response.headers["retry-after"] == "5", f"Unexpected headers: '{response.headers}'."
+    assert admission.in_flight == 0, f"The stream should release its records, but '{admission.in_flight}' are held."
+
+
+@fixture(name="dataset_fx")
+def dataset_fixture(tmp_path, monkeypatch):
+    """Fixture serving a dataset file of 30 records from the app.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param monkeypatch: Pytest fixture patching the app state.
+    :return: An iterator over the records written to the dataset.
+    """
+    path = tmp_path / "data.cidg"
+    batch = generate_insurance_batch(30)
+    writer = FixedWidthWriter(path)
+    writer.write(batch)
+    writer.close()
+    dataset = FixedWidthDataset(path)
+    monkeypatch.setattr(app.state, "dataset", dataset, raising=False)
+    yield batch.to_dicts()
+    dataset.close()
+
+
+def test_read_records(dataset_fx):
+    """Test that /records serves single records by index and clamped ranges from the dataset."""
+    response = client.get("/records/12")
+    assert response.status_code == 200, f"Unexpected status code: '{response.status_code}'."
+    assert response.json() == dataset_fx[12], "The record at index 12 should be served unchanged."
+    records = client.get("/records", params={"start": 25, "stop": 40}).json()
+    assert records == dataset_fx[25:], "A range should be clamped to the dataset."
+    assert client.get("/records", params={"stop": 3}).json() == dataset_fx[:3], "A range should start at 0."
+
+
+@mark.parametrize(
+    ("path", "params", "status"),
+    [
+        ("/records/30", {}, 404),
+        ("/records/-1", {}, 422),
+        ("/records", {"start": 0, "stop": MAX_BATCH_SIZE + 1}, 422),
+        ("/records", {"start": -1, "stop": 1}, 422),
+    ],
+)
+def test_read_records_invalid(dataset_fx, path, params, status):
+    """Test that out-of-range indexes and oversized ranges are rejected.
+
+    :param path: The requested path.
+    :param params: The query parameters.
+    :param status: The expected status code.
+    """
+    response = client.get(path, params=params)
+    assert response.status_code == status, f"Expected '{status}', but got '{response.status_code}'."
+
+
+def test_read_records_without_dataset(monkeypatch):
+    """Test that /records responds with 404 when no dataset is configured."""
+    monkeypatch.setattr(app.state, "dataset", None, raising=False)
+    response = client.get("/records/0")
+    assert response.status_code == 404, f"Unexpected status code: '{response.status_code}'."
+
+
+def test_generate_by_index():
+    """Test that /generate with a seed and an index returns the addressed records."""
+    single = client.get("/generate", params={"seed": 4, "index": 11}).json()
+    FakeDataModel(**single)
+    records = client.get("/generate", params={"seed": 4, "index": 9, "count": 5}).json()
+    assert len(records) == 5, f"Expected 5 records, but got '{len(records)}'."
+    assert records[2] == single, "Record 11 should be the same alone and within a range."
+    response = client.get("/generate", params={"index": 11})
+    assert response.status_code == 422, f"An index without a seed should be rejected, got '{response.status_code}'."
+
+
+def test_generate_by_index_is_pinned_across_days(monkeypatch):
+    """Test that an addressed record is the same on different days, and as_of selects the date of its dates.
+
+    :param monkeypatch: Pytest fixture disabling the response cache and moving today to the next day.
+    """
+    monkeypatch.setattr(app.state, "response_cache", None, raising=False)
+    params = {"seed": 7, "index": 5_000_000}
+    today = client.get("/generate", params=params).json()
+
+    class Tomorrow(date):
+        """Date whose today() is tomorrow."""
+
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr("main.date", Tomorrow)
+    assert client.get("/generate", params=params).json() == today, "An addressed record should not change."
+    dated = client.get("/generate", params={**params, "as_of": "2027-03-01"}).json()
+    assert dated["insurance"]["start_date"] == "03/01/2027", f"Unexpected dates: '{dated['insurance']}'."
+    response = client.get("/generate", params={"seed": 7, "as_of": "2027-03-01"})
+    assert response.status_code == 422, f"as_of without an index should be rejected, got '{response.status_code}'."
+
+
+def test_generate_schema():
+    """Test that /generate/schema serves records of the default schema, reproducibly with a seed."""
+    records = client.get("/generate/schema", params={"count": 5, "seed": 2}).json()
+    assert len(records) == 5, f"Expected 5 records, but got '{len(records)}'."
+    for record in records:
+        FakeDataModel(**record)
+    assert records == client.get("/generate/schema", params={"count": 5, "seed": 2}).json(), "Should be reproducible."
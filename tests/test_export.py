@@ -0,0 +1,53 @@
+"""Module provides tests for exporting fake car insurance data to files."""
+
+import csv
+from json import loads
+
+from pytest import importorskip, mark
+
+from src.export import COLUMNS, PARQUET_ROW_GROUP_SIZE, main
+from tests.test_generate_fake_data import FakeDataModel
+
+
+def test_export_csv(tmp_path, capsys):
+    """Test that the CSV export writes a header and one row per record, and reports the throughput.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param capsys: Pytest fixture capturing standard error.
+    """
+    path = tmp_path / "data.csv"
+    main(["--count", "250", "--format", "csv", "--out", str(path), "--shard-size", "100"])
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert tuple(rows[0]) == COLUMNS, f"Unexpected CSV header: '{rows[0]}'."
+    assert len(rows) == 251, f"Expected '250' CSV rows, but got '{len(rows) - 1}'."
+    assert "rows/s" in capsys.readouterr().err, "Export should report the throughput."
+
+
+def test_export_ndjson(tmp_path):
+    """Test that the NDJSON export writes one valid nested record per line.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    """
+    path = tmp_path / "data.ndjson"
+    main(["--count", "120", "--format", "ndjson", "--out", str(path), "--workers", "2", "--shard-size", "50"])
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 120, f"Expected '120' NDJSON records, but got '{len(lines)}'."
+    for line in lines:
+        FakeDataModel(**loads(line))
+
+
+@mark.parametrize("count", [10, PARQUET_ROW_GROUP_SIZE + 10])
+def test_export_parquet(tmp_path, count):
+    """Test that the Parquet export writes every record into row groups of bounded size.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param count: The number of records to export.
+    """
+    parquet = importorskip("pyarrow.parquet")
+    path = tmp_path / "data.parquet"
+    main(["--count", str(count), "--format", "parquet", "--out", str(path), "--pooled"])
+    metadata = parquet.ParquetFile(path).metadata
+    assert metadata.num_rows == count, f"Expected '{count}' Parquet rows, but got '{metadata.num_rows}'."
+    assert tuple(metadata.schema.names) == COLUMNS, f"Unexpected Parquet columns: '{metadata.schema.names}'."
+    assert metadata.num_row_groups == -(-count // PARQUET_ROW_GROUP_SIZE), "Unexpected number of row groups."
@@ -1,9 +1,11 @@
 """Module provides tests for generate fake data."""
 
+from datetime import date
+
 from pydantic import BaseModel, ValidationError
-from pytest import fail, fixture
+from pytest import fail, fixture, mark, raises
 
-from src.fake_data import generate_fake_data
+from src.fake_data import generate_fake_data, generate_fake_data_batch
 
 
 class OwnerModel(BaseModel):
@@ -76,3 +78,97 @@ def test_generate_fake_data_schema(fake_data):
         FakeDataModel(**fake_data)
     except ValidationError as e:
         fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
+
+
+@mark.parametrize("pooled", [False, True])
+@mark.parametrize("count", [1, 2, 100])
+def test_generate_fake_data_batch_schema(count, pooled):
+    """Test that every record of a batch matches the defined pydantic model.
+
+    :param count: The number of records to generate.
+    :param pooled: Whether names and addresses are sampled from value pools.
+    """
+    batch = generate_fake_data_batch(count, pooled=pooled)
+    assert len(batch) == count, f"Expected '{count}' records, but got '{len(batch)}'."
+    for record in batch:
+        try:
+            FakeDataModel(**record)
+        except ValidationError as e:
+            fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
+
+
+@mark.parametrize("count, exception", [(0, ValueError), (-5, ValueError), ("10", TypeError), (1.5, TypeError)])
+def test_generate_fake_data_batch_invalid_count(count, exception):
+    """Test that generate_fake_data_batch rejects invalid counts.
+
+    :param count: The invalid count to test.
+    :param exception: The expected exception type.
+    """
+    with raises(exception):
+        generate_fake_data_batch(count)
+
+
+def test_generate_fake_data_seed_is_reproducible():
+    """Test that the same seed always produces the same record and batch."""
+    assert generate_fake_data(seed=5) == generate_fake_data(seed=5), "Seeded records should be reproducible."
+    assert generate_fake_data_batch(20, seed=5) == generate_fake_data_batch(20, seed=5), (
+        "Seeded batches should be reproducible."
+    )
+    assert generate_fake_data_batch(20, seed=5) != generate_fake_data_batch(20, seed=6), (
+        "Different seeds should produce different batches."
+    )
+
+
+def test_generate_fake_data_batch_pooled_seed_is_reproducible():
+    """Test that the same seed always produces the same pooled batch."""
+    assert generate_fake_data_batch(20, seed=5, pooled=True) == generate_fake_data_batch(20, seed=5, pooled=True), (
+        "Seeded pooled batches should be reproducible."
+    )
+
+
+def test_generate_fake_data_batch_as_of():
+    """Test that every record of a batch shares the as_of start date and ends 365 days later."""
+    batch = generate_fake_data_batch(10, as_of=date(2024, 1, 31))
+    periods = {(record["insurance"]["start_date"], record["insurance"]["end_date"]) for record in batch}
+    assert periods == {("01/31/2024", "01/30/2025")}, f"Unexpected policy periods: '{periods}'."
+
+
+@mark.parametrize("pooled", [False, True])
+def test_generate_fake_data_batch_locale(pooled):
+    """Test that a single-locale batch is valid, uses the locale's formats and is reproducible."""
+    batch = generate_fake_data_batch(30, seed=3, pooled=pooled, locale="de_DE")
+    for record in batch:
+        FakeDataModel(**record)
+        assert record["policy_number"].startswith("DE"), f"Unexpected policy number: '{record['policy_number']}'."
+        assert record["owner"]["phone"].startswith("+49 "), f"Unexpected phone: '{record['owner']['phone']}'."
+    assert batch == generate_fake_data_batch(30, seed=3, pooled=pooled, locale="de_DE"), (
+        "Seeded locale batches should be reproducible."
+    )
+
+
+def test_generate_fake_data_batch_mixed_locales():
+    """Test that rows of a mixed-locale batch are spread over the locales with consistent formats."""
+    batch = generate_fake_data_batch(200, seed=4, locale=["fr_FR", "nl_NL"])
+    prefixes = [record["policy_number"][:2] for record in batch]
+    assert set(prefixes) == {"FR", "NL"}, f"Both locales should occur, but got '{set(prefixes)}'."
+    assert prefixes != sorted(prefixes), "Rows of the locales should be interleaved, not concatenated."
+    for record in batch:
+        country_code = {"FR": "+33 ", "NL": "+31 "}[record["policy_number"][:2]]
+        assert record["owner"]["phone"].startswith(country_code), f"Inconsistent record of a locale: '{record}'."
+    assert batch == generate_fake_data_batch(200, seed=4, locale=["fr_FR", "nl_NL"]), (
+        "Seeded mixed-locale batches should be reproducible."
+    )
+
+
+def test_generate_fake_data_locale():
+    """Test that a single record can be generated for a locale and is reproducible."""
+    record = generate_fake_data(seed=8, locale="it_IT")
+    FakeDataModel(**record)
+    assert record["policy_number"].startswith("IT"), f"Unexpected policy number: '{record['policy_number']}'."
+    assert record == generate_fake_data(seed=8, locale="it_IT"), "Seeded locale records should be reproducible."
+
+
+def test_generate_fake_data_unsupported_locale():
+    """Test that an unsupported locale raises ValueError."""
+    with raises(ValueError):
+        generate_fake_data_batch(5, locale="xx_XX")
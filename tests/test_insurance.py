@@ -1,8 +1,10 @@
 """Module provides tests for insurance part in fake car insurance data."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from src.insurance import generate_end_date, generate_start_date
+from pytest import mark, raises
+
+from src.insurance import format_date, generate_end_date, generate_policy_period_batch, generate_start_date
 
 
 def test_generate_start_date():
@@ -16,3 +18,49 @@ def test_generate_end_date():
     current_date = datetime.now()
     next_year_date = (current_date + timedelta(days=365)).strftime("%m/%d/%Y")
     assert generate_end_date() == next_year_date, f"Expected {next_year_date}, but got {generate_end_date()}"
+
+
+def test_generate_dates_as_of():
+    """Test that the start and end dates are calculated from the given as_of date."""
+    as_of = date(2024, 2, 29)
+    assert generate_start_date(as_of) == "02/29/2024", f"Unexpected start date: '{generate_start_date(as_of)}'."
+    assert generate_end_date(as_of) == "02/28/2025", f"Unexpected end date: '{generate_end_date(as_of)}'."
+
+
+def test_format_date_is_cached():
+    """Test that format_date formats each distinct date once and returns it from the cache afterwards."""
+    ordinal = date(2030, 1, 2).toordinal()
+    assert format_date(ordinal) == "01/02/2030", f"Unexpected formatted date: '{format_date(ordinal)}'."
+    hits = format_date.cache_info().hits
+    format_date(ordinal)
+    assert format_date.cache_info().hits == hits + 1, "Formatting the same date again should hit the cache."
+
+
+def test_generate_policy_period_batch_default_window():
+    """Test that without a window every policy starts today and ends one year from today."""
+    start_dates, end_dates = generate_policy_period_batch(5)
+    assert start_dates == [generate_start_date()] * 5, f"Unexpected start dates: {start_dates}"
+    assert end_dates == [generate_end_date()] * 5, f"Unexpected end dates: {end_dates}"
+
+
+def test_generate_policy_period_batch_window():
+    """Test that start dates are spread over the window and every end date is 365 days after its start date."""
+    as_of = date(2025, 6, 30)
+    start_dates, end_dates = generate_policy_period_batch(500, as_of=as_of, window_days=3 * 365)
+    assert len(start_dates) == len(end_dates) == 500, "Expected '500' start and end dates."
+    assert len(set(start_dates)) > 1, "Start dates should be spread over the window."
+    for start_date, end_date in zip(start_dates, end_dates, strict=True):
+        start = datetime.strptime(start_date, "%m/%d/%Y").date()
+        end = datetime.strptime(end_date, "%m/%d/%Y").date()
+        assert as_of - timedelta(days=3 * 365) <= start <= as_of, f"Start date '{start_date}' is outside the window."
+        assert end - start == timedelta(days=365), f"Policy period '{start_date}'-'{end_date}' is not 365 days."
+
+
+@mark.parametrize("window_days", [-1, 1.5])
+def test_generate_policy_period_batch_invalid_window(window_days):
+    """Test that an invalid window is rejected.
+
+    :param window_days: The invalid window to test.
+    """
+    with raises(ValueError):
+        generate_policy_period_batch(5, window_days=window_days)
@@ -0,0 +1,40 @@
+"""Module provides tests for the locale-specific formats of fake car insurance data."""
+
+from pytest import mark, raises
+
+from src.locales import DEFAULT_LOCALE_FORMAT, LOCALE_FORMATS, Locale, get_locale_format, normalize_locales
+
+
+def test_get_locale_format_default():
+    """Test that no locale selects the default Polish formats."""
+    assert get_locale_format(None) is DEFAULT_LOCALE_FORMAT, "None should select the default formats."
+    assert DEFAULT_LOCALE_FORMAT.policy_prefix == "PL", f"Unexpected default prefix: '{DEFAULT_LOCALE_FORMAT}'."
+
+
+def test_get_locale_format_unsupported():
+    """Test that an unsupported locale raises ValueError."""
+    with raises(ValueError, match="xx_XX"):
+        get_locale_format("xx_XX")
+
+
+@mark.parametrize("locale", list(LOCALE_FORMATS))
+def test_locale_formats(locale):
+    """Test that every locale has a policy prefix matching its region and a complete phone format."""
+    locale_format = get_locale_format(locale)
+    assert locale_format.policy_prefix == locale[-2:], f"Unexpected policy prefix of '{locale}': '{locale_format}'."
+    assert locale_format.phone_prefixes, f"Locale '{locale}' has no phone prefixes."
+    assert locale_format.phone_template.count("{}") == len(locale_format.phone_groups) + 1, (
+        f"Unexpected phone template of '{locale}': '{locale_format.phone_template}'."
+    )
+    assert Locale(locale) == locale, f"Locale '{locale}' is missing from the Locale enum."
+
+
+def test_normalize_locales():
+    """Test that locales are validated and normalized into a list."""
+    assert normalize_locales(None) is None, "None should keep the default locale."
+    assert normalize_locales("de_DE") == ["de_DE"], "A single locale should become a list."
+    assert normalize_locales(("de_DE", "pl_PL")) == ["de_DE", "pl_PL"], "A sequence should become a list."
+    with raises(ValueError):
+        normalize_locales([])
+    with raises(ValueError):
+        normalize_locales(["de_DE", "xx_XX"])
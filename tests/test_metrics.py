@@ -0,0 +1,93 @@
+"""Module provides tests for counters, histograms and the per-field timing instrumentation."""
+
+from pytest import fixture
+
+from src.fake_data import generate_fake_data, generate_insurance_batch
+from src.metrics import Counter, FieldTimings, Histogram, render_metrics
+
+RECORD_FIELDS = (
+    "policy_number",
+    "first_name",
+    "last_name",
+    "birth_date",
+    "address",
+    "phone",
+    "vin",
+    "start_date",
+    "end_date",
+)
+
+
+@fixture
+def field_timings_fx(monkeypatch) -> FieldTimings:
+    """Fixture to replace the global field timings with a fresh, enabled instance.
+
+    :return: The enabled FieldTimings instance used by the generators.
+    """
+    timings = FieldTimings(enabled=True)
+    monkeypatch.setattr("src.fake_data.FIELD_TIMINGS", timings)
+    return timings
+
+
+def test_counter_render():
+    """Test that a counter renders one sample per label set with escaped label values."""
+    counter = Counter("things_total", "Number of things.", ("kind",))
+    counter.inc(2, "a")
+    counter.inc(1, "a")
+    counter.inc(1, 'b"')
+    lines = list(counter.render())
+    assert lines[:2] == [
+        "# HELP car_insurance_things_total Number of things.",
+        "# TYPE car_insurance_things_total counter",
+    ]
+    assert 'car_insurance_things_total{kind="a"} 3' in lines, f"Unexpected counter lines: {lines}."
+    assert 'car_insurance_things_total{kind="b\\""} 1' in lines, f"Unexpected counter lines: {lines}."
+    assert counter.value("missing") == 0, "A label set that was never increased should be 0."
+
+
+def test_histogram_render():
+    """Test that histogram buckets are cumulative and end with the +Inf bucket, sum and count."""
+    histogram = Histogram("latency_seconds", "Latency.", "field", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe("vin", value)
+    lines = list(histogram.render())[2:]
+    assert lines == [
+        'car_insurance_latency_seconds_bucket{field="vin",le="0.1"} 1',
+        'car_insurance_latency_seconds_bucket{field="vin",le="1"} 2',
+        'car_insurance_latency_seconds_bucket{field="vin",le="+Inf"} 3',
+        'car_insurance_latency_seconds_sum{field="vin"} 5.55',
+        'car_insurance_latency_seconds_count{field="vin"} 3',
+    ], f"Unexpected histogram lines: {lines}."
+
+
+def test_disabled_field_timings_record_nothing(monkeypatch):
+    """Test that no field is timed while timing is disabled."""
+    timings = FieldTimings()
+    monkeypatch.setattr("src.fake_data.FIELD_TIMINGS", timings)
+    generate_fake_data()
+    generate_insurance_batch(10)
+    assert list(timings.histogram.render())[2:] == [], "Disabled field timings should not record observations."
+
+
+def test_field_timings_of_a_record(field_timings_fx):
+    """Test that every field of a single record is timed once."""
+    generate_fake_data()
+    for field in RECORD_FIELDS:
+        assert field_timings_fx.histogram.count(field) == 1, f"Field '{field}' should have been timed once."
+        assert field_timings_fx.histogram.total(field) > 0, f"Field '{field}' should have a positive duration."
+
+
+def test_field_timings_of_a_batch(field_timings_fx):
+    """Test that every column of a batch is timed once per batch."""
+    generate_insurance_batch(50)
+    fields = {*RECORD_FIELDS[:7], "policy_period"}
+    for field in fields:
+        assert field_timings_fx.histogram.count(field) == 1, f"Column '{field}' should have been timed once."
+
+
+def test_render_metrics_is_prometheus_text():
+    """Test that the rendered metrics declare every metric family."""
+    text = render_metrics()
+    assert text.endswith("\n"), "The exposition format must end with a newline."
+    for name in ("requests_total", "records_generated_total", "field_duration_seconds"):
+        assert f"# TYPE car_insurance_{name} " in text, f"Metric '{name}' is missing: '{text}'."
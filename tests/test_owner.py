@@ -1,12 +1,25 @@
 """Module provides tests for owner part in fake car insurance data."""
 
-from datetime import datetime
+from datetime import date, datetime
 from re import match
 
 from dateutil.relativedelta import relativedelta
 from pytest import fail, fixture, mark, raises
 
-from src.owner import generate_address, generate_birthdate, generate_first_name, generate_last_name, generate_phone
+from src.owner import (
+    PHONE_PREFIXES,
+    generate_address,
+    generate_address_batch,
+    generate_birthdate,
+    generate_birthdate_batch,
+    generate_first_name,
+    generate_first_name_batch,
+    generate_last_name,
+    generate_last_name_batch,
+    generate_phone,
+    generate_phone_batch,
+)
+from src.singleton import FakerSingleton
 
 
 @fixture
@@ -318,3 +331,106 @@ def test_generate_phone_format(phone_fx):
     """Test that the generated phone number matches the format +48 xxx xxx xxx using a regular expression."""
     phone_regex = r"^\+48\s\d{3}\s\d{3}\s\d{3}$"
     assert match(phone_regex, phone_fx), f"Phone number '{phone_fx}' does not match the format '+48 xxx xxx xxx'."
+
+
+def test_generate_owner_batches_size():
+    """Test that every owner batch function returns the requested number of non-empty strings."""
+    for batch_function in (
+        generate_first_name_batch,
+        generate_last_name_batch,
+        generate_birthdate_batch,
+        generate_address_batch,
+        generate_phone_batch,
+    ):
+        batch = batch_function(30)
+        assert len(batch) == 30, f"'{batch_function.__name__}' returned '{len(batch)}' values instead of '30'."
+        assert all(isinstance(value, str) and value for value in batch), (
+            f"'{batch_function.__name__}' returned an empty or non-string value."
+        )
+
+
+def test_generate_phone_batch_format():
+    """Test that every phone number of a batch matches the format +48 xxx xxx xxx with a valid prefix."""
+    phone_regex = r"^\+48\s\d{3}\s[1-9]\d{2}\s[1-9]\d{2}$"
+    for phone_number in generate_phone_batch(200):
+        assert match(phone_regex, phone_number), f"Phone number '{phone_number}' does not match the format."
+        assert phone_number[4:6] in PHONE_PREFIXES, f"Phone number '{phone_number}' has an invalid prefix."
+
+
+def test_generate_birthdate_batch_age_range():
+    """Test that every birthdate of a batch corresponds to the specified age range."""
+    today = datetime.today()
+    for birth_date in generate_birthdate_batch(100, minimum_age=20, maximum_age=30):
+        age = relativedelta(today, datetime.strptime(birth_date, "%m/%d/%Y")).years
+        assert 20 <= age <= 30, f"Generated age '{age}' is not in the range '20-30'. Birth date: '{birth_date}'."
+
+
+def test_generate_birthdate_batch_window_boundaries():
+    """Test that batch birthdates cover exactly the age window, including both boundary days."""
+    birth_dates = {
+        datetime.strptime(birth_date, "%m/%d/%Y").date()
+        for birth_date in generate_birthdate_batch(20_000, minimum_age=0, maximum_age=0, as_of=date(2024, 2, 29))
+    }
+    assert min(birth_dates) == date(2023, 3, 1), f"Unexpected earliest birthdate: '{min(birth_dates)}'."
+    assert max(birth_dates) == date(2024, 2, 29), f"Unexpected latest birthdate: '{max(birth_dates)}'."
+
+
+def test_seeded_birthdate_batch_depends_on_as_of():
+    """Test that a seeded batch repeats its birthdates for the same as_of and moves them with as_of."""
+
+    def seeded_batch(as_of):
+        with FakerSingleton.seeded(9):
+            return generate_birthdate_batch(50, as_of=as_of)
+
+    assert seeded_batch(date(2026, 1, 1)) == seeded_batch(date(2026, 1, 1)), "The same as_of should repeat the batch."
+    assert seeded_batch(date(2026, 1, 1)) != seeded_batch(date(2026, 1, 2)), "Another as_of should move the batch."
+
+
+@mark.parametrize(
+    "minimum_age, maximum_age, exception",
+    [
+        (-1, 63, ValueError),
+        (100, 50, ValueError),
+        ("one", 63, TypeError),
+        (18.5, 63, TypeError),
+    ],
+)
+def test_generate_birthdate_batch_invalid_range(minimum_age, maximum_age, exception):
+    """Test that generate_birthdate_batch validates the age range.
+
+    :param minimum_age: The minimum age to test.
+    :param maximum_age: The maximum age to test.
+    :param exception: The expected exception type.
+    """
+    with raises(exception):
+        generate_birthdate_batch(10, minimum_age=minimum_age, maximum_age=maximum_age)
+
+
+@mark.parametrize(
+    "locale, phone_regex",
+    [
+        ("pl_PL", r"^\+48 \d{3} [1-9]\d{2} [1-9]\d{2}$"),
+        ("en_US", r"^\+1 \d{3} [1-9]\d{2} [1-9]\d{3}$"),
+        ("en_GB", r"^\+44 7\d{3} [1-9]\d{5}$"),
+        ("de_DE", r"^\+49 1\d{2} [1-9]\d{7}$"),
+        ("fr_FR", r"^\+33 [67] [1-9]\d [1-9]\d [1-9]\d [1-9]\d$"),
+        ("nl_NL", r"^\+31 6 [1-9]\d{7}$"),
+    ],
+)
+def test_generate_phone_locale_format(locale, phone_regex):
+    """Test that single and batch phone numbers of a locale match the locale's format."""
+    for phone_number in [generate_phone(locale), *generate_phone_batch(100, locale)]:
+        assert match(phone_regex, phone_number), f"Phone number '{phone_number}' does not match the '{locale}' format."
+
+
+@mark.parametrize("pooled", [False, True])
+def test_generate_owner_batches_locale(pooled):
+    """Test that names and addresses are generated by the instance of the requested locale."""
+    first_names = set(generate_first_name_batch(200, pooled, "pl_PL"))
+    last_names = set(generate_last_name_batch(200, pooled, "pl_PL"))
+    addresses = generate_address_batch(50, pooled, "pl_PL")
+    assert len(first_names) > 20, f"Polish first names should be varied, but got {sorted(first_names)}."
+    assert len(last_names) > 20, f"Polish last names should be varied, but got {sorted(last_names)}."
+    assert all(match(r".*\d{2}-\d{3} ", address) for address in addresses), (
+        f"Addresses should have Polish postcodes, e.g. '{addresses[0]}'."
+    )
@@ -0,0 +1,75 @@
+"""Module provides tests for reproducible generation across a process pool."""
+
+from json import loads
+
+from pytest import mark, raises
+
+from src.parallel import derive_seed, generate_fake_data_parallel, iter_shards, main
+
+
+def test_derive_seed_is_deterministic():
+    """Test that the same run seed and shard index always derive the same shard seed."""
+    assert derive_seed(42, 3) == derive_seed(42, 3), "Derived seeds should be deterministic."
+
+
+def test_derive_seed_is_distinct():
+    """Test that different shards and different runs derive different seeds."""
+    seeds = {derive_seed(seed, shard_index) for seed in range(5) for shard_index in range(20)}
+    assert len(seeds) == 100, f"Expected '100' distinct derived seeds, but got '{len(seeds)}'."
+
+
+@mark.parametrize(
+    "count, shard_size, expected_sizes",
+    [
+        (10, 10, [10]),
+        (25, 10, [10, 10, 5]),
+        (3, 1, [1, 1, 1]),
+    ],
+)
+def test_iter_shards_sizes(count, shard_size, expected_sizes):
+    """Test that the shards cover exactly the requested number of records.
+
+    :param count: The total number of records in the run.
+    :param shard_size: The number of records in a single shard.
+    :param expected_sizes: The expected sizes of the shards.
+    """
+    sizes = [size for size, _ in iter_shards(count, seed=1, shard_size=shard_size)]
+    assert sizes == expected_sizes, f"Expected shard sizes '{expected_sizes}', but got '{sizes}'."
+
+
+def test_generate_fake_data_parallel_is_independent_of_workers():
+    """Test that a seeded run produces identical data with one worker and with several workers."""
+    single = [record for shard in generate_fake_data_parallel(95, seed=7, workers=1, shard_size=10) for record in shard]
+    pooled = [record for shard in generate_fake_data_parallel(95, seed=7, workers=3, shard_size=10) for record in shard]
+    assert len(single) == 95, f"Expected '95' records, but got '{len(single)}'."
+    assert single == pooled, "Data generated with one worker differs from data generated with three workers."
+
+
+def test_generate_fake_data_parallel_depends_on_seed():
+    """Test that different seeds produce different data."""
+    first = next(generate_fake_data_parallel(10, seed=1))
+    second = next(generate_fake_data_parallel(10, seed=2))
+    assert first != second, "Different seeds should produce different data."
+
+
+@mark.parametrize("workers", [0, -2, 1.5])
+def test_generate_fake_data_parallel_invalid_workers(workers):
+    """Test that an invalid number of workers is rejected.
+
+    :param workers: The invalid number of workers to test.
+    """
+    with raises(ValueError):
+        next(generate_fake_data_parallel(10, seed=1, workers=workers))
+
+
+def test_main_writes_reproducible_ndjson(capsysbinary):
+    """Test that the command line entry point writes the same NDJSON output for the same seed.
+
+    :param capsysbinary: Pytest fixture capturing binary standard output.
+    """
+    main(["--count", "15", "--seed", "3", "--shard-size", "4"])
+    first = capsysbinary.readouterr().out
+    main(["--count", "15", "--seed", "3", "--shard-size", "4", "--workers", "2"])
+    second = capsysbinary.readouterr().out
+    assert first == second, "Command line output differs between runs with the same seed."
+    assert len([loads(line) for line in first.splitlines()]) == 15, "Expected '15' NDJSON records."
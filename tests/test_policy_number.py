@@ -4,7 +4,7 @@ from re import match
 
 from pytest import fixture
 
-from src.policy_number import generate_policy_number
+from src.policy_number import generate_policy_number, generate_policy_number_batch
 
 
 @fixture
@@ -72,3 +72,21 @@ def test_generate_policy_number_middle_digits(policy_number_fx):
     assert middle_digits.isdigit() and len(middle_digits) == 9, (
         f"Policy number middle digits mismatch. Actual: '{middle_digits}', Expected: 9 digits."
     )
+
+
+def test_generate_policy_number_batch_format():
+    """Test that every policy number of a batch matches the required format."""
+    pattern = r"^PL[1-9]\d{8}[A-Z]{2}$"
+    batch = generate_policy_number_batch(200)
+    assert len(batch) == 200, f"Expected '200' policy numbers, but got '{len(batch)}'."
+    for policy_number in batch:
+        assert match(pattern, policy_number), f"Policy number format mismatch. Actual: '{policy_number}'."
+
+
+def test_generate_policy_number_locale_prefix():
+    """Test that the policy number prefix is the region of the requested locale."""
+    assert match(r"^DE[1-9]\d{8}[A-Z]{2}$", generate_policy_number("de_DE")), "Single policy number prefix mismatch."
+    batch = generate_policy_number_batch(50, locale="fr_FR")
+    assert all(match(r"^FR[1-9]\d{8}[A-Z]{2}$", policy_number) for policy_number in batch), (
+        f"Batch policy number prefix mismatch, e.g. '{batch[0]}'."
+    )
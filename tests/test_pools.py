@@ -0,0 +1,101 @@
+"""Module provides tests for precomputed value pools."""
+
+from random import Random
+
+from faker import Faker
+from pytest import fixture, mark, raises
+
+from src.owner import generate_address_batch, generate_first_name_batch, generate_last_name_batch
+from src.pools import ValuePool, get_pool
+
+
+def seeded_random(seed: int) -> Random:
+    """Create a seeded random generator.
+
+    :param seed: The seed value.
+    :return: The random generator of a seeded Faker instance.
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    return fake.random
+
+
+@fixture
+def rng_fx() -> Random:
+    """Fixture to create a seeded random generator.
+
+    :return: A seeded random generator.
+    """
+    return seeded_random(1)
+
+
+def test_value_pool_sample_size(rng_fx):
+    """Test that a pool returns the requested number of values from the pool.
+
+    :param rng_fx: The seeded random generator from the fixture.
+    """
+    pool = ValuePool(["a", "b", "c"])
+    sample = pool.sample(rng_fx, 50)
+    assert len(sample) == 50, f"Expected '50' values, but got '{len(sample)}'."
+    assert set(sample) <= {"a", "b", "c"}, f"Sample contains values outside the pool: '{set(sample)}'."
+
+
+def test_value_pool_sample_weights(rng_fx):
+    """Test that a weighted pool never draws values with zero weight.
+
+    :param rng_fx: The seeded random generator from the fixture.
+    """
+    pool = ValuePool(["a", "b"], [1.0, 0.0])
+    assert set(pool.sample(rng_fx, 100)) == {"a"}, "Values with zero weight should never be drawn."
+
+
+def test_value_pool_sample_is_reproducible():
+    """Test that the same random state draws the same values."""
+    pool = ValuePool([str(number) for number in range(1000)])
+    assert pool.sample(seeded_random(3), 20) == pool.sample(seeded_random(3), 20), (
+        "Samples with the same seed should be equal."
+    )
+
+
+@mark.parametrize("field", ["first_name", "last_name", "address"])
+def test_get_pool_is_cached(field):
+    """Test that every pool is built once and then reused.
+
+    :param field: The name of the field.
+    """
+    pool = get_pool(field)
+    assert len(pool) > 0, f"Pool of '{field}' should not be empty."
+    assert get_pool(field) is pool, f"Pool of '{field}' should be built only once."
+
+
+def test_get_pool_unknown_field():
+    """Test that requesting a pool of an unknown field raises ValueError."""
+    with raises(ValueError):
+        get_pool("vin")
+
+
+def test_address_pool_format():
+    """Test that pooled addresses are formatted like addresses generated per row."""
+    for address in get_pool("address").values[:100]:
+        assert "\n" not in address, f"Address '{address}' should not contain newlines."
+        assert len(address.split()[-1]) == 5, f"Address '{address}' should end with a 5-digit zip code."
+
+
+@mark.parametrize(
+    "batch_function, field",
+    [
+        (generate_first_name_batch, "first_name"),
+        (generate_last_name_batch, "last_name"),
+        (generate_address_batch, "address"),
+    ],
+)
+def test_pooled_owner_batches(batch_function, field):
+    """Test that pooled owner batches only contain values from the pools.
+
+    :param batch_function: The batch function of the owner field.
+    :param field: The name of the field.
+    """
+    values = set(get_pool(field).values)
+    batch = batch_function(200, pooled=True)
+    assert len(batch) == 200, f"Expected '200' values, but got '{len(batch)}'."
+    assert set(batch) <= values, f"Pooled batch of '{field}' contains values outside the pool."
@@ -0,0 +1,67 @@
+"""Module provides tests for the compact representations of fake car insurance data."""
+
+from pydantic import ValidationError
+from pytest import fail, fixture
+
+from src.fake_data import generate_insurance_batch
+from src.record import InsuranceBatch, InsuranceRecord
+from tests.test_generate_fake_data import FakeDataModel
+
+
+@fixture
+def batch_fx() -> InsuranceBatch:
+    """Fixture to generate a batch of fake car insurance data.
+
+    :return: An InsuranceBatch with 10 records.
+    """
+    return generate_insurance_batch(10)
+
+
+def test_insurance_record_is_compact():
+    """Test that a record is a plain tuple without a per-instance dictionary."""
+    record = InsuranceRecord(*"abcdefghi")
+    assert isinstance(record, tuple), "InsuranceRecord should be a tuple."
+    assert not hasattr(record, "__dict__"), "InsuranceRecord should not have a per-instance dictionary."
+
+
+def test_insurance_record_to_dict():
+    """Test that a record converts into the nested structure returned by the API."""
+    record = InsuranceRecord(*"abcdefghi")
+    assert record.to_dict() == {
+        "policy_number": "a",
+        "owner": {"first_name": "b", "last_name": "c", "birth_date": "d", "address": "e", "phone": "f"},
+        "car": {"vin": "g"},
+        "insurance": {"start_date": "h", "end_date": "i"},
+    }, f"Unexpected nested record: '{record.to_dict()}'."
+
+
+def test_insurance_batch_is_slotted(batch_fx):
+    """Test that a batch has no per-instance dictionary.
+
+    :param batch_fx: The batch from the fixture.
+    """
+    assert not hasattr(batch_fx, "__dict__"), "InsuranceBatch should not have a per-instance dictionary."
+
+
+def test_insurance_batch_access(batch_fx):
+    """Test that rows, records and columns of a batch agree with each other.
+
+    :param batch_fx: The batch from the fixture.
+    """
+    assert len(batch_fx) == 10, f"Expected '10' records, but got '{len(batch_fx)}'."
+    records = list(batch_fx)
+    assert records[3] == batch_fx[3], "Indexing and iteration should return the same record."
+    assert [tuple(record) for record in records] == list(batch_fx.rows()), "Rows should match the records."
+    assert batch_fx.columns()[6] == [record.vin for record in records], "Columns should match the records."
+
+
+def test_insurance_batch_to_dicts(batch_fx):
+    """Test that a batch converts into records matching the defined pydantic model.
+
+    :param batch_fx: The batch from the fixture.
+    """
+    try:
+        for record in batch_fx.to_dicts():
+            FakeDataModel(**record)
+    except ValidationError as e:
+        fail(f"Pydantic validation failed for FakeDataModel: '{e}'.")
@@ -0,0 +1,178 @@
+"""Module provides tests for relational generation of linked tables."""
+
+import csv
+from collections import Counter
+from datetime import date
+
+from pytest import fixture, mark, raises
+
+from src.insurance import POLICY_TERM_DAYS
+from src.relational import (
+    TABLE_COLUMNS,
+    RelationalGenerator,
+    iter_relational_batches,
+    main,
+    parse_cardinality,
+)
+from src.unique import UniqueKeys
+
+AS_OF = date(2026, 1, 1)
+
+
+def _ordinal(text: str) -> int:
+    """Convert a date in MM/DD/YYYY format into its ordinal.
+
+    :param text: A string representing a date in MM/DD/YYYY format.
+    :return: The ordinal of the date.
+    """
+    return date(int(text[6:10]), int(text[0:2]), int(text[3:5])).toordinal()
+
+
+@fixture(name="batches_fx")
+def batches_fixture():
+    """Fixture generating linked tables for 250 owners in batches of 100.
+
+    :return: A list of RelationalBatch.
+    """
+    generator = RelationalGenerator(as_of=AS_OF, unique=UniqueKeys(vin_capacity=10_000))
+    return list(iter_relational_batches(250, batch_size=100, seed=3, generator=generator))
+
+
+def _column(batches, table, name):
+    """Concatenate a column of a table over all batches.
+
+    :param batches: The batches.
+    :param table: The name of the table.
+    :param name: The name of the column.
+    :return: A list of values.
+    """
+    return [value for batch in batches for value in getattr(batch, table)[name]]
+
+
+def test_keys_are_assigned_from_counters(batches_fx):
+    """Test that the primary keys of every table are consecutive across batches."""
+    assert [len(batch.owners["owner_id"]) for batch in batches_fx] == [100, 100, 50], "Unexpected batch sizes."
+    for table, columns in TABLE_COLUMNS.items():
+        keys = _column(batches_fx, table, columns[0])
+        assert keys == list(range(1, len(keys) + 1)), f"Keys of '{table}' should be consecutive."
+
+
+def test_foreign_keys_are_consistent(batches_fx):
+    """Test that every foreign key references an existing parent row of the same batch."""
+    for batch in batches_fx:
+        owners = set(batch.owners["owner_id"])
+        car_owners = dict(zip(batch.cars["car_id"], batch.cars["owner_id"], strict=True))
+        policies = set(batch.policies["policy_id"])
+        assert set(car_owners.values()) <= owners, "Every car should belong to an owner of the batch."
+        assert set(batch.cars["owner_id"]) == owners, "Every owner should have at least one car."
+        for car_id, owner_id in zip(batch.policies["car_id"], batch.policies["owner_id"], strict=True):
+            assert car_owners[car_id] == owner_id, "A policy should be owned by the owner of its car."
+        assert set(batch.claims["policy_id"]) <= policies, "Every claim should reference a policy of the batch."
+
+
+def test_policies_and_claims_dates(batches_fx):
+    """Test that the policies of a car are consecutive terms and claims fall within a term before as_of."""
+    policies = {}
+    for batch in batches_fx:
+        for policy_id, car_id, _, _, start, end in batch.rows("policies"):
+            assert _ordinal(end) - _ordinal(start) == POLICY_TERM_DAYS, f"Unexpected term: '{start}'-'{end}'."
+            policies[policy_id] = (car_id, _ordinal(start))
+    latest = {}
+    for car_id, start in sorted(policies.values()):
+        if car_id in latest:
+            assert start - latest[car_id] == POLICY_TERM_DAYS, "The policies of a car should be consecutive."
+        latest[car_id] = start
+    for start in latest.values():
+        assert start <= AS_OF.toordinal() < start + POLICY_TERM_DAYS, "The latest policy should be active."
+    for batch in batches_fx:
+        for _, policy_id, claim_date, _ in batch.rows("claims"):
+            start = policies[policy_id][1]
+            assert start <= _ordinal(claim_date) <= min(start + POLICY_TERM_DAYS - 1, AS_OF.toordinal()), (
+                f"Claim date '{claim_date}' is outside its policy term or after as_of."
+            )
+
+
+def test_keys_are_unique(batches_fx):
+    """Test that policy numbers and VINs are unique across batches with a uniqueness state."""
+    for table, name in (("policies", "policy_number"), ("cars", "vin")):
+        values = _column(batches_fx, table, name)
+        assert len(set(values)) == len(values), f"Values of '{table}.{name}' should be unique."
+
+
+def test_cardinality_distributions():
+    """Test that the numbers of children follow the configured distributions."""
+    generator = RelationalGenerator({2: 1}, {1: 1, 3: 0}, {0: 1}, pooled=True)
+    batch = generator.generate(40, seed=1)
+    assert Counter(Counter(batch.cars["owner_id"]).values()) == {2: 40}, "Every owner should have two cars."
+    assert len(batch.policies["policy_id"]) == 80, "Every car should have exactly one policy."
+    assert not batch.claims["claim_id"], "No policy should have claims."
+
+
+def test_generation_is_reproducible_with_seed():
+    """Test that the same seed produces the same tables."""
+    first = list(iter_relational_batches(30, batch_size=20, seed=9, generator=RelationalGenerator(as_of=AS_OF)))
+    second = list(iter_relational_batches(30, batch_size=20, seed=9, generator=RelationalGenerator(as_of=AS_OF)))
+    assert first == second, "The same seed should produce the same tables."
+
+
+@mark.parametrize(
+    ("cars", "policies", "claims"),
+    [({0: 1}, {1: 1}, {0: 1}), ({1: 1}, {}, {0: 1}), ({1: 1}, {1: 1}, {-1: 1}), ({1: 0}, {1: 1}, {0: 1})],
+)
+def test_invalid_cardinality(cars, policies, claims):
+    """Test that invalid cardinality distributions are rejected.
+
+    :param cars: The distribution of cars per owner.
+    :param policies: The distribution of policies per car.
+    :param claims: The distribution of claims per policy.
+    """
+    with raises(ValueError):
+        RelationalGenerator(cars, policies, claims)
+
+
+def test_parse_cardinality():
+    """Test that cardinality distributions are parsed from the command line format."""
+    assert parse_cardinality("1:60,2:30.5") == {1: 60.0, 2: 30.5}, "Unexpected parsed distribution."
+    with raises(ValueError):
+        parse_cardinality("1-60")
+
+
+@mark.parametrize("output_format", ["csv", "ndjson"])
+def test_main_writes_one_file_per_table(tmp_path, capsys, output_format):
+    """Test that the command line tool writes every table with matching row counts.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param capsys: Pytest fixture capturing standard error.
+    :param output_format: The output file format.
+    """
+    main(
+        ["--owners", "120", "--seed", "1", "--batch-size", "50", "--format", output_format, "--out-dir", str(tmp_path)]
+    )
+    for table, columns in TABLE_COLUMNS.items():
+        path = tmp_path / f"{table}.{output_format}"
+        if output_format == "csv":
+            with open(path, newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+            assert tuple(rows[0]) == columns, f"Unexpected header of '{table}': '{rows[0]}'."
+            if table == "owners":
+                assert len(rows) == 121, f"Expected '120' owners, but got '{len(rows) - 1}'."
+        else:
+            assert path.read_bytes().count(b"\n") >= (120 if table != "claims" else 0), f"'{table}' is too short."
+    assert "rows/s" in capsys.readouterr().err, "The tool should report the throughput."
+
+
+def test_main_sizes_vin_registry_for_cars(tmp_path, monkeypatch):
+    """Test that the command line tool sizes the VIN registry for the most cars the owners can have.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param monkeypatch: Pytest fixture recording the created uniqueness state.
+    """
+    created = []
+
+    def unique_keys(*args, **kwargs):
+        created.append(UniqueKeys(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr("src.relational.UniqueKeys", unique_keys)
+    main(["--owners", "40", "--cars-per-owner", "1:50,4:50", "--unique", "--format", "csv", "--out-dir", str(tmp_path)])
+    assert created[0].vins.capacity == 160, f"Unexpected VIN capacity: '{created[0].vins.capacity}'."
@@ -0,0 +1,151 @@
+"""Module provides tests for declarative record schemas and their generation plans."""
+
+import json
+import re
+from datetime import date
+
+from pytest import mark, raises
+
+from src.schema import DEFAULT_SCHEMA_PATH, compile_pattern, compile_schema, default_plan, load_plan
+from src.singleton import FakerSingleton
+from tests.test_generate_fake_data import FakeDataModel
+
+
+@mark.parametrize("pooled", [False, True])
+def test_default_plan_generates_valid_records(pooled):
+    """Test that the default schema produces records with the structure and formats of generate_fake_data().
+
+    :param pooled: Sample names and addresses of the sources from precomputed value pools.
+    """
+    records = default_plan().generate(500, pooled=pooled)
+    assert len(records) == 500, f"Expected '500' records, but got '{len(records)}'."
+    for record in records:
+        FakeDataModel(**record)
+        assert re.fullmatch(r"PL[1-9]\d{8}[A-Z]{2}", record["policy_number"]), (
+            f"Unexpected policy number: '{record['policy_number']}'."
+        )
+        assert re.fullmatch(r"\+48 \d{3} [1-9]\d{2} [1-9]\d{2}", record["owner"]["phone"]), (
+            f"Unexpected phone: '{record['owner']['phone']}'."
+        )
+
+
+def test_plan_is_reproducible_with_seed():
+    """Test that a seeded plan always generates the same records."""
+    plan = default_plan()
+    as_of = date(2026, 1, 1)
+    assert plan.generate(20, seed=5, as_of=as_of) == plan.generate(20, seed=5, as_of=as_of), "Should be reproducible."
+
+
+@mark.parametrize(
+    ("pattern", "regex"),
+    [
+        ("PL%########??", r"PL[1-9]\d{8}[A-Z]{2}"),
+        ("####################", r"\d{20}"),
+        ("??????-%", r"[A-Z]{6}-[1-9]"),
+        ("{red|green}/#", r"(red|green)/\d"),
+        (r"\{x\}\#{a|b}", r"\{x\}#[ab]"),
+        ("static", r"static"),
+    ],
+)
+def test_compile_pattern(pattern, regex):
+    """Test that compiled patterns generate values matching the mask.
+
+    :param pattern: The pattern mask.
+    :param regex: A regular expression matching every value of the mask.
+    """
+    compiled = compile_pattern(pattern)
+    with FakerSingleton.seeded(1):
+        values = compiled.generate(200)
+    for value in values:
+        assert re.fullmatch(regex, value), f"Value '{value}' does not match pattern '{pattern}'."
+
+
+@mark.parametrize("pattern", ["{a|b", "abc\\"])
+def test_compile_invalid_pattern(pattern):
+    """Test that malformed patterns are rejected.
+
+    :param pattern: The pattern mask.
+    """
+    with raises(ValueError):
+        compile_pattern(pattern)
+
+
+def test_custom_schema(tmp_path):
+    """Test that a schema file can add fields, nest them and use a locale without code changes."""
+    schema = {
+        "locale": "de_DE",
+        "fields": {
+            "id": {"pattern": "DE-%#####"},
+            "holder": {
+                "fields": {"name": {"source": "last_name"}, "contact": {"fields": {"phone": {"source": "phone"}}}}
+            },
+            "tier": {"choices": ["basic", "premium"], "weights": [1, 0]},
+        },
+    }
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    plan = load_plan(path)
+    assert plan.field_names == ["id", "holder.name", "holder.contact.phone", "tier"], "Unexpected fields."
+    for record in plan.generate(50):
+        assert list(record) == ["id", "holder", "tier"], f"Unexpected record layout: '{record}'."
+        assert re.fullmatch(r"DE-[1-9]\d{5}", record["id"]), f"Unexpected id: '{record['id']}'."
+        assert record["holder"]["contact"]["phone"].startswith("+49 "), "The locale should be passed to sources."
+        assert record["tier"] == "basic", "A choice of weight 0 should never be drawn."
+
+
+@mark.parametrize(
+    "schema",
+    [
+        {},
+        {"fields": {}},
+        {"fields": {"x": {"source": "unknown"}}},
+        {"fields": {"x": {"pattern": "#", "source": "vin"}}},
+        {"fields": {"x": {"choices": []}}},
+        {"fields": {"x": {"choices": ["a"], "weights": [1, 2]}}},
+        {"fields": {"x": "vin"}},
+        {"locale": "xx_XX", "fields": {"x": {"source": "vin"}}},
+    ],
+)
+def test_compile_invalid_schema(schema):
+    """Test that invalid schemas are rejected when compiled.
+
+    :param schema: The invalid schema.
+    """
+    with raises(ValueError):
+        compile_schema(schema)
+
+
+@mark.parametrize(
+    ("schema", "name", "key"),
+    [
+        ({"fields": {"x": {"source": "vin"}}, "locle": "de_DE"}, "<root>", "locle"),
+        ({"fields": {"owner": {"fields": {"x": {"source": "vin"}}, "optional": True}}}, "owner", "optional"),
+        ({"fields": {"x": {"source": "vin", "unique": True}}}, "x", "unique"),
+        ({"fields": {"x": {"choices": ["a"], "weight": [1]}}}, "x", "weight"),
+    ],
+)
+def test_compile_schema_rejects_unknown_keys(schema, name, key):
+    """Test that keys the schema format does not know, e.g. typos, are rejected by name.
+
+    :param schema: The schema with an unknown key.
+    :param name: The name of the object or field with the unknown key.
+    :param key: The unknown key.
+    """
+    with raises(ValueError, match=f"'{name}' has unknown keys '{key}'"):
+        compile_schema(schema)
+
+
+def test_default_schema_is_valid_json():
+    """Test that the default schema file ships with the package and compiles."""
+    schema = json.loads(DEFAULT_SCHEMA_PATH.read_text(encoding="utf-8"))
+    assert compile_schema(schema).field_names == default_plan().field_names, "The default plan should match."
+
+
+def test_toml_schema(tmp_path):
+    """Test that a schema can be written in TOML."""
+    path = tmp_path / "schema.toml"
+    path.write_text('[fields.policy]\npattern = "P-###"\n\n[fields.car.fields.vin]\nsource = "vin"\n', encoding="utf-8")
+    records = load_plan(path).generate(10)
+    for record in records:
+        assert re.fullmatch(r"P-\d{3}", record["policy"]), f"Unexpected policy: '{record['policy']}'."
+        assert len(record["car"]["vin"]) == 17, f"Unexpected VIN: '{record['car']['vin']}'."
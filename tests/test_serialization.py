@@ -0,0 +1,53 @@
+"""Module provides tests for fast JSON serialization of fake car insurance data."""
+
+from json import loads
+
+from pytest import fixture
+
+from src.fake_data import generate_insurance_batch
+from src.record import InsuranceBatch
+from src.serialization import FastJSONResponse, dumps, encode_batch, encode_ndjson
+
+
+@fixture
+def batch_fx() -> InsuranceBatch:
+    """Fixture to generate a batch of fake car insurance data.
+
+    :return: An InsuranceBatch with 5 records.
+    """
+    return generate_insurance_batch(5)
+
+
+def test_dumps_is_compact_json():
+    """Test that content is serialized into compact JSON bytes."""
+    content = {"policy_number": "PL123456789AB", "owner": {"last_name": "Łódź", "phone": "+48"}}
+    encoded = dumps(content)
+    assert isinstance(encoded, bytes), f"Expected bytes, but got '{type(encoded)}'."
+    assert b": " not in encoded and b", " not in encoded, f"JSON should be compact: '{encoded}'."
+    assert "Łódź".encode() in encoded, f"Non-ASCII characters should be encoded as UTF-8: '{encoded}'."
+    assert loads(encoded) == content, f"Unexpected JSON document: '{encoded}'."
+
+
+def test_encode_batch(batch_fx):
+    """Test that a batch is serialized into a JSON array of nested records.
+
+    :param batch_fx: The batch from the fixture.
+    """
+    assert loads(encode_batch(batch_fx)) == batch_fx.to_dicts(), "Unexpected JSON array."
+
+
+def test_encode_ndjson(batch_fx):
+    """Test that every record is encoded as one nested JSON document per line.
+
+    :param batch_fx: The batch from the fixture.
+    """
+    encoded = encode_ndjson(batch_fx)
+    assert encoded.endswith(b"\n"), "NDJSON output should end with a newline."
+    assert [loads(line) for line in encoded.splitlines()] == batch_fx.to_dicts(), f"Unexpected NDJSON: '{encoded}'."
+
+
+def test_fast_json_response_render():
+    """Test that the response serializes content and passes pre-encoded bytes through unchanged."""
+    assert FastJSONResponse({"a": [1, 2]}).body == b'{"a":[1,2]}', "Unexpected rendered content."
+    assert FastJSONResponse(b'[{"a":1}]').body == b'[{"a":1}]', "Pre-encoded content should not be changed."
+    assert FastJSONResponse({}).media_type == "application/json", "Unexpected media type."
@@ -1,6 +1,14 @@
 """There is test for Faker Singleton."""
 
-from src.singleton import FakerSingleton
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+
+from pytest import raises
+
+from src.singleton import FAKER_PROVIDERS, FakerSingleton
 
 
 def test_faker_singleton_instance():
@@ -8,3 +16,148 @@ def test_faker_singleton_instance():
     instance_one = FakerSingleton.get_instance()
     instance_two = FakerSingleton.get_instance()
     assert instance_one is instance_two, "FakerSingleton did not return the same instance."
+
+
+def test_faker_singleton_seeded():
+    """Test that a seeded block is reproducible and that the seed does not leak out of the block."""
+    with FakerSingleton.seeded(11) as fake:
+        first = [fake.random.random() for _ in range(5)]
+    with FakerSingleton.seeded(11) as fake:
+        second = [fake.random.random() for _ in range(5)]
+    after = [FakerSingleton.get_instance().random.random() for _ in range(5)]
+    assert first == second, "Seeded blocks with the same seed should produce the same values."
+    assert after != first, "Random state after a seeded block should not repeat the seeded values."
+
+
+def test_faker_singleton_instance_per_thread():
+    """Test that every thread gets its own instance of Faker."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = list(executor.map(lambda _: FakerSingleton.get_instance(), range(4)))
+    assert all(instance is not FakerSingleton.get_instance() for instance in instances), (
+        "Other threads should not share the instance of the calling thread."
+    )
+
+
+def test_faker_singleton_random_state_per_thread():
+    """Test that the instances of different threads, and of their locales, have their own random.Random."""
+    from faker.generator import random as shared_random
+
+    barrier = Barrier(4)
+
+    def randoms(_):
+        # Wait for the other tasks, so every task runs on its own thread
+        barrier.wait()
+        return FakerSingleton.get_instance().random, FakerSingleton.get_locale_instance("de_DE").random
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        states = [state for pair in executor.map(randoms, range(4)) for state in pair]
+    assert len({id(state) for state in states}) == 8, "Every instance should have its own random.Random."
+    assert all(state is not shared_random for state in states), "No instance should use Faker's shared random."
+
+
+def test_faker_singleton_proxy_forwards_to_thread_instance():
+    """Test that the proxy forwards attribute access to the instance of the calling thread."""
+    proxy = FakerSingleton.proxy()
+    assert proxy.random is FakerSingleton.get_instance().random, "Proxy should forward to the thread's instance."
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_random = executor.submit(lambda: proxy.random).result()
+    assert other_random is not proxy.random, "Proxy used on another thread should forward to that thread's instance."
+
+
+def test_faker_singleton_seeded_concurrently():
+    """Test that seeded blocks running concurrently on many threads do not disturb each other."""
+
+    def draw(seed: int) -> list[float]:
+        with FakerSingleton.seeded(seed) as fake:
+            return [fake.random.random() for _ in range(1000)]
+
+    expected = {seed: draw(seed) for seed in range(8)}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(draw, [seed for _ in range(10) for seed in range(8)]))
+    for index, result in enumerate(results):
+        assert result == expected[index % 8], f"Seeded block with seed '{index % 8}' was disturbed by other threads."
+
+
+def test_faker_singleton_loads_only_configured_providers():
+    """Test that new instances load only the providers the generators use."""
+    providers = {provider.__provider__ for provider in FakerSingleton.create_instance().providers}
+    assert providers == set(FAKER_PROVIDERS), f"Unexpected providers: {providers}."
+
+
+def test_faker_singleton_configure_all_providers():
+    """Test that configuring None loads all default providers into new instances."""
+    try:
+        FakerSingleton.configure(None)
+        instance = FakerSingleton.create_instance()
+    finally:
+        FakerSingleton.configure()
+    assert len(instance.providers) > len(FAKER_PROVIDERS), "All default providers should have been loaded."
+    assert instance.phone_number(), "A provider outside the minimal set should be available."
+
+
+def test_importing_the_api_does_not_import_faker():
+    """Test that Faker is imported on first use rather than when the API is imported."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", "import sys, main; print('faker' in sys.modules)"],
+        cwd=Path(__file__).resolve().parent.parent,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False", f"Importing main should not import faker: '{result.stdout}'."
+
+
+def test_faker_singleton_localized_restores_instance():
+    """Test that a localized block swaps in the locale instance and restores the previous one."""
+    default = FakerSingleton.get_instance()
+    with FakerSingleton.localized("de_DE") as localized:
+        assert FakerSingleton.get_instance() is localized, "The locale instance should be active in the block."
+        assert FakerSingleton.proxy().random is localized.random, "The proxy should forward to the locale instance."
+    assert FakerSingleton.get_instance() is default, "The previous instance should be restored after the block."
+    with FakerSingleton.localized(None) as unchanged:
+        assert unchanged is default, "A localized block without a locale should keep the current instance."
+
+
+def test_faker_singleton_locale_cache_keeps_recently_used():
+    """Test that locale instances are reused and that a recently used one survives eviction."""
+
+    def run() -> tuple[bool, bool]:
+        german = FakerSingleton.get_locale_instance("de_DE")
+        FakerSingleton.get_locale_instance("fr_FR")
+        reused = FakerSingleton.get_locale_instance("de_DE") is german
+        FakerSingleton.get_locale_instance("it_IT")
+        return reused, FakerSingleton.get_locale_instance("de_DE") is german
+
+    try:
+        FakerSingleton.configure(locale_cache_size=2)
+        # A fresh thread starts with an empty locale cache
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            reused, kept = executor.submit(run).result()
+    finally:
+        FakerSingleton.configure()
+    assert reused, "A cached locale instance should be reused."
+    assert kept, "The most recently used locale instance should not be evicted."
+
+
+def test_faker_singleton_locale_cache_eviction():
+    """Test that the least recently used locale instance is evicted once the cap is exceeded."""
+
+    def run() -> bool:
+        german = FakerSingleton.get_locale_instance("de_DE")
+        FakerSingleton.get_locale_instance("fr_FR")
+        FakerSingleton.get_locale_instance("it_IT")
+        return FakerSingleton.get_locale_instance("de_DE") is german
+
+    try:
+        FakerSingleton.configure(locale_cache_size=2)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            kept = executor.submit(run).result()
+    finally:
+        FakerSingleton.configure()
+    assert not kept, "The least recently used locale instance should have been evicted."
+
+
+def test_faker_singleton_configure_invalid_locale_cache_size():
+    """Test that a non-positive locale cache size raises ValueError."""
+    with raises(ValueError):
+        FakerSingleton.configure(locale_cache_size=0)
@@ -0,0 +1,35 @@
+"""Module provides tests for streaming fake car insurance data."""
+
+from pytest import mark, raises
+
+from src.stream import iter_fake_data_chunks
+
+
+@mark.parametrize(
+    "count, chunk_size, expected_sizes",
+    [
+        (1, 10, [1]),
+        (10, 10, [10]),
+        (25, 10, [10, 10, 5]),
+        (7, 1, [1] * 7),
+    ],
+)
+def test_iter_fake_data_chunks_sizes(count, chunk_size, expected_sizes):
+    """Test that the chunks cover exactly the requested number of records.
+
+    :param count: The total number of records to generate.
+    :param chunk_size: The maximum number of records in a chunk.
+    :param expected_sizes: The expected sizes of the generated chunks.
+    """
+    sizes = [len(chunk) for chunk in iter_fake_data_chunks(count, chunk_size)]
+    assert sizes == expected_sizes, f"Expected chunk sizes '{expected_sizes}', but got '{sizes}'."
+
+
+@mark.parametrize("chunk_size", [0, -1, 1.5])
+def test_iter_fake_data_chunks_invalid_chunk_size(chunk_size):
+    """Test that an invalid chunk size is rejected.
+
+    :param chunk_size: The invalid chunk size to test.
+    """
+    with raises(ValueError):
+        next(iter_fake_data_chunks(10, chunk_size))
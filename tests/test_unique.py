@@ -0,0 +1,162 @@
+"""Module provides tests for the registries that keep policy numbers and VINs unique."""
+
+from pickle import dumps
+
+from pytest import fixture, mark, raises
+
+from src.car import generate_vin_batch
+from src.parallel import generate_fake_data_parallel
+from src.policy_number import MAX_POLICY_NUMBER_REDRAWS, generate_policy_number_batch
+from src.singleton import FakerSingleton
+from src.unique import Bitset, PolicyNumberRegistry, UniqueKeys, VinRegistry, bloom_filter_parameters
+
+
+@fixture
+def unique_keys_fx():
+    """Fixture to create a private uniqueness state.
+
+    :return: A UniqueKeys instance.
+    """
+    with UniqueKeys(vin_capacity=10_000) as unique_keys:
+        yield unique_keys
+
+
+@mark.parametrize("shared", [False, True])
+def test_bitset_add(shared):
+    """Test that only the added bits of a bitset are set.
+
+    :param shared: Whether the bitset lives in shared memory.
+    """
+    bitset = Bitset(100, shared=shared)
+    bitset.add(3)
+    bitset.add(64)
+    assert [index for index in range(100) if index in bitset] == [3, 64], "Unexpected bits are set."
+    bitset.close(unlink=True)
+
+
+def test_bitset_attach_shares_bits():
+    """Test that a bitset attached by name sees the bits set through the original bitset."""
+    original = Bitset(1000, shared=True)
+    attached = Bitset(1000, name=original.name)
+    original.add(999)
+    assert 999 in attached, "Attached bitset does not see the bits of the original bitset."
+    attached.close()
+    original.close(unlink=True)
+
+
+def test_policy_number_registry_claim():
+    """Test that the policy number registry rejects numbers claimed before or repeated within a batch."""
+    registry = PolicyNumberRegistry()
+    assert registry.claim([123456789, 987654321, 123456789]) == [123456789, 987654321], "Unexpected first claim."
+    assert registry.claim([987654321, 100000000, 999999999]) == [100000000, 999999999], "Unexpected second claim."
+
+
+def test_policy_number_registry_check_and_add():
+    """Test that the policy number registry flags numbers added before or repeated within a batch."""
+    registry = PolicyNumberRegistry()
+    assert registry.check_and_add([123456789, 987654321, 123456789]) == [False, False, True], "Unexpected flags."
+    assert registry.check_and_add([987654321, 100000000]) == [True, False], "Unexpected flags of the second batch."
+
+
+def test_vin_registry_claim():
+    """Test that the VIN registry rejects VINs claimed before or repeated within a batch."""
+    registry = VinRegistry(capacity=1000)
+    vins = ["1M8GDM9AXKP042788", "11111111111111111", "1M8GDM9AXKP042788"]
+    assert registry.claim(vins) == vins[:2], "Unexpected first claim."
+    assert registry.claim(["11111111111111111", "1HGCM82633A004352"]) == ["1HGCM82633A004352"], (
+        "Unexpected second claim."
+    )
+
+
+def test_bloom_filter_parameters():
+    """Test that the Bloom filter of 10M VINs takes about 24 MB with 13 hash functions."""
+    size, hashes = bloom_filter_parameters(10_000_000, 1e-4)
+    assert 23_900_000 < size / 8 < 24_000_000, f"Unexpected Bloom filter size: '{size / 8}' bytes."
+    assert hashes == 13, f"Unexpected number of hash functions: '{hashes}'."
+
+
+@mark.parametrize("capacity", [0, -1, 1.5])
+def test_bloom_filter_parameters_invalid_capacity(capacity):
+    """Test that an invalid capacity is rejected.
+
+    :param capacity: The invalid capacity to test.
+    """
+    with raises(ValueError):
+        bloom_filter_parameters(capacity, 1e-4)
+
+
+def test_policy_number_batch_redraws_collisions(unique_keys_fx):
+    """Test that policy numbers colliding with claimed ones are redrawn.
+
+    :param unique_keys_fx: The uniqueness state from the fixture.
+    """
+    with FakerSingleton.seeded(21):
+        first = generate_policy_number_batch(500, unique_keys_fx.policy_numbers)
+    with FakerSingleton.seeded(21):
+        second = generate_policy_number_batch(500, unique_keys_fx.policy_numbers)
+    assert len(second) == 500, f"Expected '500' policy numbers, but got '{len(second)}'."
+    assert not set(first) & set(second), "Redrawn policy numbers collide with claimed ones."
+
+
+def test_policy_number_batch_rejects_exhausted_registry():
+    """Test that a registry rejecting every number fails after the redraw limit instead of spinning."""
+
+    class ExhaustedRegistry(PolicyNumberRegistry):
+        """Registry whose every number has been claimed."""
+
+        def __init__(self):
+            self.redraws = -1
+
+        def claim(self, numbers):
+            self.redraws += 1
+            return []
+
+    registry = ExhaustedRegistry()
+    with raises(RuntimeError, match="exhausted"):
+        generate_policy_number_batch(10, registry)
+    assert registry.redraws == MAX_POLICY_NUMBER_REDRAWS, f"Unexpected number of redraws: '{registry.redraws}'."
+
+
+def test_vin_batch_redraws_collisions(unique_keys_fx):
+    """Test that VINs colliding with claimed ones are redrawn.
+
+    :param unique_keys_fx: The uniqueness state from the fixture.
+    """
+    with FakerSingleton.seeded(21):
+        first = generate_vin_batch(500, registry=unique_keys_fx.vins)
+    with FakerSingleton.seeded(21):
+        second = generate_vin_batch(500, registry=unique_keys_fx.vins)
+    assert len(second) == 500, f"Expected '500' VINs, but got '{len(second)}'."
+    assert not set(first) & set(second), "Redrawn VINs collide with claimed ones."
+
+
+def test_vin_batch_rejects_saturated_registry():
+    """Test that drawing far more VINs than a registry is sized for fails instead of redrawing forever."""
+    registry = VinRegistry(capacity=10)
+    with raises(RuntimeError, match="saturated"):
+        generate_vin_batch(5000, registry=registry)
+
+
+def test_private_unique_keys_cannot_be_pickled(unique_keys_fx):
+    """Test that a private uniqueness state refuses to be passed to other processes.
+
+    :param unique_keys_fx: The uniqueness state from the fixture.
+    """
+    with raises(TypeError):
+        dumps(unique_keys_fx)
+
+
+@mark.parametrize("workers", [1, 2])
+def test_generate_fake_data_parallel_unique(workers):
+    """Test that a unique run produces unique policy numbers and VINs across all workers.
+
+    :param workers: The number of worker processes.
+    """
+    records = [
+        record
+        for shard in generate_fake_data_parallel(300, seed=4, workers=workers, shard_size=50, unique=True)
+        for record in shard
+    ]
+    assert len(records) == 300, f"Expected '300' records, but got '{len(records)}'."
+    assert len({record.policy_number for record in records}) == 300, "Policy numbers are not unique."
+    assert len({record.vin for record in records}) == 300, "VINs are not unique."
@@ -0,0 +1,201 @@
+"""Module provides tests for the bulk validator of exported datasets."""
+
+import csv
+from array import array
+
+from pytest import fixture, importorskip, mark, raises
+
+from src.export import COLUMNS
+from src.export import main as export
+from src.validate import FingerprintFilter, main, validate_dataset, vin_fingerprint
+
+
+def _export(tmp_path, file_format, count=300, extra=()):
+    """Export a seeded dataset.
+
+    :param tmp_path: The directory of the dataset.
+    :param file_format: The format of the dataset.
+    :param count: The number of records.
+    :param extra: Additional export arguments.
+    :return: The path of the dataset.
+    """
+    path = tmp_path / f"data.{file_format}"
+    export(["--count", str(count), "--format", file_format, "--out", str(path), "--seed", "5", "--unique", *extra])
+    return path
+
+
+@fixture(name="csv_rows_fx")
+def csv_rows_fixture(tmp_path):
+    """Fixture exporting a valid CSV dataset of 300 records.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :return: A tuple of the path of the dataset and its rows without the header.
+    """
+    path = _export(tmp_path, "csv")
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))[1:]
+    return path, rows
+
+
+def _write_csv(path, rows):
+    """Write rows to a CSV file with the exported header.
+
+    :param path: The path of the file.
+    :param rows: The rows.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+
+
+@mark.parametrize("file_format", ["csv", "ndjson", "parquet"])
+def test_exported_dataset_is_valid(tmp_path, file_format):
+    """Test that an exported dataset passes every check.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param file_format: The format of the dataset.
+    """
+    if file_format == "parquet":
+        importorskip("pyarrow")
+    path = _export(tmp_path, file_format, extra=("--locale", "pl_PL", "--locale", "de_DE", "--window-days", "30"))
+    report = validate_dataset(path, window_days=30, chunk_bytes=4096)
+    assert report.rows == 300, f"Expected '300' validated rows, but got '{report.rows}'."
+    assert report.valid, f"Unexpected violations: '{report.violations}'."
+
+
+@mark.parametrize("workers", [1, 2])
+def test_violations_are_reported_by_row(tmp_path, csv_rows_fx, workers):
+    """Test that broken records are reported with their row numbers across chunks.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param csv_rows_fx: Fixture providing an exported CSV dataset.
+    :param workers: The number of worker processes.
+    """
+    _, rows = csv_rows_fx
+    rows[9][0] = "XX123"
+    rows[99][6] = rows[99][6][:8] + ("0" if rows[99][6][8] != "0" else "1") + rows[99][6][9:]
+    rows[199][8] = "02/30/2026"
+    rows[249][1] = " "
+    path = tmp_path / "broken.csv"
+    _write_csv(path, rows)
+
+    report = validate_dataset(path, workers=workers, chunk_bytes=2048)
+    found = [(violation.row, violation.check) for violation in report.violations]
+    expected = [
+        (10, "policy_number_format"),
+        (100, "vin_check_digit"),
+        (200, "end_date_format"),
+        (250, "first_name_empty"),
+    ]
+    assert found == expected, f"Unexpected violations: '{found}'."
+    assert report.rows == 300, f"Expected '300' validated rows, but got '{report.rows}'."
+
+
+def test_duplicates_are_reported_with_first_row(tmp_path, csv_rows_fx):
+    """Test that repeated policy numbers and VINs are reported with the row of the first occurrence.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param csv_rows_fx: Fixture providing an exported CSV dataset.
+    """
+    _, rows = csv_rows_fx
+    rows[280][0] = rows[4][0]
+    rows[150][6] = rows[20][6]
+    rows[290][6] = rows[20][6]
+    path = tmp_path / "duplicates.csv"
+    _write_csv(path, rows)
+
+    report = validate_dataset(path, chunk_bytes=2048)
+    found = [(violation.row, violation.check, violation.message.split(":")[0]) for violation in report.violations]
+    expected = [
+        (151, "vin_unique", "duplicate of row 21"),
+        (281, "policy_number_unique", "duplicate of row 5"),
+        (291, "vin_unique", "duplicate of row 21"),
+    ]
+    assert found == expected, f"Unexpected duplicates: '{found}'."
+
+
+def test_malformed_lines_are_reported(tmp_path):
+    """Test that lines that are not records are reported and the other lines are still checked.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    """
+    path = _export(tmp_path, "ndjson", count=20)
+    lines = path.read_bytes().splitlines()
+    lines[2] = b'{"policy_number": "PL123"'
+    lines[5] = b"[]"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    report = validate_dataset(path)
+    found = [(violation.row, violation.check) for violation in report.violations]
+    assert found == [(3, "malformed_record"), (6, "malformed_record")], f"Unexpected violations: '{found}'."
+    assert report.rows == 20, f"Expected '20' validated rows, but got '{report.rows}'."
+
+
+def test_max_violations_limits_reported_violations(tmp_path, csv_rows_fx):
+    """Test that all violations are counted but only max_violations are reported in full.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param csv_rows_fx: Fixture providing an exported CSV dataset.
+    """
+    _, rows = csv_rows_fx
+    for row in rows:
+        row[5] = "123"
+    path = tmp_path / "phones.csv"
+    _write_csv(path, rows)
+
+    report = validate_dataset(path, max_violations=5, chunk_bytes=2048)
+    assert report.counts["phone_format"] == 300, f"Unexpected counts: '{report.counts}'."
+    assert [violation.row for violation in report.violations] == [1, 2, 3, 4, 5], "Unexpected reported violations."
+
+
+def test_invalid_csv_header(tmp_path):
+    """Test that a CSV file without the exported header is rejected.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    """
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    with raises(ValueError, match="header"):
+        validate_dataset(path)
+
+
+@mark.parametrize("name", ["data.txt", "data.json", "data.csv.gz", "data"])
+def test_unknown_extension_requires_format(tmp_path, name):
+    """Test that a file whose extension is not an exported format is rejected unless the format is given.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param name: The name of the file.
+    """
+    path = tmp_path / name
+    path.write_bytes(_export(tmp_path, "ndjson", count=10).read_bytes())
+    with raises(ValueError, match="Unsupported dataset format"):
+        validate_dataset(path)
+    assert validate_dataset(path, "ndjson").valid, "An explicit format should override the extension."
+
+
+def test_fingerprint_filter_flags_repeats():
+    """Test that the fingerprint filter flags fingerprints added before, also within a batch."""
+    fingerprints = array("Q", map(vin_fingerprint, ["1M8GDM9AXKP042788", "1HGCM82633A004352"]))
+    fingerprint_filter = FingerprintFilter(capacity=1000)
+    assert fingerprint_filter.check_and_add(fingerprints) == [], "New fingerprints should not be flagged."
+    repeated = array("Q", [fingerprints[1], 12345, 12345])
+    assert fingerprint_filter.check_and_add(repeated) == [fingerprints[1], 12345], "Repeats should be flagged."
+
+
+def test_main_exit_code(tmp_path, csv_rows_fx, capsys):
+    """Test that the command line validator returns 1 and prints the violations of an invalid dataset.
+
+    :param tmp_path: Pytest fixture providing a temporary directory.
+    :param csv_rows_fx: Fixture providing an exported CSV dataset.
+    :param capsys: Pytest fixture capturing standard output and error.
+    """
+    valid_path, rows = csv_rows_fx
+    assert main([str(valid_path)]) == 0, "A valid dataset should return exit code 0."
+    rows[0][3] = "13/01/2000"
+    path = tmp_path / "invalid.csv"
+    _write_csv(path, rows)
+    assert main([str(path)]) == 1, "An invalid dataset should return exit code 1."
+    captured = capsys.readouterr()
+    assert "row 1: birth_date_format" in captured.out, f"Unexpected output: '{captured.out}'."
+    assert "birth_date_format: 1 violations" in captured.err, f"Unexpected summary: '{captured.err}'."